@@ -5,27 +5,15 @@ import json
 from datetime import datetime, timedelta
 import logging
 
-# Import backend components
-try:
-    from backend.audio_manager import AudioManager
-    from backend.rag_engine import RAGEngine
-    from backend.news_fetcher import NewsFetcher
-    from backend.summarizer import NewsSummarizer
-    from backend.fact_checker import FactChecker
-    from components.news_player import NewsPlayer
-except ImportError as e:
-    st.error(f"Error importing backend components: {e}")
-    st.info("Please ensure all backend components are properly installed.")
+from backend.logging_setup import configure_logging
+from components.bookmarks import add_bookmark, bookmark_count, get_bookmark_store, get_user_id
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('echonews.log')
-    ]
-)
+# Backend components are imported inside their get_* factories below, so heavy
+# dependencies (torch, faiss, langchain) load on first use instead of before the
+# first paint.
+
+# Queue-backed logging: JSON lines to a rotating echonews.log, written off the script thread
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Page configuration
@@ -45,8 +33,8 @@ if 'user_question' not in st.session_state:
     st.session_state.user_question = ""
 if 'aspirant_mode' not in st.session_state:
     st.session_state.aspirant_mode = False
-if 'bookmarks' not in st.session_state:
-    st.session_state.bookmarks = []
+if 'bookmark_page' not in st.session_state:
+    st.session_state.bookmark_page = 0
 if 'current_language' not in st.session_state:
     st.session_state.current_language = "en"
 
@@ -54,6 +42,7 @@ if 'current_language' not in st.session_state:
 @st.cache_resource
 def get_audio_manager():
     try:
+        from backend.audio_manager import AudioManager
         return AudioManager()
     except Exception as e:
         st.error(f"Error initializing AudioManager: {e}")
@@ -62,6 +51,7 @@ def get_audio_manager():
 @st.cache_resource
 def get_rag_engine():
     try:
+        from backend.rag_engine import RAGEngine
         return RAGEngine()
     except Exception as e:
         st.error(f"Error initializing RAGEngine: {e}")
@@ -70,6 +60,7 @@ def get_rag_engine():
 @st.cache_resource
 def get_news_fetcher():
     try:
+        from backend.news_fetcher import NewsFetcher
         return NewsFetcher()
     except Exception as e:
         st.error(f"Error initializing NewsFetcher: {e}")
@@ -78,6 +69,7 @@ def get_news_fetcher():
 @st.cache_resource
 def get_summarizer():
     try:
+        from backend.summarizer import NewsSummarizer
         return NewsSummarizer()
     except Exception as e:
         st.error(f"Error initializing NewsSummarizer: {e}")
@@ -86,6 +78,7 @@ def get_summarizer():
 @st.cache_resource
 def get_fact_checker():
     try:
+        from backend.fact_checker import FactChecker
         return FactChecker()
     except Exception as e:
         st.error(f"Error initializing FactChecker: {e}")
@@ -94,6 +87,7 @@ def get_fact_checker():
 @st.cache_resource
 def get_news_player():
     try:
+        from components.news_player import NewsPlayer
         return NewsPlayer()
     except Exception as e:
         st.error(f"Error initializing NewsPlayer: {e}")
@@ -229,12 +223,19 @@ with st.sidebar:
         """, unsafe_allow_html=True)
     
     # Bookmarks
-    if st.session_state.bookmarks:
+    total_bookmarks = bookmark_count()
+    if total_bookmarks:
+        from backend.bookmark_store import page_count
         st.markdown("#### 🔖 Bookmarks")
-        for i, bookmark in enumerate(st.session_state.bookmarks):
-            if st.button(f"📌 {bookmark['title'][:30]}...", key=f"bookmark_{i}"):
+        pages = page_count(total_bookmarks)
+        page = min(st.session_state.bookmark_page, pages - 1)
+        for bookmark in get_bookmark_store().page(get_user_id(), page):
+            if st.button(f"📌 {bookmark['title'][:30]}...", key=f"sidebar_bookmark_{bookmark['bookmark_id']}"):
                 st.session_state.current_news = bookmark
                 st.rerun()
+        if pages > 1 and st.button(f"Next page ({page + 1}/{pages})", key="bookmarks_next"):
+            st.session_state.bookmark_page = (page + 1) % pages
+            st.rerun()
 
 # Main content
 tab1, tab2, tab3, tab4 = st.tabs(["📰 News", "🎧 Audio Player", "❓ Q&A", "📊 Aspirant Mode"])
@@ -269,8 +270,7 @@ with tab1:
                     
                     with col2:
                         if st.button("📌 Bookmark", key=f"bookmark_{i}"):
-                            if news not in st.session_state.bookmarks:
-                                st.session_state.bookmarks.append(news)
+                            if add_bookmark(news):
                                 st.success("News bookmarked!")
                     
                     with col3:
@@ -416,8 +416,7 @@ with tab4:
                         
                         with col2:
                             if st.button("📌 Bookmark", key=f"aspirant_bookmark_{i}"):
-                                if news not in st.session_state.bookmarks:
-                                    st.session_state.bookmarks.append(news)
+                                if add_bookmark(news):
                                     st.success("News bookmarked!")
             else:
                 st.info("No news available for the selected date.")
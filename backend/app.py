@@ -2,12 +2,33 @@ import streamlit as st
 import requests
 import re
 import os
-import time
-import tempfile
-from gtts import gTTS
-import speech_recognition as sr
+import sys
 from datetime import datetime
-import random
+
+# Make the repo root importable when run as `streamlit run backend/app.py`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.article import Article, compact_articles
+from backend.article_store import ArticleStore
+from backend.audio_cache import AudioCache
+from backend.audio_server import AUDIO_SERVER_ENABLED, AudioServer
+from backend.bookmark_store import page_count
+from backend.dedup import NearDuplicateIndex, dedupe
+from backend.logging_setup import configure_logging
+from backend.metrics import METRICS_ENABLED, REGISTRY, MetricsServer, stage_summary, timed
+from backend.news_client import NEWS_CACHE_TTL, fetch_concurrently, get_json
+from backend.podcast import PODCAST_MAX_AGE, PodcastRenderer
+from backend.prefetch import PREFETCH_ENABLED, REQUEST_BUDGET_PER_HOUR, PrefetchScheduler, RateBudget
+from backend.quiz import build_questions, daily_seed
+from backend.quiz_bank import QuizBank
+from backend.rag_engine import RAGEngine
+from backend.rerun_cost import begin_run, current_run, record
+from backend.text_normalizer import normalize_for_speech
+from backend.tts import get_tts_engine, stream_speech
+from components.bookmarks import add_bookmark, bookmark_count, get_bookmark_store, get_user_id, remove_bookmark
+
+# Queue-backed logging: JSON lines to a rotating echonews.log, written off the script thread
+configure_logging()
 
 # --- CONFIG ---
 st.set_page_config(
@@ -16,6 +37,8 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+# Counts network/TTS work done by this script run (shown in the footer)
+rerun_cost = begin_run()
 
 # --- CSS ---
 st.markdown("""
@@ -38,7 +61,7 @@ for key, default in {
     'audio_playing': False,
     'user_question': "",
     'aspirant_mode': False,
-    'bookmarks': [],
+    'bookmark_page': 0,
     'current_language': "en",
     'user_interests': [],
     'interests_set': False,
@@ -61,6 +84,7 @@ for key, default in {
     'quiz_show_result': False,
     'quiz_options': [],
     'quiz_active': False,
+    'news_refresh': 0,
 }.items():
     if key not in st.session_state:
         st.session_state[key] = default
@@ -84,79 +108,259 @@ AVAILABLE_TOPICS = {
 }
 
 # --- HELPERS ---
+@st.cache_resource
+def get_article_store():
+    return ArticleStore()
+
+@st.cache_resource
+def get_quiz_bank():
+    return QuizBank()
+
+@st.cache_resource
+def get_request_budget():
+    # Shared newsdata.io quota guard: every real request is charged, prefetching pauses when it runs dry
+    return RateBudget(REQUEST_BUDGET_PER_HOUR)
+
+def ingest_into_store(cursor):
+    # Runs only when a response really came from newsdata.io, not on cache hits
+    store = get_article_store()
+    budget = get_request_budget()
+    run = current_run()
+
+    def on_fetch(data):
+        budget.charge()
+        if run is not None:
+            run.add("http_requests")
+        return store.ingest(data.get("results", []), cursor=cursor)
+    return on_fetch
+
+def request_error_code(error):
+    response = getattr(error, "response", None)
+    return response.status_code if response is not None else type(error).__name__
+
+@timed("fetch_news")
 def fetch_news(topic):
     params = {'q': topic, 'language': 'en', 'apikey': NEWS_API_KEY, 'size': 3}
-    response = requests.get(NEWS_URL, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        articles = data.get("results", [])
-        if articles:
-            summary = "\n\n".join([f"🔹 {a.get('title', 'No title')} - {a.get('description', 'No description')}" for a in articles])
-            return summary, articles
-        return "No news found on this topic.", []
-    return f"Failed to fetch news. Error: {response.status_code}", []
+    try:
+        data = get_json(NEWS_URL, params, on_fetch=ingest_into_store(f"topic:{topic}"))
+    except requests.RequestException as e:
+        return f"Failed to fetch news. Error: {request_error_code(e)}", []
+    articles = data.get("results", [])
+    if articles:
+        summary = "\n\n".join([f"🔹 {a.get('title', 'No title')} - {a.get('description', 'No description')}" for a in articles])
+        return summary, compact_articles(articles)
+    return "No news found on this topic.", []
 
 def fetch_latest_news():
     params = {'language': 'en', 'apikey': NEWS_API_KEY, 'size': 5}
-    response = requests.get(LATEST_NEWS_URL, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        articles = data.get("results", [])
-        if articles:
-            summary = "\n\n".join([f"🔹 {a.get('title', 'No title')} - {a.get('description', 'No description')}" for a in articles])
-            return summary, articles
-        return "No latest news available.", []
-    return f"Failed to fetch latest news. Error: {response.status_code}", []
+    try:
+        data = get_json(LATEST_NEWS_URL, params, on_fetch=ingest_into_store("latest"))
+    except requests.RequestException as e:
+        return f"Failed to fetch latest news. Error: {request_error_code(e)}", []
+    articles = data.get("results", [])
+    if articles:
+        summary = "\n\n".join([f"🔹 {a.get('title', 'No title')} - {a.get('description', 'No description')}" for a in articles])
+        return summary, compact_articles(articles)
+    return "No latest news available.", []
+
+@st.cache_data(ttl=NEWS_CACHE_TTL, show_spinner=False)
+def load_latest_news(refresh_key):
+    # refresh_key is the explicit invalidation key: bump st.session_state.news_refresh to refetch
+    record("cache_misses")
+    return fetch_latest_news()
+
+def latest_news():
+    news, articles = load_latest_news(st.session_state.news_refresh)
+    if not articles:
+        # Don't pin an error or empty result for the whole TTL
+        load_latest_news.clear()
+    return news, articles
+
+@st.cache_data(ttl=NEWS_CACHE_TTL, show_spinner=False)
+def load_articles_for_date(day, refresh_key):
+    record("cache_misses")
+    return compact_articles(get_article_store().articles_for_date(day, limit=10))
+
+def articles_for_date(day):
+    articles = load_articles_for_date(day, st.session_state.news_refresh)
+    if not articles:
+        # Articles for the day may still be ingested; don't pin the empty result for the whole TTL
+        load_articles_for_date.clear()
+    return articles
+
+def fetch_topic_articles(topic, size=3, on_fetch=None):
+    # Same params as fetch_news so both share one cached/prefetched response
+    params = {'q': topic, 'language': 'en', 'apikey': NEWS_API_KEY, 'size': size}
+    return get_json(NEWS_URL, params, on_fetch=on_fetch).get("results", [])
 
 def fetch_latest_news_for_interests():
     if not st.session_state.user_interests:
         return "Please select your interests first to get personalized news.", []
     all_news = []
     all_articles = []
-    for topic in st.session_state.user_interests:
-        params = {'q': topic, 'language': 'en', 'apikey': NEWS_API_KEY, 'size': 2}
-        response = requests.get(NEWS_URL, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            articles = data.get("results", [])
-            if articles:
-                topic_news = f"\n📰 **{topic} News:**\n"
-                topic_news += "\n".join([f"🔹 {a.get('title', 'No title')} - {a.get('description', 'No description')}" for a in articles[:2]])
-                all_news.append(topic_news)
-                all_articles.extend(articles[:2])
+    topics = list(st.session_state.user_interests)
+    # Store hooks are resolved here because worker threads have no script context
+    hooks = {topic: ingest_into_store(f"topic:{topic}") for topic in topics}
+    # The same wire story is often filed under several topics; speak it only once
+    seen = NearDuplicateIndex()
+    # Topics are fetched in parallel; failed or late topics are left out
+    for topic, articles in fetch_concurrently(lambda topic: fetch_topic_articles(topic, on_fetch=hooks[topic]), topics):
+        articles = dedupe(articles, index=seen, limit=2)
+        if articles:
+            topic_news = f"\n📰 **{topic} News:**\n"
+            topic_news += "\n".join([f"🔹 {a.get('title', 'No title')} - {a.get('description', 'No description')}" for a in articles])
+            all_news.append(topic_news)
+            all_articles.extend(compact_articles(articles))
     if all_news:
         return "\n\n".join(all_news), all_articles
     return "No news found for your selected interests.", []
 
-def clean_text_for_tts(text):
-    text = re.sub(r'[^\w\s.,;:!?\'\"-]', '', text, flags=re.UNICODE)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
-def get_audio_bytes(text):
-    clean = clean_text_for_tts(text)
-    tts = gTTS(clean)
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as fp:
-        tts.save(fp.name)
-        with open(fp.name, "rb") as f:
-            audio_bytes = f.read()
-    os.remove(fp.name)
-    return audio_bytes
-
+def clean_text_for_tts(text, lang="en"):
+    # Single precompiled pass, memoized across reruns; expands numbers, dates and money for English
+    return normalize_for_speech(text, lang)
+
+@st.cache_resource
+def get_audio_cache():
+    # One cache per process, shared by every session
+    cache = AudioCache()
+    REGISTRY.register_cache("audio", cache.stats)
+    return cache
+
+@st.cache_resource
+def get_speech_engine():
+    # TTS_ENGINE=espeak switches to the offline engine
+    return get_tts_engine()
+
+def speech_source(lang="en"):
+    # Sentence chunks are synthesized in parallel and cached individually, so
+    # headlines shared between summaries are only synthesized once. Resolved on
+    # the script thread, so the audio server can run the returned source later
+    engine = get_speech_engine()
+    cache = get_audio_cache()
+    run = current_run()
+
+    def synthesize(chunk):
+        if run is not None:
+            run.add("tts_chunks")
+        return engine.synthesize(chunk, lang)
+    return lambda clean: stream_speech(clean, synthesize, cache=cache, lang=lang, voice=engine.voice_id)
+
+def stream_audio(clean, lang="en"):
+    return speech_source(lang)(clean)
+
+@timed("get_audio_bytes")
+def get_audio_bytes(text, lang="en"):
+    # Only the chunks are cached; the whole clip is assembled from them on demand
+    return b"".join(stream_audio(clean_text_for_tts(text, lang), lang))
+
+@st.cache_resource
+def get_audio_server():
+    # Browsers fetch clips straight from disk (with Range/ETag) instead of
+    # receiving base64 over the websocket on every rerun. Without AUDIO_BASE_URL
+    # there is no browser-reachable address, so audio is sent inline
+    if not AUDIO_SERVER_ENABLED:
+        return None
+    try:
+        return AudioServer(roots={"clips": get_audio_cache().cache_dir,
+                                  "podcasts": get_podcast_renderer().output_dir}).start()
+    except OSError as e:
+        st.warning(f"Audio server unavailable, sending audio inline: {e}")
+        return None
+
+@st.cache_resource
+def get_metrics_server():
+    # Prometheus scrapes METRICS_HOST:METRICS_PORT/metrics, whether or not audio is served over HTTP
+    if not METRICS_ENABLED:
+        return None
+    try:
+        return MetricsServer(REGISTRY).start()
+    except OSError as e:
+        st.warning(f"Metrics endpoint unavailable: {e}")
+        return None
+
+def get_audio_url(text, lang="en"):
+    server = get_audio_server()
+    if server is None:
+        return None
+    clean = clean_text_for_tts(text, lang)
+    key = get_audio_cache().make_key(clean, lang, get_speech_engine().voice_id)
+    source = speech_source(lang)
+    # The browser gets the chunks in order as they are ready, so time to first
+    # audio is one chunk's synthesis (or cache read) whatever the text length
+    return server.register_stream(key, lambda: source(clean))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def load_audio_url(text, lang="en"):
+    # Stream URL of the text; reruns skip normalization, hashing and registration
+    record("cache_misses")
+    return get_audio_url(text, lang)
+
+def play_audio(text, lang="en"):
+    # Without the audio server the clip goes inline, assembled from the chunk
+    # cache rather than kept a second time as a whole
+    st.audio(load_audio_url(text, lang) or get_audio_bytes(text, lang), format="audio/mp3")
+
+# Widgets inside a fragment rerun only the fragment, not the whole script
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda func: func)
+
+@fragment
 def audio_with_optional_text(text, key_prefix):
-    audio_bytes = get_audio_bytes(text)
-    st.audio(audio_bytes, format="audio/mp3")
+    play_audio(text)
     show_text = st.checkbox("Show Text", key=f"{key_prefix}_show_text")
     if show_text:
         st.markdown(f"<div class='news-card'>{text}</div>", unsafe_allow_html=True)
 
 def speak_text(text):
-    audio_bytes = get_audio_bytes(text)
     st.session_state.is_playing_audio = True
-    st.audio(audio_bytes, format="audio/mp3")
+    play_audio(text)
     st.session_state.is_playing_audio = False
 
+@st.cache_resource
+def get_podcast_renderer():
+    return PodcastRenderer(get_article_store(), get_speech_engine(), get_audio_cache())
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+@st.cache_resource
+def get_rag_engine():
+    try:
+        return RAGEngine(article_store=get_article_store())
+    except Exception as e:
+        st.error(f"Error initializing RAGEngine: {e}")
+        return None
+
+def answer_with_rag(question, news=None):
+    rag_engine = get_rag_engine()
+    if rag_engine is None:
+        return "Sorry, AI Q&A is not available right now."
+    if news:
+        return rag_engine.answer_question(question, news)
+    return rag_engine.answer_general_question(question)
+
+@st.cache_resource
+def start_prefetch_scheduler():
+    # Started once per process; keeps the response cache, article store and TTS cache warm
+    jobs = [("latest", fetch_latest_news)]
+    jobs += [(f"topic:{topic}", lambda topic=topic: fetch_news(topic)) for topic in AVAILABLE_TOPICS]
+
+    def warm_audio(name, result):
+        summary, articles = result
+        if articles:
+            get_audio_bytes(summary)
+
+    def index_new_articles():
+        rag_engine = get_rag_engine()
+        if rag_engine is not None:
+            rag_engine.refresh_index()
+
+    return PrefetchScheduler(jobs, budget=get_request_budget(), on_result=warm_audio,
+                             after_cycle=index_new_articles).start()
+
+@timed("listen_to_user")
 def listen_to_user():
+    import speech_recognition as sr  # only needed once someone uses the microphone
     recognizer = sr.Recognizer()
     with sr.Microphone() as source:
         st.markdown('<div class="status-listening">🎙️ Listening... Please speak.</div>', unsafe_allow_html=True)
@@ -199,53 +403,8 @@ def create_chat_bubble(content, is_ai=False):
         </div>
         """
 
-def extract_entity_simple(text):
-    words = re.findall(r'\b[A-Z][a-z]+\b', text)
-    numbers = re.findall(r'\b\d{4}\b', text)
-    if words:
-        return words[0]
-    if numbers:
-        return numbers[0]
-    months = re.findall(r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b', text)
-    if months:
-        return months[0]
-    return None
-
-def generate_quiz_from_articles(articles, num_questions=3):
-    questions = []
-    options = []
-    answers = []
-    entities = []
-    for art in articles:
-        title = art.get('title') or ''
-        desc = art.get('description') or ''
-        ent = extract_entity_simple(title + " " + desc)
-        entities.append(ent)
-    for i, art in enumerate(articles[:num_questions]):
-        title = art.get('title') or ''
-        desc = art.get('description') or ''
-        ent = extract_entity_simple(title + " " + desc)
-        if ent and ent in (desc or title):
-            q = f"<b>Which key person/place/number is mentioned in today's news?</b>"
-            correct = ent
-            distractors = [e for j, e in enumerate(entities) if e and j != i]
-            distractors = random.sample(distractors, min(3, len(distractors)))
-            opts = [correct] + distractors
-            random.shuffle(opts)
-            questions.append(q)
-            options.append(opts)
-            answers.append(correct)
-        else:
-            q = f"<b>What is the main topic of one of today's news items?</b>"
-            correct = title.split()[0] if title else "News"
-            distractors = [ (a.get('title') or '').split()[0] for a in articles if (a.get('title') or '') != title]
-            distractors = random.sample(distractors, min(3, len(distractors)))
-            opts = [correct] + distractors
-            random.shuffle(opts)
-            questions.append(q)
-            options.append(opts)
-            answers.append(correct)
-    return questions, options, answers
+if PREFETCH_ENABLED:
+    start_prefetch_scheduler()
 
 # --- HEADER ---
 st.markdown("""
@@ -277,16 +436,54 @@ with st.sidebar:
             </ul>
         </div>
         """, unsafe_allow_html=True)
-    if st.session_state.bookmarks:
-        st.markdown("#### 🔖 Bookmarks")
-        for i, bookmark in enumerate(st.session_state.bookmarks):
+    total_bookmarks = bookmark_count()
+    if total_bookmarks:
+        st.markdown(f"#### 🔖 Bookmarks ({total_bookmarks})")
+        pages = page_count(total_bookmarks)
+        page = min(st.session_state.bookmark_page, pages - 1)
+        # Only the visible page is read from the store and rendered
+        for bookmark in get_bookmark_store().page(get_user_id(), page):
             st.markdown(f"""
             <div class="bookmark-card">
-                <b>{bookmark.get('title', bookmark)[:60]}</b>
+                <b>{(bookmark.get('title') or '')[:60]}</b>
                 <br>
-                <small>{bookmark.get('description', '')}</small>
+                <small>{bookmark.get('description') or ''}</small>
             </div>
             """, unsafe_allow_html=True)
+            if st.button("🗑️ Remove", key=f"remove_bookmark_{bookmark['bookmark_id']}"):
+                remove_bookmark(bookmark['bookmark_id'])
+                st.rerun()
+        if pages > 1:
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                if st.button("◀", key="bookmarks_prev", disabled=page == 0):
+                    st.session_state.bookmark_page = page - 1
+                    st.rerun()
+            with col_page:
+                st.caption(f"Page {page + 1} of {pages}")
+            with col_next:
+                if st.button("▶", key="bookmarks_next", disabled=page >= pages - 1):
+                    st.session_state.bookmark_page = page + 1
+                    st.rerun()
+        # The full export is only built on request, not on every rerun
+        if st.button("📤 Export bookmarks", key="export_bookmarks"):
+            st.download_button(
+                "⬇️ Download JSON",
+                data=get_bookmark_store().export_json(get_user_id()),
+                file_name="echonews_bookmarks.json",
+                mime="application/json",
+                key="download_bookmarks",
+            )
+    if METRICS_ENABLED:
+        metrics_server = get_metrics_server()
+        with st.expander("📈 Performance"):
+            stages = stage_summary()
+            if stages:
+                st.table(stages)
+            else:
+                st.caption("No timed calls yet.")
+            if metrics_server is not None:
+                st.caption(f"Prometheus metrics: {metrics_server.url}")
 
 # --- INTEREST SELECTION ---
 if not st.session_state.interests_set:
@@ -315,7 +512,9 @@ tab1, tab2, tab3, tab4 = st.tabs(["📰 News", "🎧 Audio", "❓ Q&A", "🎯 As
 # --- TAB 1: NEWS ---
 with tab1:
     st.markdown("### 📰 Latest News")
-    news, articles = fetch_latest_news()
+    if st.button("🔄 Refresh", key="refresh_news_btn"):
+        st.session_state.news_refresh += 1
+    news, articles = latest_news()
     audio_with_optional_text(news, "latest_news")
 
     # --- Personalized News by Interests ---
@@ -335,10 +534,13 @@ with tab1:
         with col2:
             if st.button("📌 Bookmark this news", key="bookmark_interest_news"):
                 if st.session_state.get('last_interest_articles'):
-                    st.session_state.bookmarks.append(st.session_state['last_interest_articles'][0])
+                    article = st.session_state['last_interest_articles'][0]
+                else:
+                    article = Article(title=st.session_state['last_interest_news'])
+                if add_bookmark(article):
+                    st.success("Bookmarked!")
                 else:
-                    st.session_state.bookmarks.append({"title": st.session_state['last_interest_news'], "description": ""})
-                st.success("Bookmarked!")
+                    st.info("Already bookmarked.")
 
     # --- Search News by Topic ---
     st.markdown("### 🔎 Search News by Topic")
@@ -358,10 +560,13 @@ with tab1:
         with col2:
             if st.button("📌 Bookmark this news", key="bookmark_topic_news"):
                 if st.session_state.get('last_topic_articles'):
-                    st.session_state.bookmarks.append(st.session_state['last_topic_articles'][0])
+                    article = st.session_state['last_topic_articles'][0]
                 else:
-                    st.session_state.bookmarks.append({"title": st.session_state['last_topic_news'], "description": ""})
-                st.success("Bookmarked!")
+                    article = Article(title=st.session_state['last_topic_news'])
+                if add_bookmark(article):
+                    st.success("Bookmarked!")
+                else:
+                    st.info("Already bookmarked.")
 
 # --- TAB 2: AUDIO/VOICE ---
 with tab2:
@@ -374,10 +579,10 @@ with tab2:
         if user_input:
             st.markdown(create_chat_bubble(user_input, is_ai=False), unsafe_allow_html=True)
             if is_latest_news_request(user_input):
-                latest_news, _ = fetch_latest_news_for_interests()
-                st.session_state.audio_result = latest_news
+                interest_news, _ = fetch_latest_news_for_interests()
+                st.session_state.audio_result = interest_news
             elif is_general_question(user_input):
-                st.session_state.audio_result = "Sorry, AI Q&A is not enabled in this demo."
+                st.session_state.audio_result = answer_with_rag(user_input)
             else:
                 summary, _ = fetch_news(user_input)
                 st.session_state.audio_result = summary
@@ -392,7 +597,7 @@ with tab3:
     question = st.text_area("Enter your question:", height=100)
     if st.button("🔍 Get Answer", key="qa_btn"):
         if question:
-            audio_with_optional_text("Sorry, AI Q&A is not enabled in this demo.", "qa_tab")
+            audio_with_optional_text(answer_with_rag(question), "qa_tab")
         else:
             st.warning("Please enter a question.")
 
@@ -406,8 +611,10 @@ with tab4:
             value=datetime.now().date(),
             max_value=datetime.now().date()
         )
-        st.info("Showing latest news for selected date (demo, not date-filtered).")
-        news, articles = fetch_latest_news()
+        articles = articles_for_date(selected_date)
+        if not articles:
+            st.info("No stored news for the selected date yet. Showing the latest news instead.")
+            news, articles = latest_news()
 
         # Quiz state
         quiz_active = st.session_state.get("quiz_active", False)
@@ -418,7 +625,7 @@ with tab4:
                 st.markdown(f"""
                 <div class="news-card">
                     <h4>{i+1}. {art.get('title','')}</h4>
-                    <p><strong>Category:</strong> General | <strong>Date:</strong> {selected_date}</p>
+                    <p><strong>Category:</strong> {', '.join(art.get('category') or ['General']).title()} | <strong>Date:</strong> {(art.get('pubDate') or str(selected_date))[:10]}</p>
                     <p>{art.get('description','')}</p>
                     <p><strong>Relevance to UPSC:</strong> General Awareness</p>
                 </div>
@@ -426,11 +633,14 @@ with tab4:
 
         st.markdown("#### 🧠 Smart Quiz")
         if not quiz_active and st.button("🎯 Generate Quiz", key="quiz_btn"):
-            questions, options, answers = generate_quiz_from_articles(articles)
-            st.session_state.quiz_questions = questions
-            st.session_state.quiz_answers = answers
-            st.session_state.quiz_options = options
-            st.session_state.quiz_user_answers = [None] * len(questions)
+            # Read from the day's quiz bank (built nightly, or now on first use) so every aspirant gets the same quiz
+            quiz = get_quiz_bank().ensure(get_article_store(), selected_date)
+            if not quiz:
+                quiz = build_questions(articles, seed=daily_seed(selected_date))
+            st.session_state.quiz_questions = [q["question"] for q in quiz]
+            st.session_state.quiz_answers = [q["answer"] for q in quiz]
+            st.session_state.quiz_options = [q["options"] for q in quiz]
+            st.session_state.quiz_user_answers = [None] * len(quiz)
             st.session_state.quiz_show_result = False
             st.session_state.quiz_active = True
 
@@ -461,9 +671,22 @@ with tab4:
 
         st.markdown("#### 🎧 Daily Summary Podcast")
         if st.button("🎙️ Generate Daily Podcast", key="podcast_btn"):
-            podcast_text = "Here are today's top headlines. " + " ".join([a.get('title', '') or '' for a in articles])
-            speak_text(podcast_text)
-            st.info("Playing today's headlines as a podcast.")
+            # Rendered per day and language (usually by the nightly job), then served from disk.
+            # Today's news is still arriving, so its render is refreshed; past days are final
+            with st.spinner("Preparing today's podcast..."):
+                max_age = PODCAST_MAX_AGE if selected_date == datetime.now().date() else None
+                manifest = get_podcast_renderer().ensure(selected_date, st.session_state.current_language or "en", max_age)
+            if manifest:
+                server = get_audio_server()
+                if server is not None:
+                    st.audio(server.podcast_url(manifest), format="audio/mp3")
+                else:
+                    st.audio(get_podcast_renderer().audio_path(manifest), format="audio/mp3")
+                st.caption(f"Duration: {format_seconds(manifest['duration'])}")
+                for chapter in manifest["chapters"]:
+                    st.markdown(f"- `{format_seconds(chapter['start'])}` {chapter['title']}")
+            else:
+                st.info("No stored news for this date yet, so there is no podcast to play.")
     else:
         st.markdown("### 🎯 Enable Aspirant Mode")
         st.info("Please enable Aspirant Mode in the sidebar to access UPSC/PSC features.")
@@ -474,4 +697,5 @@ st.markdown("""
 <div style="text-align: center; color: #6c757d; padding: 1rem;">
     <p>📰 EchoNews - AI-Powered News Assistant | Built with ❤️ using Streamlit</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+st.caption(f"⏱️ This rerun: {rerun_cost.finish().summary()}")
@@ -0,0 +1,117 @@
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Shared category tuples: thousands of articles reference a handful of values
+_CATEGORY_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+# newsdata.io field name -> attribute
+_FIELDS = {"pubDate": "pub_date"}
+
+
+class Article:
+    """
+    Compact, read-only view of a newsdata.io article.
+
+    Keeps only the fields the app renders, with source and category strings
+    interned, so session state and caches hold a few hundred bytes per
+    article instead of the full API payload (content, keywords, creator,
+    image_url, ...). `get()` mirrors dict access so templates written for
+    raw API dicts keep working.
+    """
+
+    __slots__ = ("article_id", "title", "description", "link", "source_id", "pub_date", "category")
+
+    def __init__(self, title: str = "", description: str = "", article_id: Optional[str] = None,
+                 link: Optional[str] = None, source_id: Optional[str] = None, pub_date: Optional[str] = None,
+                 category: Iterable[str] = ()):
+        self.article_id = article_id
+        self.title = title
+        self.description = description
+        self.link = link
+        self.source_id = sys.intern(source_id) if source_id else None
+        self.pub_date = pub_date
+        self.category = _intern_categories(category)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Article":
+        """
+        Build an Article from a raw newsdata.io result dict
+
+        Args:
+            data (Dict): API result or stored payload
+
+        Returns:
+            Article: Compact article
+        """
+        category = data.get("category") or ()
+        return cls(
+            title=data.get("title") or "",
+            description=data.get("description") or "",
+            article_id=data.get("article_id"),
+            link=data.get("link"),
+            source_id=data.get("source_id"),
+            pub_date=data.get("pubDate"),
+            category=(category,) if isinstance(category, str) else category,
+        )
+
+    def get(self, key: str, default=None):
+        value = getattr(self, _FIELDS.get(key, key), None) if key in _KEYS else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        if key not in _KEYS:
+            raise KeyError(key)
+        return getattr(self, _FIELDS.get(key, key))
+
+    def to_dict(self) -> Dict:
+        """Dict in newsdata.io field names, e.g. for JSON export"""
+        return {
+            "article_id": self.article_id,
+            "title": self.title,
+            "description": self.description,
+            "link": self.link,
+            "source_id": self.source_id,
+            "pubDate": self.pub_date,
+            "category": list(self.category),
+        }
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        # Unpickled copies (st.cache_data hands out one per call) share interned values again
+        self.source_id = sys.intern(self.source_id) if self.source_id else None
+        self.category = _intern_categories(self.category)
+
+    def __eq__(self, other):
+        if not isinstance(other, Article):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+
+    def __hash__(self):
+        return hash(self.article_id or self.link or self.title)
+
+    def __repr__(self):
+        return f"Article({self.title[:40]!r}, source_id={self.source_id!r}, pub_date={self.pub_date!r})"
+
+
+_KEYS = frozenset(Article.__slots__) | frozenset(_FIELDS)
+
+
+def _intern_categories(categories: Iterable[str]) -> Tuple[str, ...]:
+    key = tuple(sys.intern(c) for c in categories if c)
+    return _CATEGORY_TUPLES.setdefault(key, key)
+
+
+def compact_articles(articles: Iterable) -> List[Article]:
+    """
+    Convert raw article dicts to Articles, passing existing Articles through
+
+    Args:
+        articles (Iterable): Raw newsdata.io dicts or Articles
+
+    Returns:
+        List[Article]: Compact articles in the same order
+    """
+    return [a if isinstance(a, Article) else Article.from_dict(a) for a in articles]
@@ -0,0 +1,227 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_DB_PATH = "data/articles.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    article_id  TEXT PRIMARY KEY,
+    link        TEXT UNIQUE,
+    title       TEXT,
+    description TEXT,
+    source_id   TEXT,
+    language    TEXT,
+    pub_date    TEXT,
+    pub_day     TEXT,
+    ingested_at REAL,
+    payload     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_day ON articles (pub_day, pub_date);
+
+CREATE TABLE IF NOT EXISTS article_categories (
+    article_id TEXT NOT NULL,
+    category   TEXT NOT NULL,
+    PRIMARY KEY (category, article_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS article_keywords (
+    article_id TEXT NOT NULL,
+    keyword    TEXT NOT NULL,
+    PRIMARY KEY (keyword, article_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ingest_cursors (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ArticleStore:
+    """
+    SQLite (WAL) store for newsdata.io articles.
+
+    Articles are deduplicated by article_id and link, and indexed by
+    publication day, category and keyword. The raw API dict is kept as the
+    payload so stored articles render exactly like fresh ones.
+    """
+
+    def __init__(self, db_path: str = ARTICLE_DB_PATH):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        logger.info("ArticleStore initialized")
+
+    def ingest(self, articles: Iterable[Dict], cursor: Optional[str] = None) -> int:
+        """
+        Insert new articles, skipping duplicates
+
+        Args:
+            articles (Iterable[Dict]): Raw newsdata.io result dicts
+            cursor (str): Feed name (e.g. "latest", "topic:Space"). Articles
+                published before the feed's last seen pubDate are skipped.
+
+        Returns:
+            int: Number of articles actually added
+        """
+        added = 0
+        with self._lock, self._conn:
+            last_seen = self._get_cursor(cursor) if cursor else None
+            newest = last_seen
+            for article in articles:
+                article_id = article.get("article_id") or article.get("link")
+                if not article_id:
+                    continue
+                pub_date = article.get("pubDate") or ""
+                if last_seen and pub_date and pub_date < last_seen:
+                    continue
+                if pub_date and (newest is None or pub_date > newest):
+                    newest = pub_date
+                inserted = self._conn.execute(
+                    "INSERT OR IGNORE INTO articles (article_id, link, title, description, source_id,"
+                    " language, pub_date, pub_day, ingested_at, payload)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        article_id,
+                        article.get("link"),
+                        article.get("title"),
+                        article.get("description"),
+                        article.get("source_id"),
+                        article.get("language"),
+                        pub_date,
+                        pub_date[:10] or None,
+                        time.time(),
+                        json.dumps(article, ensure_ascii=False),
+                    ),
+                ).rowcount
+                if not inserted:
+                    continue
+                added += 1
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_categories (article_id, category) VALUES (?, ?)",
+                    [(article_id, c.lower()) for c in _as_list(article.get("category"))],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_keywords (article_id, keyword) VALUES (?, ?)",
+                    [(article_id, k.lower()) for k in _as_list(article.get("keywords"))],
+                )
+            if cursor and newest and newest != last_seen:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ingest_cursors (name, value) VALUES (?, ?)", (cursor, newest)
+                )
+        if added:
+            logger.info(f"Ingested {added} new articles" + (f" from {cursor}" if cursor else ""))
+        return added
+
+    def articles_for_date(self, day: date, category: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """
+        Get articles published on a given day, newest first
+
+        Args:
+            day (date): Publication day
+            category (str): Optional newsdata.io category filter
+            limit (int): Maximum number of articles
+
+        Returns:
+            List[Dict]: Raw article dicts
+        """
+        if category:
+            sql = ("SELECT a.payload FROM articles a JOIN article_categories c ON c.article_id = a.article_id"
+                   " WHERE a.pub_day = ? AND c.category = ? ORDER BY a.pub_date DESC LIMIT ?")
+            args = (day.isoformat(), category.lower(), limit)
+        else:
+            sql = "SELECT payload FROM articles WHERE pub_day = ? ORDER BY pub_date DESC LIMIT ?"
+            args = (day.isoformat(), limit)
+        return self._query(sql, args)
+
+    def count_for_date(self, day: date, category: Optional[str] = None) -> int:
+        """Number of stored articles published on a day, optionally in one category"""
+        if category:
+            sql = ("SELECT COUNT(*) FROM articles a JOIN article_categories c ON c.article_id = a.article_id"
+                   " WHERE a.pub_day = ? AND c.category = ?")
+            args = (day.isoformat(), category.lower())
+        else:
+            sql, args = "SELECT COUNT(*) FROM articles WHERE pub_day = ?", (day.isoformat(),)
+        with self._lock:
+            return self._conn.execute(sql, args).fetchone()[0]
+
+    def articles_for_category(self, category: str, limit: int = 50) -> List[Dict]:
+        return self._query(
+            "SELECT a.payload FROM article_categories c JOIN articles a ON a.article_id = c.article_id"
+            " WHERE c.category = ? ORDER BY a.pub_date DESC LIMIT ?",
+            (category.lower(), limit),
+        )
+
+    def articles_for_keyword(self, keyword: str, limit: int = 50) -> List[Dict]:
+        return self._query(
+            "SELECT a.payload FROM article_keywords k JOIN articles a ON a.article_id = k.article_id"
+            " WHERE k.keyword = ? ORDER BY a.pub_date DESC LIMIT ?",
+            (keyword.lower(), limit),
+        )
+
+    def articles_after(self, rowid: int = 0, limit: int = 1000) -> List[tuple]:
+        """
+        Page through the store in ingestion order
+
+        Args:
+            rowid (int): Return rows ingested after this row id
+            limit (int): Page size
+
+        Returns:
+            List[tuple]: (rowid, article dict) pairs
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid, payload FROM articles WHERE rowid > ? ORDER BY rowid LIMIT ?", (rowid, limit)
+            ).fetchall()
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def get_cursor(self, name: str) -> Optional[str]:
+        with self._lock:
+            return self._get_cursor(name)
+
+    def set_cursor(self, name: str, value: Optional[str]) -> None:
+        """Store a named cursor (e.g. a backfill checkpoint); None deletes it"""
+        with self._lock, self._conn:
+            if value is None:
+                self._conn.execute("DELETE FROM ingest_cursors WHERE name = ?", (name,))
+            else:
+                self._conn.execute("INSERT OR REPLACE INTO ingest_cursors (name, value) VALUES (?, ?)", (name, value))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _get_cursor(self, name: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM ingest_cursors WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _query(self, sql: str, args: tuple) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+def _as_list(value) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [v for v in value if isinstance(v, str) and v]
@@ -0,0 +1,166 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+AUDIO_CACHE_DIR = "data/news"
+
+
+class AudioCache:
+    """
+    Two-tier (memory LRU + disk) cache for synthesized speech.
+
+    Entries are addressed by a SHA-256 of the cleaned text, language and
+    voice, so identical summaries are synthesized once and shared by every
+    session in the process.
+    """
+
+    def __init__(self, cache_dir: str = AUDIO_CACHE_DIR,
+                 max_memory_bytes: int = 32 * 1024 * 1024,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._disk_bytes = sum(
+            entry.stat().st_size for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.name.endswith(".mp3")
+        )
+        logger.info("AudioCache initialized")
+
+    @staticmethod
+    def make_key(text: str, lang: str = "en", voice: str = "com") -> str:
+        """
+        Build the content address for an utterance
+
+        Args:
+            text (str): Cleaned text that will be spoken
+            lang (str): Language code (en, ml)
+            voice (str): Voice/accent identifier of the engine
+
+        Returns:
+            str: Hex digest used as the cache key and file name
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{lang}\x00{voice}\x00".encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        # Touch the file so disk eviction follows recent use
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.disk_hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.path_for(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._disk_bytes += len(data) - previous
+        except OSError as e:
+            logger.error(f"Error writing audio cache entry: {str(e)}")
+        with self._lock:
+            self._remember(key, data)
+        self._evict_disk()
+
+    def get_or_create(self, key: str, synthesize: Callable[[], bytes]) -> bytes:
+        """
+        Return cached audio for key, synthesizing and storing it on a miss
+
+        Args:
+            key (str): Key from make_key
+            synthesize (Callable): Produces MP3 bytes when nothing is cached
+
+        Returns:
+            bytes: MP3 audio
+        """
+        data = self.get(key)
+        if data is None:
+            data = synthesize()
+            self.put(key, data)
+        return data
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": hits / total if total else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, data: bytes) -> None:
+        # Caller holds self._lock
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        if len(data) > self.max_memory_bytes:
+            return
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _evict_disk(self) -> None:
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        entries = [
+            entry for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.name.endswith(".mp3")
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_disk_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+                total -= size
+            except OSError:
+                continue
+        with self._lock:
+            self._disk_bytes = total
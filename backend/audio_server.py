@@ -0,0 +1,270 @@
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from backend.audio_cache import AUDIO_CACHE_DIR
+from backend.podcast import PODCAST_DIR
+
+logger = logging.getLogger(__name__)
+
+# Address the browser uses to reach the server, e.g. an https path on the app's
+# reverse proxy. The app only serves audio this way when it is set: a guessed
+# http://localhost URL breaks playback on remote and https deployments
+AUDIO_BASE_URL = os.getenv("AUDIO_BASE_URL")
+AUDIO_SERVER_ENABLED = bool(AUDIO_BASE_URL) and os.getenv("AUDIO_SERVER", "1") != "0"
+# Loopback by default; the proxy in front of AUDIO_BASE_URL forwards to it
+AUDIO_SERVER_HOST = os.getenv("AUDIO_SERVER_HOST", "127.0.0.1")
+AUDIO_SERVER_PORT = int(os.getenv("AUDIO_SERVER_PORT", "8502"))
+
+# Clip and podcast file names embed a content hash, so a URL never changes meaning
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+COPY_CHUNK_BYTES = 64 * 1024
+# Registered speech streams kept per process; each entry is a small closure
+MAX_STREAMS = 1024
+
+_PATH = re.compile(r"^/(?P<kind>[a-z]+)/(?P<name>[A-Za-z0-9_.-]+\.mp3)$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a single-range HTTP Range header against a file size
+
+    Args:
+        header (str): Range header value, e.g. "bytes=0-1023", "bytes=500-" or "bytes=-500"
+        size (int): File size in bytes
+
+    Returns:
+        Tuple[int, int]: Inclusive (start, end), or None for the whole file
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if match is None:
+        # Multiple ranges or other units: serve the whole file
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        raise ValueError(f"Invalid range: {header}")
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError(f"Invalid range: {header}")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, end
+
+
+class _AudioRequestHandler(BaseHTTPRequestHandler):
+    server_version = "EchoNewsAudio/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body: bool) -> None:
+        path = self.path.split("?", 1)[0]
+        match = _PATH.match(path)
+        if match and match.group("kind") == "streams":
+            self._send_stream(match.group("name")[:-4], send_body)
+            return
+        root = self.server.roots.get(match.group("kind")) if match else None
+        if root is None:
+            self._send_status(404)
+            return
+        name = match.group("name")
+        path = os.path.join(root, name)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            self._send_status(404)
+            return
+
+        etag = f'"{name[:-4]}"'
+        if etag in (self.headers.get("If-None-Match") or ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.end_headers()
+            return
+
+        # A stale If-Range validator means the client must refetch the whole file
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if if_range and if_range != etag:
+            range_header = None
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, size - 1)
+        length = end - start + 1 if size else 0
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if not send_body or length == 0:
+            return
+        try:
+            with open(path, "rb") as f:
+                f.seek(start)
+                remaining = length
+                while remaining > 0:
+                    chunk = f.read(min(COPY_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            # Browsers routinely abort a request after seeking elsewhere
+            pass
+
+    def _send_stream(self, key: str, send_body: bool) -> None:
+        # Chunked transfer: each MP3 piece is sent as soon as it is synthesized or
+        # read from the cache, so playback starts before the last sentence is ready
+        source = self.server.stream_source(key)
+        if source is None:
+            self._send_status(404)
+            return
+        etag = f'"{key}"'
+        if etag in (self.headers.get("If-None-Match") or ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Accept-Ranges", "none")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        if not send_body:
+            return
+        chunks = iter(source())
+        try:
+            for chunk in chunks:
+                if chunk:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            # Headers are gone already: cut the response short so the client sees an error
+            logger.error(f"Error streaming audio {key}: {str(e)}")
+            self.close_connection = True
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    def _send_status(self, code: int) -> None:
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class AudioServer:
+    """
+    Static HTTP endpoint for cached speech clips and rendered podcasts.
+
+    Files are streamed from disk with Range, ETag and long-lived cache
+    headers, so the browser fetches audio directly (and can seek) instead
+    of receiving base64 payloads over the Streamlit websocket. Registered
+    speech streams are sent chunk by chunk as they are synthesized.
+    """
+
+    def __init__(self, roots: Optional[Dict[str, str]] = None, host: str = AUDIO_SERVER_HOST,
+                 port: int = AUDIO_SERVER_PORT, base_url: Optional[str] = AUDIO_BASE_URL):
+        self.roots = roots or {"clips": AUDIO_CACHE_DIR, "podcasts": PODCAST_DIR}
+        self.host = host
+        self.port = port
+        self.base_url = base_url
+        self._streams = OrderedDict()
+        self._streams_lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        logger.info("AudioServer initialized")
+
+    def start(self) -> "AudioServer":
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _AudioRequestHandler)
+            self._httpd.daemon_threads = True
+            self._httpd.roots = self.roots
+            self._httpd.stream_source = self.stream_source
+            # Port 0 picks a free port; report the real one
+            self.port = self._httpd.server_address[1]
+            if self.base_url is None:
+                self.base_url = f"http://localhost:{self.port}"
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="audio-server", daemon=True)
+            self._thread.start()
+            logger.info(f"Serving audio on {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def url_for(self, kind: str, name: str) -> str:
+        return f"{self.base_url}/{kind}/{name}"
+
+    def clip_url(self, key: str) -> str:
+        """URL of a cached clip, addressed by its AudioCache key"""
+        return self.url_for("clips", f"{key}.mp3")
+
+    def register_stream(self, key: str, chunks: Callable[[], Iterable[bytes]]) -> str:
+        """
+        Serve an utterance progressively under /streams/<key>.mp3
+
+        Args:
+            key (str): Content address of the whole utterance
+            chunks (Callable): Returns the utterance's MP3 pieces in order; called per request
+
+        Returns:
+            str: Stream URL
+        """
+        with self._streams_lock:
+            self._streams[key] = chunks
+            self._streams.move_to_end(key)
+            while len(self._streams) > MAX_STREAMS:
+                self._streams.popitem(last=False)
+        return self.url_for("streams", f"{key}.mp3")
+
+    def stream_source(self, key: str) -> Optional[Callable[[], Iterable[bytes]]]:
+        with self._streams_lock:
+            return self._streams.get(key)
+
+    def podcast_url(self, manifest: Dict) -> str:
+        """URL of a rendered podcast, addressed by its versioned file name"""
+        return self.url_for("podcasts", manifest["file"])
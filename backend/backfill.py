@@ -0,0 +1,75 @@
+import logging
+import os
+from datetime import date
+from typing import Optional
+
+from backend.news_client import NewsClient, get_news_client
+
+logger = logging.getLogger(__name__)
+
+NEWS_LATEST_URL = "https://newsdata.io/api/1/latest"
+# newsdata.io free plan maximum
+BACKFILL_PAGE_SIZE = 10
+
+
+def backfill(store, url: str, params: dict, name: str, until: Optional[date] = None,
+             max_articles: Optional[int] = None, client: Optional[NewsClient] = None) -> int:
+    """
+    Page through a newsdata.io feed from newest to oldest into the article store
+
+    Each page is ingested as soon as it arrives and its nextPage token is
+    checkpointed, so an interrupted run resumes from the next page. The
+    checkpoint is cleared once a bound or the last page is reached, and the
+    next run starts again from the newest articles.
+
+    Args:
+        store (ArticleStore): Destination store
+        url (str): Feed endpoint, e.g. the latest-news URL
+        params (dict): Query parameters, including apikey
+        name (str): Checkpoint name, e.g. "latest" or "topic:Space"
+        until (date): Stop after reaching articles published before this day
+        max_articles (int): Stop after fetching this many articles
+
+    Returns:
+        int: Number of articles newly added to the store
+    """
+    client = client or get_news_client()
+    checkpoint = f"backfill:{name}"
+    resume_from = store.get_cursor(checkpoint)
+    if resume_from:
+        logger.info(f"Resuming backfill '{name}' from checkpoint")
+    cutoff = until.isoformat() if until else None
+    fetched = 0
+    added = 0
+    for articles, next_page in client.iter_pages(url, params, page=resume_from):
+        if cutoff:
+            in_range = [a for a in articles if (a.get("pubDate") or "")[:10] >= cutoff]
+            reached_cutoff = len(in_range) < len(articles)
+            articles = in_range
+        else:
+            reached_cutoff = False
+        if max_articles is not None:
+            articles = articles[:max_articles - fetched]
+        fetched += len(articles)
+        added += store.ingest(articles)
+        if next_page is None or reached_cutoff or (max_articles is not None and fetched >= max_articles):
+            break
+        # Written after the page is stored: a crash re-fetches at most one page
+        store.set_cursor(checkpoint, next_page)
+    # Reaching here means a bound or the last page; errors propagate and keep the checkpoint
+    store.set_cursor(checkpoint, None)
+    logger.info(f"Backfill '{name}' fetched {fetched} articles, added {added}")
+    return added
+
+
+if __name__ == "__main__":
+    # python -m backend.backfill [YYYY-MM-DD] [max_articles]; needs NEWSDATA_API_KEY
+    import sys
+
+    from backend.article_store import ArticleStore
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    until = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else date.today()
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    params = {"language": "en", "apikey": os.environ["NEWSDATA_API_KEY"], "size": BACKFILL_PAGE_SIZE}
+    backfill(ArticleStore(), NEWS_LATEST_URL, params, "latest", until=until, max_articles=limit)
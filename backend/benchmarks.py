@@ -0,0 +1,381 @@
+import hashlib
+import json
+import logging
+import os
+import platform
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_FIXTURE = os.path.join(REPO_ROOT, "data", "fixtures", "newsdata_latest.json")
+BENCH_OUTPUT_DIR = os.path.join(REPO_ROOT, "data", "benchmarks")
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+BENCH_SEED = 1234
+# p95 growth beyond this fraction (and beyond the noise floor) counts as a regression
+BENCH_TOLERANCE = 0.25
+BENCH_NOISE_FLOOR_MS = 0.05
+
+# MPEG-1 Layer III frame (128 kbps, 44.1 kHz) used by the fake TTS engine
+_FAKE_FRAME = b"\xff\xfb\x90\x00" + bytes(413)
+
+
+def load_fixture(path: str = BENCH_FIXTURE) -> List[Dict]:
+    """
+    Load recorded newsdata.io responses
+
+    Args:
+        path (str): Fixture file holding {"pages": [response, ...]}
+
+    Returns:
+        List[Dict]: API responses in nextPage order
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["pages"]
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    if not samples:
+        return 0.0
+    rank = max(1, -(-len(samples) * q // 100))
+    return samples[int(rank) - 1]
+
+
+def summarize(samples_ms: List[float], items: int) -> Dict[str, float]:
+    """
+    Latency percentiles and throughput of one stage
+
+    Args:
+        samples_ms (List[float]): One latency sample per timed call
+        items (int): Items processed across all timed calls
+
+    Returns:
+        Dict[str, float]: Sample count, p50/p95/p99/mean in ms and items per second
+    """
+    ordered = sorted(samples_ms)
+    total_ms = sum(ordered)
+    return {
+        "samples": len(ordered),
+        "p50_ms": round(percentile(ordered, 50), 4),
+        "p95_ms": round(percentile(ordered, 95), 4),
+        "p99_ms": round(percentile(ordered, 99), 4),
+        "mean_ms": round(total_ms / len(ordered), 4) if ordered else 0.0,
+        "throughput_per_s": round(items / (total_ms / 1000), 2) if total_ms else 0.0,
+    }
+
+
+def _timed(calls: Iterable[Callable[[], int]]) -> Tuple[List[float], int]:
+    """Run callables that return their item count, timing each one"""
+    samples = []
+    items = 0
+    for call in calls:
+        started = time.perf_counter()
+        items += call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, items
+
+
+class StubNewsServer:
+    """Local HTTP server replaying recorded newsdata.io pages by nextPage token."""
+
+    def __init__(self, pages: List[Dict]):
+        tokens = [None] + [page.get("nextPage") for page in pages[:-1]]
+        self.bodies = {token: json.dumps(page).encode("utf-8") for token, page in zip(tokens, pages)}
+        self._httpd = None
+
+    def __enter__(self) -> "StubNewsServer":
+        bodies = self.bodies
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; Nagle would hold the body for a delayed ACK (~40 ms)
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                token = parse_qs(urlparse(self.path).query).get("page", [None])[0]
+                body = bodies.get(token)
+                self.send_response(200 if body is not None else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body or b"")))
+                self.end_headers()
+                self.wfile.write(body or b"")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, name="bench-newsdata", daemon=True).start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}/api/1/latest"
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder standing in for sentence-transformers."""
+
+    model_name = "bench-hashing"
+    batch_size = 64
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def encode(self, texts: List[str]):
+        import numpy as np
+
+        vectors = np.zeros((len(texts), self.dim), dtype="float32")
+        for row, text in enumerate(texts):
+            for word in re.findall(r"\w+", text.lower()):
+                vectors[row, int(hashlib.md5(word.encode("utf-8")).hexdigest()[:8], 16) % self.dim] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-6)
+
+
+def bench_fetch(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per page request, following nextPage cursors through the stub server"""
+    from backend.news_client import NewsClient
+
+    client = NewsClient(max_retries=0)
+    samples, items = [], 0
+    try:
+        with StubNewsServer(pages) as server:
+            for _ in range(rounds):
+                iterator = client.iter_pages(server.url, {"language": "en", "apikey": "bench"})
+                while True:
+                    started = time.perf_counter()
+                    try:
+                        results, _ = next(iterator)
+                    except StopIteration:
+                        break
+                    samples.append((time.perf_counter() - started) * 1000)
+                    items += len(results)
+    finally:
+        client.close()
+    return samples, items
+
+
+def bench_normalize(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per article, bypassing the memo cache so every call does the work"""
+    from backend.text_normalizer import normalize_for_speech
+    from backend.tts import article_speech_text
+
+    normalize = normalize_for_speech.__wrapped__
+    texts = [article_speech_text(article) for article in articles]
+    return _timed(lambda text=text: normalize(text) and 1 for _ in range(rounds) for text in texts)
+
+
+def bench_tts(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per article spoken through stream_speech with a fake engine and a cold cache"""
+    from backend.audio_cache import AudioCache
+    from backend.text_normalizer import normalize_for_speech
+    from backend.tts import article_speech_text, stream_speech
+
+    def synthesize(chunk):
+        return _FAKE_FRAME * (len(chunk) // 10 + 1)
+
+    texts = [normalize_for_speech(article_speech_text(article)) for article in articles]
+    with tempfile.TemporaryDirectory() as tmp:
+        samples, items = [], 0
+        for round_number in range(rounds):
+            cache = AudioCache(cache_dir=os.path.join(tmp, str(round_number)))
+            round_samples, round_items = _timed(
+                lambda text=text: bool(list(stream_speech(text, synthesize, cache=cache))) for text in texts
+            )
+            samples += round_samples
+            items += round_items
+    return samples, items
+
+
+def bench_quiz(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per quiz generated from the whole fixture"""
+    from backend.quiz import generate_quiz_from_articles
+
+    return _timed(lambda: len(generate_quiz_from_articles(articles, seed=BENCH_SEED)[0]) for _ in range(rounds))
+
+
+def bench_dedup(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per near-duplicate pass over the whole fixture"""
+    from backend.dedup import dedupe
+
+    return _timed(lambda: dedupe(articles) and len(articles) for _ in range(rounds))
+
+
+def bench_retrieval(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per question answered by HNSW search plus MMR over a hashing-embedder index"""
+    from backend.embedder import FaissStore
+    from backend.rag_engine import RAGEngine
+
+    questions = [f"What is the latest on {' '.join(article['title'].split()[:3])}?" for article in articles[::3]]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FaissStore(HashingEmbedder(), index_path=os.path.join(tmp, "index.faiss"),
+                           mapping_path=os.path.join(tmp, "mapping.pkl"))
+        store.add_articles(articles)
+        engine = RAGEngine(faiss_store=store, llm=lambda prompt: "")
+        return _timed(lambda question=question: len(engine.retrieve(question))
+                      for _ in range(rounds) for question in questions)
+
+
+def _player_news(articles: List[Dict]) -> List[Dict]:
+    return [{"title": article["title"], "summary": article["description"], "source": article["source_id"],
+             "date": article["pubDate"], "audio_key": article["article_id"]} for article in articles]
+
+
+def bench_html(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per audio player rendered, bypassing the memo cache so every call fills the template"""
+    from components.news_player import NewsPlayer, _audio_player_html
+
+    render = _audio_player_html.__wrapped__
+    player = NewsPlayer(audio_base_url="http://localhost:8502")
+    fields = [(item["title"], item["summary"], item["source"], item["date"], player.clip_url(item["audio_key"]))
+              for item in _player_news(articles)]
+    return _timed(lambda args=args: bool(render(*args)) for _ in range(rounds) for args in fields)
+
+
+def bench_html_cached(pages: List[Dict], articles: List[Dict], rounds: int) -> Tuple[List[float], int]:
+    """One sample per audio player requested on a rerun, served from the memo cache after warm-up"""
+    from components.news_player import NewsPlayer
+
+    player = NewsPlayer(audio_base_url="http://localhost:8502")
+    news = _player_news(articles)
+    return _timed(lambda item=item: bool(player.create_audio_player(item)) for _ in range(rounds) for item in news)
+
+
+# Pipeline order: fetch -> summarize/normalize -> speak, then the features built on top
+STAGES: Dict[str, Callable[[List[Dict], List[Dict], int], Tuple[List[float], int]]] = {
+    "fetch": bench_fetch,
+    "normalize": bench_normalize,
+    "tts": bench_tts,
+    "quiz": bench_quiz,
+    "dedup": bench_dedup,
+    "retrieval": bench_retrieval,
+    "html": bench_html,
+    "html_cached": bench_html_cached,
+}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(stages: Optional[List[str]] = None, rounds: int = BENCH_ROUNDS,
+                   fixture: str = BENCH_FIXTURE) -> Dict:
+    """
+    Run the pipeline benchmarks on recorded fixture data
+
+    Every stage gets one untimed warm-up round. A stage whose dependencies
+    are missing is reported as skipped instead of failing the whole run.
+
+    Args:
+        stages (List[str]): Stage names to run (defaults to all of STAGES)
+        rounds (int): Timed passes over the fixture per stage
+        fixture (str): Recorded newsdata.io pages
+
+    Returns:
+        Dict: Report with run metadata and per-stage latency summaries
+    """
+    pages = load_fixture(fixture)
+    articles = [article for page in pages for article in page.get("results", [])]
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixture": os.path.relpath(fixture, REPO_ROOT),
+        "articles": len(articles),
+        "rounds": rounds,
+        "stages": {},
+    }
+    for name in stages or list(STAGES):
+        stage = STAGES[name]
+        try:
+            stage(pages, articles, 1)
+            samples, items = stage(pages, articles, rounds)
+        except ImportError as e:
+            logger.warning(f"Skipping benchmark stage '{name}': {str(e)}")
+            report["stages"][name] = {"skipped": str(e)}
+            continue
+        report["stages"][name] = summarize(samples, items)
+    return report
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = BENCH_TOLERANCE) -> List[str]:
+    """
+    Find stages whose p95 latency regressed against a baseline report
+
+    Args:
+        baseline (Dict): Earlier report
+        current (Dict): New report
+        tolerance (float): Allowed relative p95 growth
+
+    Returns:
+        List[str]: One message per regressed stage
+    """
+    regressions = []
+    for name, stats in current["stages"].items():
+        before = baseline.get("stages", {}).get(name, {})
+        if "p95_ms" not in stats or "p95_ms" not in before:
+            continue
+        growth = stats["p95_ms"] - before["p95_ms"]
+        if growth > BENCH_NOISE_FLOOR_MS and growth > before["p95_ms"] * tolerance:
+            regressions.append(f"{name}: p95 {before['p95_ms']:.3f} ms -> {stats['p95_ms']:.3f} ms")
+    return regressions
+
+
+def save_report(report: Dict, path: Optional[str] = None) -> str:
+    """Write a report as JSON, by default to data/benchmarks/<commit>.json"""
+    path = path or os.path.join(BENCH_OUTPUT_DIR, f"{report.get('commit') or 'worktree'}.json")
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+if __name__ == "__main__":
+    # python -m backend.benchmarks [--stages fetch,tts] [--rounds N] [--output FILE] [--baseline FILE]
+    import argparse
+    import sys
+
+    # Per-call INFO logs from the code under test would swamp the report
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    logger.setLevel(logging.INFO)
+    parser = argparse.ArgumentParser(description="Benchmark the EchoNews pipeline on recorded fixtures")
+    parser.add_argument("--stages", help=f"Comma-separated subset of: {', '.join(STAGES)}")
+    parser.add_argument("--rounds", type=int, default=BENCH_ROUNDS)
+    parser.add_argument("--output", help="Report path (default data/benchmarks/<commit>.json)")
+    parser.add_argument("--baseline", help="Earlier report to compare against; exits 1 on regressions")
+    args = parser.parse_args()
+
+    result = run_benchmarks(args.stages.split(",") if args.stages else None, rounds=args.rounds)
+    for stage_name, stage_stats in result["stages"].items():
+        if "skipped" in stage_stats:
+            logger.info(f"{stage_name:>10}: skipped ({stage_stats['skipped']})")
+        else:
+            logger.info(f"{stage_name:>10}: p50 {stage_stats['p50_ms']:8.3f} ms  p95 {stage_stats['p95_ms']:8.3f} ms"
+                        f"  p99 {stage_stats['p99_ms']:8.3f} ms  {stage_stats['throughput_per_s']:10.1f}/s")
+    logger.info(f"Report written to {save_report(result, args.output)}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            found = compare(json.load(f), result)
+        for message in found:
+            logger.warning(f"Regression: {message}")
+        sys.exit(1 if found else 0)
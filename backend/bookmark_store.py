@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+BOOKMARK_DB_PATH = os.getenv("BOOKMARK_DB_PATH", "data/bookmarks.db")
+BOOKMARK_PAGE_SIZE = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookmarks (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id     TEXT NOT NULL,
+    bookmark_id TEXT NOT NULL,
+    title       TEXT,
+    created_at  REAL NOT NULL,
+    payload     TEXT NOT NULL,
+    UNIQUE (user_id, bookmark_id)
+);
+CREATE INDEX IF NOT EXISTS idx_bookmarks_user ON bookmarks (user_id, seq);
+"""
+
+
+def bookmark_key(article) -> str:
+    """
+    Stable id for an article: its article_id, else its link, else a title hash
+
+    Args:
+        article: Article or raw article dict
+
+    Returns:
+        str: Bookmark id
+    """
+    key = article.get("article_id") or article.get("link") or article.get("url")
+    if key:
+        return key
+    title = article.get("title") or ""
+    return "title:" + hashlib.sha1(title.encode("utf-8")).hexdigest()[:16]
+
+
+class BookmarkStore:
+    """
+    SQLite (WAL) store for per-user bookmarks.
+
+    Bookmarks are keyed by (user_id, bookmark id), so adding the same
+    article twice is a no-op and membership is a primary-key lookup. Listing
+    is paginated newest first, so the sidebar only reads the visible page.
+    """
+
+    def __init__(self, db_path: str = BOOKMARK_DB_PATH):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        logger.info("BookmarkStore initialized")
+
+    def add(self, user_id: str, article) -> bool:
+        """
+        Bookmark an article for a user
+
+        Args:
+            user_id (str): Owner of the bookmark
+            article: Article or raw article dict
+
+        Returns:
+            bool: True if added, False if it was already bookmarked
+        """
+        payload = article.to_dict() if hasattr(article, "to_dict") else dict(article)
+        with self._lock, self._conn:
+            return bool(self._conn.execute(
+                "INSERT OR IGNORE INTO bookmarks (user_id, bookmark_id, title, created_at, payload)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (user_id, bookmark_key(article), payload.get("title"), time.time(),
+                 json.dumps(payload, ensure_ascii=False, default=str)),
+            ).rowcount)
+
+    def remove(self, user_id: str, bookmark_id: str) -> bool:
+        with self._lock, self._conn:
+            return bool(self._conn.execute(
+                "DELETE FROM bookmarks WHERE user_id = ? AND bookmark_id = ?", (user_id, bookmark_id)
+            ).rowcount)
+
+    def contains(self, user_id: str, bookmark_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM bookmarks WHERE user_id = ? AND bookmark_id = ?", (user_id, bookmark_id)
+            ).fetchone() is not None
+
+    def ids(self, user_id: str) -> Set[str]:
+        """All bookmark ids of a user, for in-memory membership checks"""
+        with self._lock:
+            rows = self._conn.execute("SELECT bookmark_id FROM bookmarks WHERE user_id = ?", (user_id,)).fetchall()
+        return {row[0] for row in rows}
+
+    def count(self, user_id: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM bookmarks WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+    def page(self, user_id: str, page: int = 0, page_size: int = BOOKMARK_PAGE_SIZE) -> List[Dict]:
+        """
+        One page of a user's bookmarks, newest first
+
+        Args:
+            user_id (str): Owner of the bookmarks
+            page (int): Zero-based page number
+            page_size (int): Bookmarks per page
+
+        Returns:
+            List[Dict]: Stored article dicts with their "bookmark_id"
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT bookmark_id, payload FROM bookmarks WHERE user_id = ? ORDER BY seq DESC LIMIT ? OFFSET ?",
+                (user_id, page_size, max(page, 0) * page_size),
+            ).fetchall()
+        return [dict(json.loads(payload), bookmark_id=bookmark_id) for bookmark_id, payload in rows]
+
+    def export(self, user_id: str) -> List[Dict]:
+        """All of a user's bookmarks, oldest first, with their bookmarking time"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT bookmark_id, created_at, payload FROM bookmarks WHERE user_id = ? ORDER BY seq",
+                (user_id,),
+            ).fetchall()
+        return [dict(json.loads(payload), bookmark_id=bookmark_id, bookmarked_at=created_at)
+                for bookmark_id, created_at, payload in rows]
+
+    def export_json(self, user_id: str) -> str:
+        return json.dumps(self.export(user_id), ensure_ascii=False, indent=2)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def page_count(total: int, page_size: Optional[int] = None) -> int:
+    page_size = page_size or BOOKMARK_PAGE_SIZE
+    return max(1, -(-total // page_size))
@@ -0,0 +1,143 @@
+import logging
+import os
+import random
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Estimated Jaccard similarity of title + description word sets above which two articles are one story
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.5"))
+
+# 16 bands of 4 rows: pairs at 0.5 similarity share a band ~64% of the time, at 0.7 ~99%
+NUM_PERM = 64
+BAND_ROWS = 4
+
+_MASK = 0xFFFFFFFF
+_rng = random.Random(20240208)
+# Fixed seed: signatures are stable across processes and can be stored. Multiply-add
+# modulo 2**32 (odd multipliers) keeps every product a small int, twice as fast as a
+# Mersenne-prime modulus with the same estimation error for short texts
+_PERMS = [(_rng.getrandbits(32) | 1, _rng.getrandbits(32)) for _ in range(NUM_PERM)]
+_WORD = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or said says that the this to was were will with".split()
+)
+
+Signature = Tuple[int, ...]
+
+
+def article_text(article) -> str:
+    return f"{article.get('title') or ''} {article.get('description') or ''}"
+
+
+def minhash(text: str) -> Optional[Signature]:
+    """
+    MinHash signature of the word set of a text
+
+    Args:
+        text (str): Title and description
+
+    Returns:
+        Signature: NUM_PERM minimum hashes, or None if the text has no words
+    """
+    words = {w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS}
+    if not words:
+        return None
+    # Column-wise minimum over per-word hash rows, done in C by zip/map
+    return tuple(map(min, zip(*map(_word_hashes, words))))
+
+
+@lru_cache(maxsize=4096)
+def _word_hashes(word: str) -> Signature:
+    # News vocabulary is heavily skewed, so most words hit this cache (~10 MB when full)
+    h = zlib.crc32(word.encode("utf-8"))
+    return tuple([(a * h + b) & _MASK for a, b in _PERMS])
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(x == y for x, y in zip(first, second)) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """
+    Streaming near-duplicate detector over article text.
+
+    Each added item is MinHashed and bucketed by LSH band, so it is only
+    compared with cluster representatives that share a band: one pass over
+    a batch is linear in its size. The index keeps its state between calls
+    and can be fed page by page, e.g. during a bulk ingestion.
+    """
+
+    def __init__(self, threshold: float = DEDUP_THRESHOLD):
+        self.threshold = threshold
+        self._signatures: Dict[Hashable, Signature] = {}
+        self._buckets: Dict[Tuple[int, Signature], List[Hashable]] = {}
+        self._cluster_sizes: Dict[Hashable, int] = {}
+        # Built per fetch, podcast and quiz build, so not worth an INFO line each time
+        logger.debug("NearDuplicateIndex initialized")
+
+    def add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        Add an item, clustering it with an earlier one if it is a near duplicate
+
+        Args:
+            key (Hashable): Item id, e.g. an article_id
+            text (str): Item text
+
+        Returns:
+            Hashable: Key of the cluster representative it duplicates, or None if it is new
+        """
+        signature = minhash(text)
+        if signature is None:
+            return None
+        bands = [(i, signature[i:i + BAND_ROWS]) for i in range(0, NUM_PERM, BAND_ROWS)]
+        seen = set()
+        for band in bands:
+            for candidate in self._buckets.get(band, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if similarity(signature, self._signatures[candidate]) >= self.threshold:
+                    self._cluster_sizes[candidate] += 1
+                    return candidate
+        # Only representatives are indexed, which bounds every bucket by the number of distinct stories
+        self._signatures[key] = signature
+        self._cluster_sizes[key] = 1
+        for band in bands:
+            self._buckets.setdefault(band, []).append(key)
+        return None
+
+    def cluster_size(self, key: Hashable) -> int:
+        return self._cluster_sizes.get(key, 0)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def dedupe(articles: Iterable, threshold: float = DEDUP_THRESHOLD,
+           index: Optional[NearDuplicateIndex] = None, limit: Optional[int] = None) -> List:
+    """
+    Keep the first article of each near-duplicate cluster, in order
+
+    Args:
+        articles (Iterable): Articles or raw article dicts
+        threshold (float): Similarity threshold for a new index
+        index (NearDuplicateIndex): Existing index, to dedupe across batches
+        limit (int): Stop after this many representatives; later articles are not indexed
+
+    Returns:
+        List: One representative per story
+    """
+    index = index if index is not None else NearDuplicateIndex(threshold)
+    kept = []
+    for article in articles:
+        if limit is not None and len(kept) >= limit:
+            break
+        key = article.get("article_id") or article.get("link") or object()
+        if index.add(key, article_text(article)) is None:
+            kept.append(article)
+    return kept
@@ -0,0 +1,227 @@
+import logging
+import os
+import pickle
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTORSTORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vectorstore")
+INDEX_PATH = os.path.join(VECTORSTORE_DIR, "index.faiss")
+MAPPING_PATH = os.path.join(VECTORSTORE_DIR, "faiss_store.pkl")
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+EMBED_BATCH_SIZE = 64
+# Only the fields needed to answer questions and cite sources are kept in the mapping
+ARTICLE_FIELDS = ("article_id", "title", "description", "link", "source_id", "pubDate")
+
+
+def article_text(article: Dict) -> str:
+    title = article.get("title") or ""
+    description = article.get("description") or ""
+    return f"{title}. {description}".strip(". ")
+
+
+class NewsEmbedder:
+    """
+    Batch sentence-transformers encoder for article text.
+
+    Embeddings are L2-normalized so inner product equals cosine similarity.
+    """
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL, batch_size: int = EMBED_BATCH_SIZE):
+        # Imported here: pulling in torch is only worth it once something needs encoding
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+        logger.info(f"NewsEmbedder initialized with {model_name}")
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(
+            texts, batch_size=self.batch_size, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False
+        )
+        return np.ascontiguousarray(vectors, dtype="float32")
+
+
+class FaissStore:
+    """
+    FAISS HNSW index plus an id -> article mapping, persisted side by side.
+
+    On load the index is memory-mapped read-only, so startup does not
+    re-embed or copy the corpus. The first add swaps in a writable copy.
+    """
+
+    def __init__(self, embedder, index_path: str = INDEX_PATH, mapping_path: str = MAPPING_PATH,
+                 hnsw_m: int = 32):
+        self.embedder = embedder
+        self.index_path = index_path
+        self.mapping_path = mapping_path
+        self.hnsw_m = hnsw_m
+        self.articles = {}
+        self.ids_by_key = {}
+        self.store_rowid = 0
+        self.index = None
+        self._mmapped = False
+        self._lock = threading.RLock()
+        self._load()
+
+    @property
+    def size(self) -> int:
+        return len(self.articles)
+
+    def add_articles(self, articles: Iterable[Dict]) -> int:
+        """
+        Embed and index articles that are not indexed yet
+
+        Args:
+            articles (Iterable[Dict]): Raw newsdata.io article dicts
+
+        Returns:
+            int: Number of newly indexed articles
+        """
+        pending = []
+        with self._lock:
+            seen = set()
+            for article in articles:
+                key = article.get("article_id") or article.get("link")
+                if not key or key in self.ids_by_key or key in seen:
+                    continue
+                seen.add(key)
+                pending.append((key, {f: article.get(f) for f in ARTICLE_FIELDS}))
+        if not pending:
+            return 0
+        added = 0
+        for start in range(0, len(pending), self.embedder.batch_size):
+            batch = pending[start:start + self.embedder.batch_size]
+            vectors = self.embedder.encode([article_text(article) for _, article in batch])
+            with self._lock:
+                self._ensure_writable()
+                first_id = self.index.ntotal
+                ids = np.arange(first_id, first_id + len(batch), dtype="int64")
+                self.index.add_with_ids(vectors, ids)
+                for vector_id, (key, article) in zip(ids.tolist(), batch):
+                    self.articles[vector_id] = article
+                    self.ids_by_key[key] = vector_id
+                added += len(batch)
+        logger.info(f"Indexed {added} articles ({self.size} total)")
+        return added
+
+    def sync_from_store(self, store, page_size: int = 1000) -> int:
+        """
+        Incrementally index everything ingested into an ArticleStore since the last sync
+
+        Args:
+            store (ArticleStore): Source of articles
+            page_size (int): Rows read per page
+
+        Returns:
+            int: Number of newly indexed articles
+        """
+        added = 0
+        while True:
+            rows = store.articles_after(self.store_rowid, limit=page_size)
+            if not rows:
+                break
+            added += self.add_articles(article for _, article in rows)
+            self.store_rowid = rows[-1][0]
+        if added:
+            self.save()
+        return added
+
+    def save(self) -> None:
+        """Write index and mapping via temp files + rename so readers never see partial files"""
+        with self._lock:
+            if self.index is None:
+                return
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            index_tmp = f"{self.index_path}.tmp"
+            mapping_tmp = f"{self.mapping_path}.tmp"
+            faiss.write_index(self.index, index_tmp)
+            with open(mapping_tmp, "wb") as f:
+                pickle.dump({
+                    "model": self.embedder.model_name,
+                    "dim": self.index.d,
+                    "store_rowid": self.store_rowid,
+                    "articles": self.articles,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(index_tmp, self.index_path)
+            # Mapping goes last: an index briefly ahead of its mapping only has unmapped ids
+            os.replace(mapping_tmp, self.mapping_path)
+        logger.info(f"Saved FAISS index with {self.size} articles")
+
+    def search(self, query: np.ndarray, k: int) -> Tuple[List[int], Optional[np.ndarray]]:
+        """
+        Nearest indexed articles to a query, with their stored vectors
+
+        Holds the store lock: HNSW does not support searching while the
+        refresh thread adds vectors or swaps in a writable index.
+
+        Args:
+            query (np.ndarray): One normalized query embedding, shape (1, dim)
+            k (int): Number of neighbours to fetch
+
+        Returns:
+            Tuple[List[int], np.ndarray]: Vector ids in rank order and their vectors (None if no hits)
+        """
+        with self._lock:
+            _, ids = self.index.search(query, k)
+            found = [int(i) for i in ids[0] if i >= 0 and int(i) in self.articles]
+            if not found:
+                return [], None
+            return found, np.vstack([self.index.reconstruct(i) for i in found])
+
+    def get_article(self, vector_id: int) -> Optional[Dict]:
+        return self.articles.get(vector_id)
+
+    def _new_index(self):
+        hnsw = faiss.IndexHNSWFlat(self.embedder.dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        hnsw.hnsw.efConstruction = 80
+        hnsw.hnsw.efSearch = 64
+        return faiss.IndexIDMap2(hnsw)
+
+    def _load(self) -> None:
+        # The repo ships zero-byte placeholders; treat them as "no index yet"
+        if not _nonempty(self.index_path) or not _nonempty(self.mapping_path):
+            self.index = self._new_index()
+            return
+        with open(self.mapping_path, "rb") as f:
+            mapping = pickle.load(f)
+        if mapping.get("model") != self.embedder.model_name or mapping.get("dim") != self.embedder.dim:
+            logger.warning("Saved FAISS index was built with a different model; starting a new index")
+            self.index = self._new_index()
+            return
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+        self.index = faiss.read_index(self.index_path, mmap_flag | faiss.IO_FLAG_READ_ONLY)
+        self._mmapped = True
+        self.articles = mapping["articles"]
+        self.store_rowid = mapping.get("store_rowid", 0)
+        self.ids_by_key = {
+            (article.get("article_id") or article.get("link")): vector_id
+            for vector_id, article in self.articles.items()
+        }
+        logger.info(f"Memory-mapped FAISS index with {self.size} articles")
+
+    def _ensure_writable(self) -> None:
+        # Memory-mapped codes are read-only; adding to them would abort inside FAISS
+        if self._mmapped:
+            self.index = faiss.read_index(self.index_path)
+            self._mmapped = False
+
+
+def _nonempty(path: str) -> bool:
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+
+if __name__ == "__main__":
+    from backend.article_store import ArticleStore
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    faiss_store = FaissStore(NewsEmbedder())
+    added = faiss_store.sync_from_store(ArticleStore())
+    logger.info(f"Embedded {added} new articles; index holds {faiss_store.size}")
@@ -1,9 +1,45 @@
-import google.generativeai as genai
 import os
+import threading
 
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+# "gemini" calls the API; "local" uses ask_local_stub so Q&A works offline and in tests
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+
+_llm_override = None
+_genai = None
+_genai_lock = threading.Lock()
+
+def get_genai():
+    # Imported and configured on first use so importing this module has no side effects
+    global _genai
+    if _genai is None:
+        with _genai_lock:
+            if _genai is None:
+                import google.generativeai as genai
+                genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+                _genai = genai
+    return _genai
 
 def ask_gemini(question):
-    model = genai.GenerativeModel('gemini-2.5-flash')
+    model = get_genai().GenerativeModel('gemini-2.5-flash')
     response = model.generate_content(question)
     return response.text
+
+def ask_local_stub(question):
+    # Echo the first retrieved context line instead of calling a model
+    if "Context:" not in question:
+        return "I could not find related news."
+    context = question.split("Context:", 1)[1].strip()
+    first_line = next((line.strip() for line in context.splitlines() if line.strip()), "")
+    if first_line.startswith("[") and "]" in first_line:
+        first_line = first_line.split("]", 1)[1].strip()
+    return f"Based on recent news: {first_line}" if first_line else "I could not find related news."
+
+def set_llm(llm):
+    """Replace the LLM used by get_llm() (pass None to restore the configured backend)"""
+    global _llm_override
+    _llm_override = llm
+
+def get_llm():
+    if _llm_override is not None:
+        return _llm_override
+    return ask_local_stub if LLM_BACKEND == "local" else ask_gemini
@@ -0,0 +1,185 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional, Tuple
+
+LOG_FILE = os.getenv("LOG_FILE", "echonews.log")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", "3"))
+# Per call site: at most LOG_SAMPLE_BURST INFO/DEBUG records every LOG_SAMPLE_WINDOW seconds
+LOG_SAMPLE_BURST = int(os.getenv("LOG_SAMPLE_BURST", "10"))
+LOG_SAMPLE_WINDOW = float(os.getenv("LOG_SAMPLE_WINDOW", "60"))
+LOG_QUEUE_SIZE = 10000
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed via extra= and goes into the JSON
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_TRACEBACKS = logging.Formatter()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_setup_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, call site, extras and traceback."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limit chatty INFO/DEBUG call sites; warnings and errors always pass.
+
+    Records are keyed by call site (logger, file, line), not by message
+    text, so f-string messages that differ per article still share one
+    budget. The first record let through after a suppressed run carries
+    the number it replaced as "suppressed".
+    """
+
+    def __init__(self, burst: int = LOG_SAMPLE_BURST, window: float = LOG_SAMPLE_WINDOW):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        # call site -> [window start, records passed, records suppressed]
+        self._sites: Dict[Tuple[str, str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.burst <= 0:
+            return True
+        site = (record.name, record.pathname, record.lineno)
+        now = record.created
+        with self._lock:
+            state = self._sites.get(site)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self._sites[site] = [now, 1, 0]
+            elif state[1] < self.burst:
+                state[1] += 1
+                suppressed = 0
+            else:
+                state[2] += 1
+                return False
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller and keeps tracebacks out of the message text."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (they may change later) and render the traceback once; formatting
+        # into the final layout is left to the listener thread
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _TRACEBACKS.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # A stalled disk must not stall the script thread: drop instead of blocking
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging(log_file: Optional[str] = LOG_FILE, level: str = LOG_LEVEL,
+                      max_bytes: int = LOG_MAX_BYTES, backups: int = LOG_BACKUPS,
+                      burst: int = LOG_SAMPLE_BURST, window: float = LOG_SAMPLE_WINDOW,
+                      console: bool = True) -> QueueListener:
+    """
+    Route all logging through a queue to a background writer thread
+
+    The root logger gets a single QueueHandler, so a log call on the
+    Streamlit script thread only samples the record and enqueues it. A
+    QueueListener thread formats and writes: JSON lines to a size-rotated
+    file and plain text to the console. Safe to call on every rerun; only
+    the first call installs the handlers.
+
+    Args:
+        log_file (str): JSON log path, or None for console only
+        level (str): Root log level
+        max_bytes (int): Rotate the log file at this size
+        backups (int): Rotated files to keep
+        burst (int): INFO/DEBUG records per call site per window (0 disables sampling)
+        window (float): Sampling window in seconds
+        console (bool): Also write plain-text lines to stderr
+
+    Returns:
+        QueueListener: The running listener
+    """
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+        handlers = []
+        if log_file:
+            if os.path.dirname(log_file):
+                os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backups,
+                                               encoding="utf-8", delay=True)
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+            handlers.append(console_handler)
+
+        log_queue = queue.Queue(LOG_QUEUE_SIZE)
+        queue_handler = _NonBlockingQueueHandler(log_queue)
+        queue_handler.addFilter(SamplingFilter(burst, window))
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+
+        _queue_handler = queue_handler
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the writer thread and detach the queue handler"""
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _queue_handler is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+            _queue_handler = None
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
@@ -0,0 +1,326 @@
+import functools
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("METRICS", "1") != "0"
+# Prometheus scrape endpoint, independent of the audio server; loopback by default
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9464"))
+# Seconds; spans cache hits (ms) to cold gTTS renders and newsdata.io timeouts
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Cache stats fields (see AudioCache.stats, ResponseCache.stats) exported as request counts
+_CACHE_RESULTS = ("hits", "memory_hits", "disk_hits", "stale_hits", "coalesced", "misses")
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(tuple(str(labels[name]) for name in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {value:g}" for key, value in values]
+
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels; observations are O(log buckets)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][slot] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(tuple(str(labels[name]) for name in self.labelnames))
+            return series[2] if series else 0
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation inside its bucket
+
+        Args:
+            q (float): Quantile in [0, 1]
+
+        Returns:
+            float: Estimated value, or None without observations
+        """
+        with self._lock:
+            series = self._series.get(tuple(str(labels[name]) for name in self.labelnames))
+            if not series or not series[2]:
+                return None
+            counts, total = list(series[0]), series[2]
+        rank = q * total
+        seen = 0
+        for slot, in_bucket in enumerate(counts):
+            if in_bucket and seen + in_bucket >= rank:
+                if slot == len(self.buckets):
+                    # Above the last bound, like Prometheus' histogram_quantile
+                    return self.buckets[-1]
+                lower = self.buckets[slot - 1] if slot else 0.0
+                return lower + (self.buckets[slot] - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+        return self.buckets[-1]
+
+    def label_sets(self) -> List[LabelValues]:
+        with self._lock:
+            return sorted(self._series)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, (list(value[0]), value[1], value[2])) for key, value in self._series.items())
+        lines = []
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, in_bucket in zip(bounds, counts):
+                cumulative += in_bucket
+                labels = _labels(self.labelnames, key, 'le="' + bound + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {total:.6f}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metrics, rendered in the Prometheus text exposition format.
+
+    Caches are not instrumented directly: their existing stats() methods are
+    registered once and read at scrape time, so hit ratios cost nothing on
+    the hot path.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._caches: Dict[str, Callable[[], Dict]] = {}
+        self._lock = threading.Lock()
+        logger.info("MetricsRegistry initialized")
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def register_cache(self, name: str, stats: Callable[[], Dict]) -> None:
+        """Export a cache's stats() (hit/miss counts and hit_ratio) under cache=name"""
+        with self._lock:
+            self._caches[name] = stats
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            caches = sorted(self._caches.items())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        if caches:
+            cache_stats = []
+            for name, stats in caches:
+                try:
+                    cache_stats.append((name, stats()))
+                except Exception as e:
+                    logger.error(f"Error reading stats of cache '{name}': {str(e)}")
+            lines.append("# HELP echonews_cache_requests_total Cache lookups by result")
+            lines.append("# TYPE echonews_cache_requests_total counter")
+            for name, values in cache_stats:
+                for result in _CACHE_RESULTS:
+                    if result in values:
+                        lines.append(f'echonews_cache_requests_total{{cache="{_escape(name)}",result="{result}"}} '
+                                     f'{values[result]}')
+            lines.append("# HELP echonews_cache_hit_ratio Share of cache lookups served without recomputing")
+            lines.append("# TYPE echonews_cache_hit_ratio gauge")
+            for name, values in cache_stats:
+                lines.append(f'echonews_cache_hit_ratio{{cache="{_escape(name)}"}} {values.get("hit_ratio", 0.0):.6f}')
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, cls, name, documentation, labelnames, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, *args)
+            elif not isinstance(metric, cls) or metric.labelnames != labelnames:
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+
+REGISTRY = MetricsRegistry()
+STAGE_LATENCY = REGISTRY.histogram("echonews_stage_latency_seconds", "Latency of instrumented stages", ("stage",))
+STAGE_ERRORS = REGISTRY.counter("echonews_stage_errors_total", "Exceptions raised by instrumented stages", ("stage",))
+
+
+class timed:
+    """
+    Time a stage into STAGE_LATENCY and count its exceptions in STAGE_ERRORS.
+
+    Works as a context manager (``with timed("newsdata_http"):``) and as a
+    decorator (``@timed("fetch_news")``); each decorated call gets its own
+    timer, so it is safe across threads.
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.started = None
+
+    def __enter__(self) -> "timed":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        STAGE_LATENCY.observe(time.perf_counter() - self.started, stage=self.stage)
+        if exc_type is not None:
+            STAGE_ERRORS.inc(stage=self.stage)
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        stage = self.stage
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(stage):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def stage_summary() -> List[Dict]:
+    """Per-stage call count, error count and estimated p50/p95 in ms, slowest p95 first"""
+    rows = []
+    for (stage,) in STAGE_LATENCY.label_sets():
+        p50 = STAGE_LATENCY.quantile(0.5, stage=stage)
+        p95 = STAGE_LATENCY.quantile(0.95, stage=stage)
+        rows.append({
+            "stage": stage,
+            "calls": STAGE_LATENCY.count(stage=stage),
+            "errors": int(STAGE_ERRORS.get(stage=stage)),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        })
+    return sorted(rows, key=lambda row: row["p95_ms"] or 0, reverse=True)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    server_version = "EchoNewsMetrics/1.0"
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body: bool) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class MetricsServer:
+    """
+    Side HTTP listener answering Prometheus scrapes on /metrics.
+
+    Rendering happens per scrape on a daemon thread, so the Streamlit
+    script never pays for it.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = METRICS_HOST, port: int = METRICS_PORT):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._httpd = None
+        self._thread = None
+        logger.info("MetricsServer initialized")
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _MetricsRequestHandler)
+            self._httpd.daemon_threads = True
+            self._httpd.registry = self.registry
+            # Port 0 picks a free port; report the real one
+            self.port = self._httpd.server_address[1]
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics-server", daemon=True)
+            self._thread.start()
+            logger.info(f"Serving metrics on {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
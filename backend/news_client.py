@@ -0,0 +1,309 @@
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from backend.metrics import REGISTRY, STAGE_ERRORS, timed
+from backend.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeout for a single newsdata.io request, in seconds
+REQUEST_TIMEOUT = (float(os.getenv("NEWS_CONNECT_TIMEOUT", "3.05")), float(os.getenv("NEWS_READ_TIMEOUT", "10")))
+# Retries after the first attempt for 429/5xx responses and network errors
+NEWS_MAX_RETRIES = int(os.getenv("NEWS_MAX_RETRIES", "2"))
+NEWS_BACKOFF = 0.5
+NEWS_MAX_BACKOFF = 8.0
+# Consecutive failed requests that open the circuit, and seconds before a trial request
+NEWS_BREAKER_THRESHOLD = int(os.getenv("NEWS_BREAKER_THRESHOLD", "5"))
+NEWS_BREAKER_RESET = float(os.getenv("NEWS_BREAKER_RESET", "30"))
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Upper bound for a whole multi-topic fetch, in seconds
+FETCH_DEADLINE = 12.0
+MAX_WORKERS = 10
+# Seconds a newsdata.io response is served fresh, then served stale while refreshing
+NEWS_CACHE_TTL = float(os.getenv("NEWS_CACHE_TTL", "60"))
+NEWS_CACHE_STALE_TTL = float(os.getenv("NEWS_CACHE_STALE_TTL", "300"))
+
+_client = None
+_client_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="news-fetch")
+
+response_cache = ResponseCache(ttl=NEWS_CACHE_TTL, stale_ttl=NEWS_CACHE_STALE_TTL)
+REGISTRY.register_cache("news_response", response_cache.stats)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without contacting the server while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `threshold` failures in a row the circuit opens and calls fail
+    fast for `reset_timeout` seconds; then a single trial call is let
+    through (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold: int = NEWS_BREAKER_THRESHOLD, reset_timeout: float = NEWS_BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def end_trial(self) -> None:
+        """Let another trial through if the current one ended without an outcome (e.g. interrupted)"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class NewsClient:
+    """
+    HTTP client for newsdata.io.
+
+    Uses one pooled keep-alive session, (connect, read) timeouts, bounded
+    exponential backoff with jitter on 429/5xx and network errors (honouring
+    Retry-After), and a circuit breaker so an outage fails fast instead of
+    tying up Streamlit workers.
+    """
+
+    def __init__(self, timeout: Tuple[float, float] = REQUEST_TIMEOUT, max_retries: int = NEWS_MAX_RETRIES,
+                 backoff: float = NEWS_BACKOFF, max_backoff: float = NEWS_MAX_BACKOFF,
+                 breaker: Optional[CircuitBreaker] = None, pool_size: int = MAX_WORKERS,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.sleep = sleep
+        self.requests_sent = 0
+        self.retries = 0
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        logger.info("NewsClient initialized")
+
+    def get_json(self, url: str, params: Optional[dict] = None) -> dict:
+        """
+        GET a JSON endpoint with retries
+
+        Args:
+            url (str): Endpoint URL
+            params (dict): Query parameters
+
+        Returns:
+            dict: Decoded JSON body
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            requests.RequestException: On non-retryable errors or when retries run out
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {url}; not sending request")
+        try:
+            return self._get_json(url, params)
+        finally:
+            # Every outcome is recorded below; this only frees a half-open trial on BaseException
+            self.breaker.end_trial()
+
+    def _get_json(self, url: str, params: Optional[dict]) -> dict:
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                self.requests_sent += 1
+                # Each attempt is timed on its own, so newsdata.io latency is not mixed with backoff sleeps
+                with timed("newsdata_http"):
+                    response = self.session.get(url, params=params, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    # Other statuses are not retried; only 4xx (bad key, bad params) spares the breaker
+                    response.raise_for_status()
+                    data = response.json()
+                    self.breaker.record_success()
+                    return data
+                STAGE_ERRORS.inc(stage="newsdata_http")
+                error = requests.HTTPError(f"{response.status_code} from {url}", response=response)
+                retry_after = _retry_after_seconds(response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else 0
+                if 400 <= status < 500:
+                    # Our fault, and newsdata.io answered: the upstream is healthy
+                    self.breaker.record_success()
+                else:
+                    # 501, 505, 520-style upstream failures count against the circuit
+                    STAGE_ERRORS.inc(stage="newsdata_http")
+                    self.breaker.record_failure()
+                raise
+            except Exception:
+                # Undecodable body, broken chunked transfer, other RequestException: a failure, not retried
+                self.breaker.record_failure()
+                raise
+
+            if attempt >= self.max_retries:
+                self.breaker.record_failure()
+                raise error
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt) * random.uniform(0.5, 1.0)
+            if retry_after is not None:
+                delay = min(self.max_backoff, retry_after)
+            attempt += 1
+            self.retries += 1
+            logger.warning(f"Retrying {url} in {delay:.2f}s (attempt {attempt}/{self.max_retries}): {str(error)}")
+            self.sleep(delay)
+
+    def iter_pages(self, url: str, params: dict, page: Optional[str] = None) -> Iterator[Tuple[List[dict], Optional[str]]]:
+        """
+        Follow newsdata.io nextPage cursors, one request per page
+
+        Pages are fetched lazily as the caller iterates, so only one page is
+        held in memory at a time; stop iterating to stop fetching.
+
+        Args:
+            url (str): Endpoint URL
+            params (dict): Query parameters for the first page
+            page (str): nextPage token to resume from
+
+        Yields:
+            Tuple[List[dict], str]: The page's articles and the token of the
+            next page (None on the last page)
+        """
+        while True:
+            query = dict(params, page=page) if page else params
+            data = self.get_json(url, query)
+            page = data.get("nextPage") or None
+            yield data.get("results") or [], page
+            if page is None:
+                return
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        # HTTP-date form: fall back to the computed backoff
+        return None
+
+
+def get_news_client() -> NewsClient:
+    """
+    Return the process-wide news client
+
+    Returns:
+        NewsClient: Client whose connection pool is sized for the fetch workers
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = NewsClient()
+    return _client
+
+
+def get_json(url: str, params: dict, on_fetch: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    GET a JSON endpoint through the shared response cache
+
+    Identical (url, params) requests from any session within the TTL are
+    served from memory, and concurrent misses share one HTTP call.
+
+    Args:
+        url (str): Endpoint URL
+        params (dict): Query parameters
+        on_fetch (Callable): Called with the body after each real HTTP fetch
+            (not on cache hits), e.g. to ingest articles
+
+    Returns:
+        dict: Decoded JSON body
+
+    Raises:
+        requests.RequestException: On network errors or non-2xx responses
+    """
+    def fetch():
+        data = get_news_client().get_json(url, params)
+        if on_fetch is not None:
+            try:
+                on_fetch(data)
+            except Exception as e:
+                logger.error(f"Error in on_fetch hook for {url}: {str(e)}")
+        return data
+
+    return response_cache.get_or_fetch(response_cache.make_key(url, params), fetch)
+
+
+def fetch_concurrently(fetch: Callable, items: Iterable, deadline: float = FETCH_DEADLINE) -> List[Tuple]:
+    """
+    Run fetch(item) for every item in parallel
+
+    Items that raise or do not finish before the deadline are skipped, so
+    callers always get whatever partial results are available.
+
+    Args:
+        fetch (Callable): Function called with a single item
+        items (Iterable): Items to fetch, e.g. topics
+        deadline (float): Seconds to wait for the whole batch
+
+    Returns:
+        List[Tuple]: (item, result) pairs in input order
+    """
+    futures = [(item, _executor.submit(fetch, item)) for item in items]
+    done, _ = wait([future for _, future in futures], timeout=deadline)
+    results = []
+    for item, future in futures:
+        if future not in done:
+            future.cancel()
+            logger.warning(f"Fetch for '{item}' missed the {deadline}s deadline")
+            continue
+        try:
+            results.append((item, future.result()))
+        except Exception as e:
+            logger.warning(f"Fetch for '{item}' failed: {str(e)}")
+    return results
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from backend.dedup import dedupe
+from backend.text_normalizer import normalize_many
+from backend.tts import TTSEngine, article_speech_text
+
+logger = logging.getLogger(__name__)
+
+PODCAST_DIR = "data/podcasts"
+PODCAST_MAX_STORIES = 10
+# Today's podcast is re-rendered at most this often (seconds) as more news is stored
+PODCAST_MAX_AGE = float(os.getenv("PODCAST_MAX_AGE", "3600"))
+
+# Languages without a script here get the English podcast, text and voice alike
+PODCAST_SCRIPT = {
+    "en": {
+        "date_format": "%B %d, %Y",
+        "intro": "Welcome to EchoNews. Here are the top headlines for {day}.",
+        "story": "Story {number}.",
+        "transition": "Next.",
+        "outro": "That's all for today. Thanks for listening to EchoNews.",
+    },
+    "ml": {
+        "date_format": "%d-%m-%Y",
+        "intro": "എക്കോന്യൂസിലേക്ക് സ്വാഗതം. {day} ലെ പ്രധാന വാർത്തകൾ ഇതാ.",
+        "story": "വാർത്ത {number}.",
+        "transition": "അടുത്തത്.",
+        "outro": "ഇന്നത്തെ വാർത്തകൾ ഇത്രമാത്രം. എക്കോന്യൂസ് കേട്ടതിന് നന്ദി.",
+    },
+}
+
+# Layer III tables indexed by the MP3 frame header fields
+_BITRATES = {
+    "1": [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    "2": [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def strip_id3(data: bytes) -> bytes:
+    """Drop ID3v2/ID3v1 tags so segments can be concatenated as bare MP3 frames"""
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        data = data[10 + size + footer:]
+    if len(data) >= 128 and data[-128:-125] == b"TAG":
+        data = data[:-128]
+    return data
+
+
+def mp3_duration(data: bytes) -> float:
+    """
+    Sum the playing time of the MPEG Layer III frames in data
+
+    Args:
+        data (bytes): MP3 data without ID3 tags
+
+    Returns:
+        float: Duration in seconds
+    """
+    duration = 0.0
+    i = 0
+    end = len(data) - 4
+    while i <= end:
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            i += 1
+            continue
+        version = (data[i + 1] >> 3) & 0x03
+        layer = (data[i + 1] >> 1) & 0x03
+        bitrate_index = data[i + 2] >> 4
+        rate_index = (data[i + 2] >> 2) & 0x03
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            i += 1
+            continue
+        bitrate = _BITRATES["1" if version == 3 else "2"][bitrate_index] * 1000
+        sample_rate = _SAMPLE_RATES[version][rate_index]
+        samples = 1152 if version == 3 else 576
+        padding = (data[i + 2] >> 1) & 0x01
+        frame_length = samples // 8 * bitrate // sample_rate + padding
+        duration += samples / sample_rate
+        i += max(frame_length, 1)
+    return duration
+
+
+class PodcastRenderer:
+    """
+    Renders one daily news podcast per date and language from the article store.
+
+    Intro, story and transition segments are synthesized in a single batch
+    (reusing cached clips), concatenated frame by frame without re-encoding,
+    and written as a content-versioned MP3 next to a JSON manifest that holds
+    the chapter index.
+    """
+
+    def __init__(self, article_store, engine: TTSEngine, cache=None,
+                 output_dir: str = PODCAST_DIR, max_stories: int = PODCAST_MAX_STORIES):
+        self.article_store = article_store
+        self.engine = engine
+        self.cache = cache
+        self.output_dir = output_dir
+        self.max_stories = max_stories
+        self._lock = threading.Lock()
+        os.makedirs(self.output_dir, exist_ok=True)
+        logger.info("PodcastRenderer initialized")
+
+    def manifest_path(self, day: date, lang: str = "en") -> str:
+        return os.path.join(self.output_dir, f"podcast_{day.isoformat()}_{lang}.json")
+
+    def audio_path(self, manifest: Dict) -> str:
+        return os.path.join(self.output_dir, manifest["file"])
+
+    def load_manifest(self, day: date, lang: str = "en") -> Optional[Dict]:
+        try:
+            with open(self.manifest_path(day, lang), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def ensure(self, day: date, lang: str = "en", max_age: Optional[float] = None) -> Optional[Dict]:
+        """
+        Return the day's podcast manifest, rendering it only if missing or older than max_age
+
+        Args:
+            day (date): Podcast date
+            lang (str): Language code
+            max_age (float): Re-render when the existing render is older than this many seconds
+
+        Returns:
+            Dict: Manifest, or None when there are no stored articles for the day
+        """
+        def is_fresh(manifest):
+            return manifest is not None and (max_age is None or time.time() - manifest["created_at"] < max_age)
+
+        manifest = self.load_manifest(day, lang)
+        if is_fresh(manifest):
+            return manifest
+        with self._lock:
+            # Another caller may have rendered it while we waited
+            manifest = self.load_manifest(day, lang)
+            if is_fresh(manifest):
+                return manifest
+            return self.render(day, lang) or manifest
+
+    def render(self, day: date, lang: str = "en") -> Optional[Dict]:
+        """
+        Render the podcast for a day and language
+
+        Args:
+            day (date): Podcast date
+            lang (str): Language code
+
+        Returns:
+            Dict: Manifest with file name, duration and chapters, or None if there is no news
+        """
+        # Over-fetch so stories filed under several feeds still leave max_stories distinct ones
+        articles = dedupe(self.article_store.articles_for_date(day, limit=self.max_stories * 2), limit=self.max_stories)
+        if not articles:
+            return None
+        speech_lang = lang if lang in PODCAST_SCRIPT else "en"
+        script = PODCAST_SCRIPT[speech_lang]
+        segments = [(script["intro"].format(day=day.strftime(script["date_format"])), "Intro", None)]
+        for number, article in enumerate(articles, start=1):
+            if number > 1:
+                segments.append((script["transition"], None, None))
+            text = f"{script['story'].format(number=number)} {article_speech_text(article)}"
+            segments.append((text, article.get("title") or f"Story {number}", article.get("article_id")))
+        segments.append((script["outro"], "Outro", None))
+
+        clips = self._synthesize(normalize_many([text for text, _, _ in segments], speech_lang), speech_lang)
+
+        parts = []
+        chapters = []
+        offset = 0
+        elapsed = 0.0
+        for (_, title, article_id), clip in zip(segments, clips):
+            clip = strip_id3(clip)
+            if title is not None:
+                chapters.append({
+                    "title": title,
+                    "article_id": article_id,
+                    "start": round(elapsed, 2),
+                    "offset": offset,
+                })
+            parts.append(clip)
+            offset += len(clip)
+            elapsed += mp3_duration(clip)
+        audio = b"".join(parts)
+
+        version = hashlib.sha256(audio).hexdigest()[:12]
+        manifest = {
+            "date": day.isoformat(),
+            "lang": lang,
+            "version": version,
+            "file": f"podcast_{day.isoformat()}_{lang}_{version}.mp3",
+            "bytes": len(audio),
+            "duration": round(elapsed, 2),
+            "engine": self.engine.voice_id,
+            "created_at": time.time(),
+            "chapters": chapters,
+        }
+        previous = self.load_manifest(day, lang)
+        _write_atomic(self.audio_path(manifest), audio)
+        _write_atomic(self.manifest_path(day, lang), json.dumps(manifest, indent=2).encode("utf-8"))
+        self._prune(day, lang, keep={manifest["file"], previous["file"] if previous else None})
+        logger.info(f"Rendered {lang} podcast for {day} ({len(articles)} stories, {elapsed:.0f}s)")
+        return manifest
+
+    def _synthesize(self, texts: List[str], lang: str) -> List[bytes]:
+        if self.cache is None:
+            return self.engine.synthesize_batch(texts, lang)
+        keys = [self.cache.make_key(text, lang, self.engine.voice_id) for text in texts]
+        clips = [self.cache.get(key) for key in keys]
+        missing = [i for i, clip in enumerate(clips) if clip is None]
+        # Transitions repeat, so only synthesize each distinct missing text once
+        unique = list(dict.fromkeys(texts[i] for i in missing))
+        if unique:
+            rendered = dict(zip(unique, self.engine.synthesize_batch(unique, lang)))
+            for i in missing:
+                clips[i] = rendered[texts[i]]
+                self.cache.put(keys[i], clips[i])
+        return clips
+
+    def _prune(self, day: date, lang: str, keep: set) -> None:
+        # Keep the previous version too so listeners mid-stream are not cut off
+        prefix = f"podcast_{day.isoformat()}_{lang}_"
+        for name in os.listdir(self.output_dir):
+            if name.startswith(prefix) and name.endswith(".mp3") and name not in keep:
+                try:
+                    os.remove(os.path.join(self.output_dir, name))
+                except OSError:
+                    pass
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    # Nightly job: python -m backend.podcast [YYYY-MM-DD] [lang ...]
+    import sys
+
+    from backend.article_store import ArticleStore
+    from backend.audio_cache import AudioCache
+    from backend.tts import get_tts_engine
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    day = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else datetime.now().date()
+    renderer = PodcastRenderer(ArticleStore(), get_tts_engine(), AudioCache())
+    for lang in sys.argv[2:] or ["en"]:
+        result = renderer.render(day, lang)
+        logger.info(f"{lang}: {result['file'] if result else 'no stored news for this date'}")
@@ -0,0 +1,131 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Off by default: a cycle makes one newsdata.io request per job (latest + every
+# topic), since cycles are far longer than the response cache's TTL
+PREFETCH_ENABLED = os.getenv("NEWS_PREFETCH", "0") == "1"
+# Seconds between refresh cycles; every 3 hours, the app's 11 jobs make 88 requests a day
+PREFETCH_INTERVAL = float(os.getenv("NEWS_PREFETCH_INTERVAL", "10800"))
+# newsdata.io requests per day for the API key (200 on the free plan), split
+# across the processes/replicas that share it. Each process gets a 25th of its
+# share per hour: a full bucket plus 24 hours of refill never exceeds the quota.
+# Only real HTTP requests are charged (see RateBudget.charge); cache hits are free
+NEWS_DAILY_QUOTA = int(os.getenv("NEWS_DAILY_QUOTA", "200"))
+NEWS_REPLICAS = max(1, int(os.getenv("NEWS_REPLICAS", "1")))
+REQUEST_BUDGET_PER_HOUR = max(1, NEWS_DAILY_QUOTA // NEWS_REPLICAS // 25)
+
+
+class RateBudget:
+    """Token bucket allowing `capacity` calls per `period` seconds"""
+
+    def __init__(self, capacity: int, period: float = 3600.0):
+        self.capacity = capacity
+        self.period = period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Whether a call could be made now, without spending a token"""
+        with self._lock:
+            self._refill()
+            return self._tokens >= 1
+
+    def charge(self, calls: int = 1) -> None:
+        """Spend tokens for calls already made; the balance may go negative until it refills"""
+        with self._lock:
+            self._refill()
+            self._tokens -= calls
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.capacity / self.period)
+        self._updated = now
+
+
+class PrefetchScheduler:
+    """
+    Background thread that periodically runs fetch jobs ahead of demand.
+
+    Each job is a (name, callable) pair. Results are handed to on_result so
+    the caller can warm further caches (e.g. TTS), and after_cycle runs once
+    per cycle for batch work such as indexing. Jobs only run while the rate
+    budget has tokens, but running a job does not spend one: the budget is
+    charged for real HTTP requests (RateBudget.charge, e.g. from an on_fetch
+    hook), so jobs answered by the response cache cost nothing. When the
+    budget runs out mid-cycle, the next cycle resumes with the skipped jobs.
+    """
+
+    def __init__(self, jobs: List[Tuple[str, Callable[[], Any]]],
+                 interval: float = PREFETCH_INTERVAL,
+                 budget: Optional[RateBudget] = None,
+                 on_result: Optional[Callable[[str, Any], None]] = None,
+                 after_cycle: Optional[Callable[[], Any]] = None):
+        self.jobs = list(jobs)
+        self.interval = interval
+        self.budget = budget or RateBudget(REQUEST_BUDGET_PER_HOUR)
+        self.on_result = on_result
+        self.after_cycle = after_cycle
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self._next = 0
+        self._stop = threading.Event()
+        self._thread = None
+        logger.info("PrefetchScheduler initialized")
+
+    def start(self) -> "PrefetchScheduler":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="news-prefetch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_once(self) -> int:
+        """
+        Run one refresh cycle
+
+        Returns:
+            int: Number of jobs that ran
+        """
+        ran = 0
+        for _ in range(len(self.jobs)):
+            if self._stop.is_set():
+                break
+            if not self.budget.available():
+                self.skipped += len(self.jobs) - ran
+                logger.info("Prefetch rate budget exhausted; resuming next cycle")
+                break
+            name, job = self.jobs[self._next]
+            self._next = (self._next + 1) % len(self.jobs)
+            ran += 1
+            try:
+                result = job()
+                self.completed += 1
+                if self.on_result is not None:
+                    self.on_result(name, result)
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"Prefetch job '{name}' failed: {str(e)}")
+        return ran
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.run_once()
+            if self.after_cycle is not None:
+                try:
+                    self.after_cycle()
+                except Exception as e:
+                    logger.warning(f"Prefetch after_cycle hook failed: {str(e)}")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
@@ -0,0 +1,113 @@
+import random
+import re
+import zlib
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+
+from backend.metrics import timed
+
+ENTITY_QUESTION = "<b>Which key person/place/number is mentioned in today's news?</b>"
+TOPIC_QUESTION = "<b>What is the main topic of one of today's news items?</b>"
+QUESTION_TEXT = {"entity": ENTITY_QUESTION, "topic": TOPIC_QUESTION}
+NUM_DISTRACTORS = 3
+# Random corpus positions tried per distractor before giving up on a full option set
+_DRAWS_PER_DISTRACTOR = 8
+
+# Month names are capitalized words too, so a separate month pattern could never match first
+_CAPITALIZED = re.compile(r'\b[A-Z][a-z]+\b')
+_YEAR = re.compile(r'\b\d{4}\b')
+
+
+@lru_cache(maxsize=8192)
+def extract_entity_simple(text):
+    match = _CAPITALIZED.search(text) or _YEAR.search(text)
+    return match.group() if match else None
+
+
+def article_entity(article) -> Optional[str]:
+    """Quiz entity of an article's title and description, cached by text"""
+    return extract_entity_simple(f"{article.get('title') or ''} {article.get('description') or ''}")
+
+
+def topic_word(article) -> Optional[str]:
+    words = (article.get('title') or '').split()
+    return words[0] if words else None
+
+
+def daily_seed(day: Optional[date] = None, scope: str = "") -> int:
+    """
+    Seed shared by every quiz built for one day (and scope, e.g. a topic)
+
+    Args:
+        day (date): Quiz date, today by default
+        scope (str): Optional sub-key such as a topic
+
+    Returns:
+        int: Seed that is stable across processes
+    """
+    day = day or date.today()
+    return zlib.crc32(f"{day.isoformat()}:{scope}".encode("utf-8"))
+
+
+def _sample_distractors(articles: Sequence, skip: int, correct: str, pick: Callable,
+                        rng: random.Random) -> List[str]:
+    # Probe a few random positions instead of scanning the corpus; on small
+    # corpora the probes cover every article, so no distractor is missed
+    probes = min(len(articles), NUM_DISTRACTORS * _DRAWS_PER_DISTRACTOR)
+    distractors = []
+    for j in rng.sample(range(len(articles)), probes):
+        if j == skip:
+            continue
+        candidate = pick(articles[j])
+        if candidate and candidate != correct and candidate not in distractors:
+            distractors.append(candidate)
+            if len(distractors) == NUM_DISTRACTORS:
+                break
+    return distractors
+
+
+def build_questions(articles: Sequence, num_questions: int = 3, seed: Optional[int] = None) -> List[Dict]:
+    """
+    Multiple-choice questions on the first num_questions articles
+
+    Entities are extracted lazily, only for the question articles and the
+    sampled distractor candidates, so the cost depends on num_questions and
+    not on the corpus size. The same articles and seed give the same quiz.
+
+    Args:
+        articles (Sequence): Articles or raw article dicts, newest first
+        num_questions (int): Questions to build
+        seed (int): Seed for distractor choice and option order, e.g. daily_seed()
+
+    Returns:
+        List[Dict]: Questions with "kind", "question", "options", "answer" and source "article_id"
+    """
+    rng = random.Random(seed)
+    questions = []
+    for i, art in enumerate(articles[:num_questions]):
+        title = art.get('title') or ''
+        desc = art.get('description') or ''
+        ent = article_entity(art)
+        if ent and ent in (desc or title):
+            kind, correct, pick = "entity", ent, article_entity
+        else:
+            kind, correct, pick = "topic", topic_word(art) or "News", topic_word
+        opts = [correct] + _sample_distractors(articles, i, correct, pick, rng)
+        rng.shuffle(opts)
+        questions.append({
+            "kind": kind,
+            "question": QUESTION_TEXT[kind],
+            "options": opts,
+            "answer": correct,
+            "article_id": art.get('article_id') or art.get('link'),
+        })
+    return questions
+
+
+@timed("generate_quiz")
+def generate_quiz_from_articles(articles, num_questions=3, seed=None):
+    questions = build_questions(articles, num_questions, seed)
+    return ([q["question"] for q in questions],
+            [q["options"] for q in questions],
+            [q["answer"] for q in questions])
@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+from backend.dedup import dedupe
+from backend.quiz import QUESTION_TEXT, build_questions, daily_seed
+
+logger = logging.getLogger(__name__)
+
+QUIZ_BANK_DB_PATH = os.getenv("QUIZ_BANK_DB_PATH", "data/quiz_bank.db")
+# Questions banked per day and topic, and stored articles they are drawn from
+QUIZ_BANK_SIZE = 10
+QUIZ_SOURCE_ARTICLES = 50
+QUIZ_PAGE_SIZE = 5
+
+# topic "" is the all-news quiz. The question text is stored as its kind
+# and the answer as an index into the JSON options, so a row stays ~100 bytes
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quiz_questions (
+    quiz_day   TEXT NOT NULL,
+    topic      TEXT NOT NULL,
+    position   INTEGER NOT NULL,
+    kind       TEXT NOT NULL,
+    options    TEXT NOT NULL,
+    answer     INTEGER NOT NULL,
+    article_id TEXT,
+    PRIMARY KEY (quiz_day, topic, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS quiz_builds (
+    quiz_day   TEXT NOT NULL,
+    topic      TEXT NOT NULL,
+    built_at   REAL NOT NULL,
+    questions  INTEGER NOT NULL,
+    sources    INTEGER NOT NULL,
+    PRIMARY KEY (quiz_day, topic)
+) WITHOUT ROWID;
+"""
+
+
+class QuizBank:
+    """
+    SQLite (WAL) store of prebuilt quizzes, keyed by day and topic.
+
+    A day's quiz is built from the article store with the day's seed, so
+    every aspirant gets the same questions and reading a page is a
+    primary-key range scan with no news fetch. Once built, a day is frozen:
+    only build_daily_bank (the nightly job) rewrites it, so articles
+    ingested during the day do not change the quiz under readers.
+    """
+
+    def __init__(self, db_path: str = QUIZ_BANK_DB_PATH):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        logger.info("QuizBank initialized")
+
+    def build(self, day: date, articles: Iterable, topic: Optional[str] = None,
+              num_questions: int = QUIZ_BANK_SIZE, sources: Optional[int] = None) -> int:
+        """
+        Build (or rebuild) the quiz of a day and topic
+
+        Args:
+            day (date): Quiz date
+            articles (Iterable): Source articles, newest first
+            topic (str): Category, or None for all news
+            num_questions (int): Questions to bank
+            sources (int): Stored articles of the day and topic, if more than were passed
+
+        Returns:
+            int: Number of questions stored (0 without articles, keeping any earlier build)
+        """
+        topic = (topic or "").lower()
+        articles = list(articles)
+        # One question per story, even when several outlets covered it
+        questions = build_questions(dedupe(articles), num_questions, seed=daily_seed(day, topic))
+        rows = [
+            (day.isoformat(), topic, position, q["kind"],
+             json.dumps(q["options"], ensure_ascii=False, separators=(",", ":")),
+             q["options"].index(q["answer"]), q["article_id"])
+            for position, q in enumerate(questions)
+        ]
+        if not rows:
+            # Nothing stored yet: leave any earlier quiz alone and let a later call build it
+            return 0
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM quiz_questions WHERE quiz_day = ? AND topic = ?", (day.isoformat(), topic))
+            self._conn.executemany(
+                "INSERT INTO quiz_questions (quiz_day, topic, position, kind, options, answer, article_id)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quiz_builds (quiz_day, topic, built_at, questions, sources)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (day.isoformat(), topic, time.time(), len(rows), sources if sources is not None else len(articles)),
+            )
+        logger.info(f"Banked {len(rows)} quiz questions for {day}" + (f" ({topic})" if topic else ""))
+        return len(rows)
+
+    def ensure(self, store, day: date, topic: Optional[str] = None) -> List[Dict]:
+        """
+        First page of a day's quiz, building it only if it was never built
+
+        Args:
+            store (ArticleStore): Source of the day's articles
+            day (date): Quiz date
+            topic (str): Category, or None for all news
+
+        Returns:
+            List[Dict]: Questions, empty if nothing was stored for that day
+        """
+        # A built day is never rewritten here, so the quiz stays the same for the whole day
+        if not self.is_built(day, topic):
+            _build_from_store(store, self, day, topic)
+        return self.questions(day, topic)
+
+    def built_from(self, day: date, topic: Optional[str] = None) -> Optional[int]:
+        """Stored articles the current build was made from, or None if it was never built"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sources FROM quiz_builds WHERE quiz_day = ? AND topic = ?", (day.isoformat(), (topic or "").lower())
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_built(self, day: date, topic: Optional[str] = None) -> bool:
+        return self.built_from(day, topic) is not None
+
+    def questions(self, day: date, topic: Optional[str] = None, page: int = 0,
+                  page_size: int = QUIZ_PAGE_SIZE) -> List[Dict]:
+        """
+        One page of a banked quiz
+
+        Args:
+            day (date): Quiz date
+            topic (str): Category, or None for all news
+            page (int): Zero-based page number
+            page_size (int): Questions per page
+
+        Returns:
+            List[Dict]: Questions with "kind", "question", "options", "answer" and source "article_id"
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, options, answer, article_id FROM quiz_questions"
+                " WHERE quiz_day = ? AND topic = ? ORDER BY position LIMIT ? OFFSET ?",
+                (day.isoformat(), (topic or "").lower(), page_size, max(page, 0) * page_size),
+            ).fetchall()
+        questions = []
+        for kind, options, answer, article_id in rows:
+            options = json.loads(options)
+            questions.append({
+                "kind": kind,
+                "question": QUESTION_TEXT[kind],
+                "options": options,
+                "answer": options[answer],
+                "article_id": article_id,
+            })
+        return questions
+
+    def count(self, day: date, topic: Optional[str] = None) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM quiz_questions WHERE quiz_day = ? AND topic = ?",
+                (day.isoformat(), (topic or "").lower()),
+            ).fetchone()[0]
+
+    def topics(self, day: date) -> List[str]:
+        """Topics banked for a day; "" is the all-news quiz"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT topic FROM quiz_builds WHERE quiz_day = ? ORDER BY topic", (day.isoformat(),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _build_from_store(store, bank: QuizBank, day: date, topic: Optional[str]) -> int:
+    sources = store.count_for_date(day, topic)
+    return bank.build(day, store.articles_for_date(day, category=topic, limit=QUIZ_SOURCE_ARTICLES), topic,
+                      sources=sources)
+
+
+def build_daily_bank(store, bank: QuizBank, day: date, topics: Iterable[Optional[str]] = (None,)) -> Dict[str, int]:
+    """
+    Bank the quizzes of a day from the article store
+
+    Args:
+        store (ArticleStore): Source of the day's articles
+        bank (QuizBank): Destination bank
+        day (date): Quiz date
+        topics (Iterable[str]): Categories to bank; None is the all-news quiz
+
+    Returns:
+        Dict[str, int]: Questions banked per topic
+    """
+    return {topic or "": _build_from_store(store, bank, day, topic) for topic in topics}
+
+
+if __name__ == "__main__":
+    # Nightly job: python -m backend.quiz_bank [YYYY-MM-DD] [topic ...]
+    import sys
+
+    from backend.article_store import ArticleStore
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    day = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else datetime.now().date()
+    built = build_daily_bank(ArticleStore(), QuizBank(), day, [None] + sys.argv[2:])
+    for topic, count in built.items():
+        logger.info(f"{topic or 'all news'}: {count} questions")
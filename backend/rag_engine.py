@@ -1,4 +1,181 @@
-from langchain_community.document_loaders import UnstructuredURLLoader
-urls = ['https://www.victoriaonmove.com.au/local-removalists.html','https://victoriaonmove.com.au/index.html','https://victoriaonmove.com.au/contact.html']
-loader = UnstructuredURLLoader(urls=urls)
-data = loader.load() 
\ No newline at end of file
+import logging
+import os
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from backend.genai_helper import get_llm
+from backend.metrics import timed
+
+if TYPE_CHECKING:
+    import numpy as np
+    from backend.embedder import FaissStore
+
+# numpy, faiss and sentence-transformers are imported inside the functions that
+# need them, so importing this module stays cheap for the Streamlit cold start
+
+logger = logging.getLogger(__name__)
+
+RAG_TOP_K = int(os.getenv("RAG_TOP_K", "4"))
+# Candidates pulled from FAISS before MMR picks the final top-k
+RAG_FETCH_K = int(os.getenv("RAG_FETCH_K", "20"))
+# 1.0 ranks purely by relevance, lower values favour diverse articles
+RAG_MMR_LAMBDA = float(os.getenv("RAG_MMR_LAMBDA", "0.6"))
+# Rough context budget in characters (~4 characters per token)
+RAG_CONTEXT_CHARS = int(os.getenv("RAG_CONTEXT_CHARS", "4000"))
+
+NO_CONTEXT_ANSWER = "I couldn't find any news related to your question yet."
+
+
+def mmr_select(query: "np.ndarray", candidates: "np.ndarray", k: int, lambda_mult: float) -> List[int]:
+    """
+    Maximal marginal relevance over normalized vectors
+
+    Args:
+        query (np.ndarray): Query vector, shape (d,)
+        candidates (np.ndarray): Candidate vectors, shape (n, d)
+        k (int): Number of candidates to keep
+        lambda_mult (float): Relevance/diversity trade-off in [0, 1]
+
+    Returns:
+        List[int]: Selected candidate positions in rank order
+    """
+    import numpy as np
+
+    n = len(candidates)
+    if n == 0:
+        return []
+    relevance = candidates @ query
+    redundancy = np.zeros(n, dtype="float32")
+    available = np.ones(n, dtype=bool)
+    selected = []
+    for _ in range(min(k, n)):
+        scores = np.where(available, lambda_mult * relevance - (1 - lambda_mult) * redundancy, -np.inf)
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, candidates @ candidates[best])
+    return selected
+
+
+class RAGEngine:
+    """
+    Question answering over the local FAISS news index.
+
+    Retrieval is top-k HNSW search followed by MMR re-ranking; the selected
+    articles are packed into a character budget and passed to a pluggable
+    LLM callable (Gemini by default, see genai_helper.get_llm).
+    """
+
+    def __init__(self, faiss_store: Optional["FaissStore"] = None, llm: Optional[Callable[[str], str]] = None,
+                 article_store=None, top_k: int = RAG_TOP_K, fetch_k: int = RAG_FETCH_K,
+                 mmr_lambda: float = RAG_MMR_LAMBDA, context_chars: int = RAG_CONTEXT_CHARS):
+        if faiss_store is None:
+            from backend.embedder import FaissStore, NewsEmbedder
+            faiss_store = FaissStore(NewsEmbedder())
+        self.faiss_store = faiss_store
+        self.llm = llm or get_llm()
+        self.article_store = article_store
+        self.top_k = top_k
+        self.fetch_k = fetch_k
+        self.mmr_lambda = mmr_lambda
+        self.context_chars = context_chars
+        logger.info("RAGEngine initialized")
+
+    def refresh_index(self) -> int:
+        """Embed articles ingested since the last refresh"""
+        if self.article_store is None:
+            return 0
+        return self.faiss_store.sync_from_store(self.article_store)
+
+    @timed("rag_retrieve")
+    def retrieve(self, question: str, k: Optional[int] = None) -> List[Dict]:
+        """
+        Find the articles most relevant to a question
+
+        Args:
+            question (str): User question
+            k (int): Number of articles to return (defaults to top_k)
+
+        Returns:
+            List[Dict]: Articles in rank order
+        """
+        k = k or self.top_k
+        store = self.faiss_store
+        if store.size == 0:
+            return []
+        query = store.embedder.encode([question])
+        # Searched under the store lock, as the prefetch thread may be adding to the index
+        candidate_ids, vectors = store.search(query, max(k, self.fetch_k))
+        if not candidate_ids:
+            return []
+        order = mmr_select(query[0], vectors, k, self.mmr_lambda)
+        return [store.get_article(candidate_ids[i]) for i in order]
+
+    def build_context(self, articles: List[Dict]) -> str:
+        """Pack articles into the context budget, truncating the last one that fits partially"""
+        from backend.embedder import article_text
+
+        parts = []
+        remaining = self.context_chars
+        for i, article in enumerate(articles):
+            line = f"[{i + 1}] {article_text(article)}"
+            if len(line) > remaining:
+                if remaining > 80:
+                    parts.append(line[:remaining - 3] + "...")
+                break
+            parts.append(line)
+            remaining -= len(line) + 1
+        return "\n".join(parts)
+
+    def answer_question(self, question: str, news: Optional[Dict] = None) -> str:
+        """
+        Answer a question about a specific news item, backed by related articles
+
+        Args:
+            question (str): User question
+            news (Dict): News item the user is listening to, if any
+
+        Returns:
+            str: Answer text
+        """
+        articles = self.retrieve(question)
+        if news:
+            current = {
+                "title": news.get("title", ""),
+                "description": news.get("summary") or news.get("description", ""),
+            }
+            articles = [current] + [a for a in articles if a.get("title") != current["title"]]
+        if not articles:
+            return NO_CONTEXT_ANSWER
+        prompt = (
+            "Answer the question using only the news below. Be brief and cite items as [n].\n\n"
+            f"Question: {question}\n\nContext:\n{self.build_context(articles)}"
+        )
+        return self._ask(prompt)
+
+    def answer_general_question(self, question: str) -> str:
+        """
+        Answer a general current-affairs question, using related news when available
+
+        Args:
+            question (str): User question
+
+        Returns:
+            str: Answer text
+        """
+        articles = self.retrieve(question)
+        if articles:
+            prompt = (
+                "Answer the question. Use the news below when it is relevant and cite it as [n].\n\n"
+                f"Question: {question}\n\nContext:\n{self.build_context(articles)}"
+            )
+        else:
+            prompt = f"Answer the question briefly.\n\nQuestion: {question}"
+        return self._ask(prompt)
+
+    def _ask(self, prompt: str) -> str:
+        try:
+            with timed("rag_llm"):
+                return self.llm(prompt)
+        except Exception as e:
+            logger.error(f"Error calling LLM: {str(e)}")
+            return "Sorry, I couldn't generate an answer right now."
@@ -0,0 +1,71 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class RerunCost:
+    """
+    Counts the expensive work done by one Streamlit script run.
+
+    Counters are plain names such as "http_requests", "tts_chunks" or
+    "cache_misses". Work handed to worker threads is attributed by capturing
+    the RerunCost on the script thread (see current_run) and calling add()
+    from the worker.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counts.get(name, 0)
+
+    def finish(self) -> "RerunCost":
+        self.finished = time.perf_counter()
+        return self
+
+    @property
+    def elapsed_ms(self) -> float:
+        return ((self.finished or time.perf_counter()) - self.started) * 1000
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["elapsed_ms"] = round(self.elapsed_ms, 1)
+        return counts
+
+    def summary(self) -> str:
+        counts = self.as_dict()
+        elapsed = counts.pop("elapsed_ms")
+        work = ", ".join(f"{value} {name.replace('_', ' ')}" for name, value in sorted(counts.items()))
+        return f"{elapsed:.0f} ms" + (f" ({work})" if work else " (no network or TTS work)")
+
+
+def begin_run() -> RerunCost:
+    """Start counting for the script run on the current thread"""
+    _local.run = RerunCost()
+    return _local.run
+
+
+def current_run() -> Optional[RerunCost]:
+    """RerunCost of the script run on this thread, None on background threads"""
+    return getattr(_local, "run", None)
+
+
+def record(name: str, amount: int = 1) -> None:
+    """Add to the current run's counter; a no-op outside script runs (e.g. prefetch)"""
+    run = current_run()
+    if run is not None:
+        run.add(name, amount)
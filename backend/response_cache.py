@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """A fetch in progress that concurrent callers can wait on"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResponseCache:
+    """
+    Process-wide TTL cache for API responses.
+
+    Fresh entries are served directly. Entries past their TTL but inside the
+    stale window are served immediately while one background refresh runs
+    (stale-while-revalidate). Concurrent misses for the same key share a
+    single in-flight fetch.
+    """
+
+    def __init__(self, ttl: float = 60.0, stale_ttl: float = 300.0, max_entries: int = 512):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> Hashable:
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fetch at most once per miss
+
+        Args:
+            key (Hashable): Key from make_key
+            fetch (Callable): Loads the value; exceptions are not cached
+
+        Returns:
+            Any: Cached or freshly fetched value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                age = now - stored_at
+                if age < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if age < self.ttl + self.stale_ttl:
+                    self.stale_hits += 1
+                    if key not in self._inflight:
+                        self._inflight[key] = _Flight()
+                        threading.Thread(
+                            target=self._run, args=(key, fetch, self._inflight[key]),
+                            name="cache-refresh", daemon=True
+                        ).start()
+                    return value
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = _Flight()
+                leader = True
+                self.misses += 1
+            else:
+                leader = False
+                self.coalesced += 1
+        if leader:
+            self._run(key, fetch, flight)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            served = self.hits + self.stale_hits + self.coalesced
+            total = served + self.misses
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "coalesced": self.coalesced,
+                "misses": self.misses,
+                "hit_ratio": served / total if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def _run(self, key: Hashable, fetch: Callable[[], Any], flight: _Flight) -> None:
+        try:
+            flight.value = fetch()
+            with self._lock:
+                self._entries[key] = (time.monotonic(), flight.value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        except Exception as e:
+            flight.error = e
+            logger.warning(f"Fetch for {key[0] if isinstance(key, tuple) else key} failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
@@ -0,0 +1,313 @@
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_ONES = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+         "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
+_TENS = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
+_SCALES = [(10 ** 9, "billion"), (10 ** 6, "million"), (1000, "thousand")]
+_ORDINALS = {"one": "first", "two": "second", "three": "third", "five": "fifth", "eight": "eighth",
+             "nine": "ninth", "twelve": "twelfth"}
+_MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August",
+           "September", "October", "November", "December"]
+
+_CURRENCIES = {"₹": "rupees", "$": "dollars", "€": "euros", "£": "pounds",
+               "Rs": "rupees", "INR": "rupees", "USD": "dollars"}
+_SCALE_WORDS = {"cr": "crore", "crore": "crore", "lakh": "lakh", "k": "thousand", "thousand": "thousand",
+                "mn": "million", "million": "million", "bn": "billion", "billion": "billion",
+                "trillion": "trillion"}
+# Case-sensitive on purpose: "no." or "sat." at a sentence end must stay as is
+_ABBREVIATIONS = {
+    "Dr": "Doctor", "Mr": "Mister", "Mrs": "Missus", "Ms": "Miss", "Prof": "Professor", "St": "Saint",
+    "Govt": "Government", "Dept": "Department", "Gen": "General", "Lt": "Lieutenant", "Col": "Colonel",
+    "Capt": "Captain", "Jr": "Junior", "Sr": "Senior", "vs": "versus", "Vs": "Versus", "Approx": "Approximately",
+    "Jan": "January", "Feb": "February", "Mar": "March", "Apr": "April", "Jun": "June", "Jul": "July",
+    "Aug": "August", "Sep": "September", "Sept": "September", "Oct": "October", "Nov": "November",
+    "Dec": "December",
+}
+
+_NUMBER = r"\d{1,3}(?:,\d{2,3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+# The rest of a number whose first digit has already been consumed
+_NUMBER_TAIL = r"\d{0,2}(?:,\d{2,3})+(?:\.\d+)?|\d*(?:\.\d+)?"
+_SCALE = r"crore|cr|lakh|thousand|k|million|mn|billion|bn|trillion"
+# Symbols the TTS voices would read out. Combining marks (e.g. Malayalam vowel
+# signs) are not \w in Python's re and must be kept explicitly.
+_DROP_CHAR = r"""[^\w\s.,;:!?'"̀-ͯऀ-෿-]"""
+# Lower-case letters (except the v of "vs"), capitals that start no
+# abbreviation and kept punctuation can never begin a rewrite
+_INERT = r"""a-uw-zBEHKQTVWXYZ.,;:!?'"\-"""
+# Start of a word: the character before the consumed first character is not \w
+_WORD_START = r"(?<!\w.)"
+
+# Single pass: the pattern opens with one character class, so the regex
+# engine skips inert text in C and only tries the branches below at
+# candidate characters. Each branch re-checks the consumed character with a
+# lookbehind. Branch order matters: dates, money and percentages must win
+# over bare numbers, and all of them over dropping their symbols.
+_SPEECH_PATTERN = re.compile(
+    r"[^" + _INERT + r"](?:"
+    r"(?<=\x1e)(?P<sep>)"
+    r"|(?<=\d)" + _WORD_START + r"(?P<iso>\d{3}-\d{1,2}-\d{1,2})\b"
+    r"|(?<=\d)" + _WORD_START + r"(?P<dmy>\d?/\d{1,2}/\d{4})\b"
+    r"|(?<=\d)" + _WORD_START + r"(?P<num>" + _NUMBER_TAIL + r")(?:(?P<pct> ?%)|\b)"
+    r"|(?<=[₹$€£])(?P<symbol_money> ?(?P<symbol_amount>" + _NUMBER + r")(?: ?(?P<symbol_scale>" + _SCALE + r")\b)?)"
+    r"|(?<=[RIU])" + _WORD_START + r"(?P<code_money>(?P<code>(?<=R)s|(?<=I)NR|(?<=U)SD)\b\.? ?"
+    r"(?P<code_amount>" + _NUMBER + r")(?: ?(?P<code_scale>" + _SCALE + r")\b)?)"
+    r"|(?<=[A-Za-z])" + _WORD_START + r"(?P<abbr>[a-z]{1,4})\.(?= ?\w)"
+    r"|(?<=" + _DROP_CHAR + r")(?P<drop>" + _DROP_CHAR + r"*[^\S\x1e]*)"
+    r"|(?<=[^\S\x1e])(?P<space>[^\S\x1e]+)"
+    r"|(?<=[^\S \x1e])(?P<space_char>)"
+    r")"
+)
+# Non-English voices read digits natively, so only strip symbols and whitespace
+_CLEAN_PATTERN = re.compile(
+    r"""[^\w.,;:!?'"̀-ͯऀ-෿\-](?:"""
+    r"(?<=\x1e)(?P<sep>)"
+    r"|(?<=" + _DROP_CHAR + r")(?P<drop>" + _DROP_CHAR + r"*[^\S\x1e]*)"
+    r"|(?<=[^\S\x1e])(?P<space>[^\S\x1e]+)"
+    r"|(?<=[^\S \x1e])(?P<space_char>)"
+    r")"
+)
+
+_LAST_WORD = re.compile(r"[a-z]+$")
+_DATE_PARTS = re.compile(r"[-/]")
+
+# Joins texts in normalize_many; never produced by a replacement
+_SEPARATOR = "\x1e"
+
+
+def number_to_words(number: int) -> str:
+    """
+    Spell out a non-negative integer in English
+
+    Args:
+        number (int): Value below one trillion
+
+    Returns:
+        str: e.g. "one hundred twenty thousand"
+    """
+    if number < 20:
+        return _ONES[number]
+    if number < 100:
+        tens, ones = divmod(number, 10)
+        return _TENS[tens] + (f"-{_ONES[ones]}" if ones else "")
+    if number < 1000:
+        hundreds, rest = divmod(number, 100)
+        return f"{_ONES[hundreds]} hundred" + (f" {number_to_words(rest)}" if rest else "")
+    for value, name in _SCALES:
+        if number >= value:
+            head, rest = divmod(number, value)
+            return f"{number_to_words(head)} {name}" + (f" {number_to_words(rest)}" if rest else "")
+    return str(number)
+
+
+def _ordinal(number: int) -> str:
+    words = number_to_words(number)
+    last = _LAST_WORD.search(words)
+    word = last.group()
+    if word in _ORDINALS:
+        word = _ORDINALS[word]
+    elif word.endswith("y"):
+        word = word[:-1] + "ieth"
+    else:
+        word += "th"
+    return words[:last.start()] + word
+
+
+def _year(year: int) -> str:
+    # "twenty twenty-four", but "two thousand five"
+    if 1100 <= year <= 1999 or 2010 <= year <= 2099:
+        century, rest = divmod(year, 100)
+        if rest == 0:
+            return f"{number_to_words(century)} hundred"
+        return f"{number_to_words(century)} {'oh ' if rest < 10 else ''}{number_to_words(rest)}"
+    return number_to_words(year)
+
+
+@lru_cache(maxsize=2048)
+def _spoken_number(text: str) -> str:
+    digits = text.replace(",", "")
+    whole, _, fraction = digits.partition(".")
+    if len(whole) > 12:
+        return digits
+    value = int(whole)
+    # Bare four-digit numbers in news copy are overwhelmingly years
+    words = _year(value) if len(whole) == 4 and "," not in text and not fraction else number_to_words(value)
+    if fraction:
+        words += " point " + " ".join(_ONES[int(d)] for d in fraction)
+    return words
+
+
+def _spoken_date(year: str, month: str, day: str, original: str) -> str:
+    month, day = int(month), int(day)
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return " ".join(_spoken_number(part) for part in _DATE_PARTS.split(original))
+    return f"{_MONTHS[month - 1]} {_ordinal(day)}, {_year(int(year))}"
+
+
+def _spoken_money(amount: str, scale: Optional[str], unit: str) -> str:
+    scale = f" {_SCALE_WORDS[scale]}" if scale else ""
+    return f"{_spoken_number(amount)}{scale} {unit}"
+
+
+def _dropped(match: "re.Match") -> str:
+    # Keep one space if the symbols separated two words ("a — b"), none if
+    # whitespace before them already did
+    text = match.group()
+    start = match.start()
+    if not text[-1].isspace() or (start and match.string[start - 1].isspace()):
+        return ""
+    return " "
+
+
+def _replace(match: "re.Match") -> str:
+    kind = match.lastgroup
+    if kind == "space" or kind == "space_char":
+        return " "
+    if kind == "drop":
+        return _dropped(match)
+    if kind == "sep":
+        return _SEPARATOR
+    if kind == "num":
+        return _spoken_number(match.group())
+    if kind == "pct":
+        return f"{_spoken_number(match.group().rstrip('% '))} percent"
+    if kind == "symbol_money":
+        return _spoken_money(match.group("symbol_amount"), match.group("symbol_scale"),
+                             _CURRENCIES[match.group()[0]])
+    if kind == "code_money":
+        code = match.group()[0] + match.group("code")
+        return _spoken_money(match.group("code_amount"), match.group("code_scale"), _CURRENCIES[code])
+    if kind == "abbr":
+        word = match.group()[:-1]
+        if word == "No" and match.string[match.end():match.end() + 2].strip()[:1].isdigit():
+            return "number"
+        # Expanding also removes the period the sentence splitter would break on
+        return _ABBREVIATIONS.get(word, match.group())
+    text = match.group()
+    year, month, day = (text[:4], text[5:].split("-")[0], text.rsplit("-", 1)[1]) if kind == "iso" else \
+        (text[-4:], text.split("/")[1], text.split("/")[0])
+    return _spoken_date(year, month, day, text)
+
+
+def _clean(match: "re.Match") -> str:
+    kind = match.lastgroup
+    if kind == "drop":
+        return _dropped(match)
+    if kind == "sep":
+        return _SEPARATOR
+    return " "
+
+
+@lru_cache(maxsize=4096)
+def normalize_for_speech(text: str, lang: str = "en") -> str:
+    """
+    Clean and verbalize text for speech synthesis in one regex pass
+
+    Strips symbols the voices would read aloud, collapses whitespace and,
+    for English, expands numbers, dates, money, percentages and common
+    abbreviations. Results are memoized because Streamlit reruns normalize
+    the same summaries over and over.
+
+    Args:
+        text (str): Raw text
+        lang (str): Language code (en, ml)
+
+    Returns:
+        str: Speakable text
+    """
+    text = text.replace(_SEPARATOR, " ")
+    if lang == "en":
+        return _SPEECH_PATTERN.sub(_replace, text).strip()
+    return _CLEAN_PATTERN.sub(_clean, text).strip()
+
+
+def normalize_many(texts: List[str], lang: str = "en") -> List[str]:
+    """
+    Normalize a batch of texts for speech
+
+    Duplicates (shared headlines, repeated podcast transitions) are
+    normalized once, and the distinct texts are joined and scanned by the
+    compiled pattern in a single call.
+
+    Args:
+        texts (List[str]): Raw texts
+        lang (str): Language code (en, ml)
+
+    Returns:
+        List[str]: Speakable texts in the same order
+    """
+    if not texts:
+        return []
+    unique = list(dict.fromkeys(texts))
+    joined = _SEPARATOR.join(text.replace(_SEPARATOR, " ") for text in unique)
+    if lang == "en":
+        joined = _SPEECH_PATTERN.sub(_replace, joined)
+    else:
+        joined = _CLEAN_PATTERN.sub(_clean, joined)
+    normalized = dict(zip(unique, (text.strip() for text in joined.split(_SEPARATOR))))
+    return [normalized[text] for text in texts]
+
+
+def sample_corpus(articles: int = 2000) -> List[str]:
+    """Synthetic news paragraphs with the numbers, money and dates typical of the feed"""
+    templates = [
+        "Govt. approves ₹1,20,000 crore package for MSMEs; Dr. Rao says growth will hit 7.5% by 2025.",
+        "Sensex jumps 1,245 points to 73,850 on 08/02/2024 as FII inflows top $2.3 bn.",
+        "ISRO's launch on 2024-02-17 carried 3 satellites weighing 2,275 kg into orbit!",
+        "Mr. Sharma vs. the State: SC hears plea on No. 14 — verdict expected in Nov.",
+        "RBI keeps repo rate at 6.5%; inflation eases to 5.1% in January (lowest in 4 months).",
+        "Monsoon rainfall 12% above normal, IMD says; Kerala receives 2,134 mm so far. #Weather",
+    ]
+    return [f"{templates[i % len(templates)]} Update {i}: {templates[(i * 7) % len(templates)]}"
+            for i in range(articles)]
+
+
+def benchmark(texts: List[str], repeat: int = 5) -> Dict[str, float]:
+    """
+    Measure normalizer throughput
+
+    Args:
+        texts (List[str]): Corpus to normalize
+        repeat (int): Timed passes per variant (best is reported)
+
+    Returns:
+        Dict[str, float]: MB/s for the previous two-pass cleaner (symbols and
+        whitespace only, no expansion), the single-pass normalizer without
+        and with its memo cache (the Streamlit rerun case) and normalize_many
+    """
+    megabytes = sum(len(text.encode("utf-8")) for text in texts) / 1e6
+
+    def legacy(text):
+        text = re.sub(r'[^\w\s.,;:!?\'\"-]', '', text, flags=re.UNICODE)
+        return re.sub(r'\s+', ' ', text).strip()
+
+    variants = {
+        "legacy_two_pass": lambda: [legacy(text) for text in texts],
+        "single_pass": lambda: [normalize_for_speech.__wrapped__(text) for text in texts],
+        "single_pass_cached": lambda: [normalize_for_speech(text) for text in texts],
+        "normalize_many": lambda: normalize_many(texts),
+    }
+    results = {}
+    for name, run in variants.items():
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        results[name] = megabytes / best
+    return results
+
+
+if __name__ == "__main__":
+    # Micro-benchmark: python -m backend.text_normalizer
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    corpus = sample_corpus()
+    size = sum(len(text.encode("utf-8")) for text in corpus) / 1e6
+    logger.info(f"Corpus: {len(corpus)} texts, {size:.2f} MB")
+    for name, throughput in benchmark(corpus).items():
+        logger.info(f"{name:>18}: {throughput:8.2f} MB/s")
@@ -0,0 +1,270 @@
+import io
+import logging
+import os
+import re
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+
+from backend.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+# "gtts" (Google, online) or "espeak" (espeak-ng, fully offline)
+TTS_ENGINE = os.getenv("TTS_ENGINE", "gtts")
+
+# gTTS splits requests at ~100 characters anyway; a couple of sentences per chunk
+# keeps the first chunk quick while limiting request count
+TTS_CHUNK_CHARS = 200
+# Shared by all sessions, so this also caps concurrent calls to the TTS service
+TTS_WORKERS = 8
+
+_SENTENCE_END = re.compile(r'(?<=[.!?;:])\s+')
+_executor = ThreadPoolExecutor(max_workers=TTS_WORKERS, thread_name_prefix="tts")
+
+
+class TTSEngine(ABC):
+    """
+    Text-to-speech backend producing MP3 bytes.
+
+    Every engine returns MP3 so cached clips, streamed chunks and podcast
+    segments can be concatenated frame by frame regardless of the engine.
+    """
+
+    name = "base"
+
+    @property
+    def voice_id(self) -> str:
+        """Identifies engine + voice in cache keys"""
+        return self.name
+
+    @abstractmethod
+    def synthesize(self, text: str, lang: str = "en") -> bytes:
+        """
+        Synthesize one text
+
+        Args:
+            text (str): Cleaned text
+            lang (str): Language code (en, ml)
+
+        Returns:
+            bytes: MP3 audio
+        """
+
+    def synthesize_batch(self, texts: List[str], lang: str = "en") -> List[bytes]:
+        """
+        Synthesize many texts in one call
+
+        Args:
+            texts (List[str]): Cleaned texts, e.g. the day's headlines
+            lang (str): Language code (en, ml)
+
+        Returns:
+            List[bytes]: MP3 audio in the same order as texts
+        """
+        return list(_executor.map(lambda text: self.synthesize(text, lang), texts))
+
+
+class GTTSEngine(TTSEngine):
+    """Google Translate TTS; needs network access"""
+
+    name = "gtts"
+
+    def __init__(self, tld: str = "com"):
+        self.tld = tld
+
+    @property
+    def voice_id(self) -> str:
+        return self.tld
+
+    def synthesize(self, text: str, lang: str = "en") -> bytes:
+        from gtts import gTTS  # imported on first synthesis to keep cold start fast
+        buffer = io.BytesIO()
+        gTTS(text, lang=lang, tld=self.tld).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakEngine(TTSEngine):
+    """
+    Offline espeak-ng voice, encoded to MP3 with lame or ffmpeg.
+
+    Runs entirely on local CPU, so it has no rate limits and suits
+    overnight batch rendering.
+    """
+
+    name = "espeak"
+
+    def __init__(self, voice: Optional[str] = None, words_per_minute: int = 165, bitrate_kbps: int = 64):
+        self.binary = shutil.which("espeak-ng") or shutil.which("espeak")
+        if self.binary is None:
+            raise RuntimeError("espeak-ng is not installed")
+        if shutil.which("lame"):
+            self.encoder = ["lame", "--quiet", "-b", str(bitrate_kbps), "-", "-"]
+        elif shutil.which("ffmpeg"):
+            self.encoder = ["ffmpeg", "-loglevel", "error", "-f", "wav", "-i", "pipe:0",
+                            "-f", "mp3", "-b:a", f"{bitrate_kbps}k", "pipe:1"]
+        else:
+            raise RuntimeError("EspeakEngine needs lame or ffmpeg to produce MP3")
+        self.voice = voice
+        self.words_per_minute = words_per_minute
+        self.batch_workers = os.cpu_count() or 2
+
+    @property
+    def voice_id(self) -> str:
+        return f"espeak:{self.voice or 'default'}:{self.words_per_minute}"
+
+    def synthesize(self, text: str, lang: str = "en") -> bytes:
+        wav = subprocess.run(
+            [self.binary, "-v", self.voice or lang, "-s", str(self.words_per_minute), "--stdout", "--stdin"],
+            input=text.encode("utf-8"), capture_output=True, check=True, timeout=120,
+        ).stdout
+        return subprocess.run(self.encoder, input=wav, capture_output=True, check=True, timeout=120).stdout
+
+    def synthesize_batch(self, texts: List[str], lang: str = "en") -> List[bytes]:
+        # CPU bound in child processes, so one worker per core
+        with ThreadPoolExecutor(max_workers=self.batch_workers, thread_name_prefix="espeak") as pool:
+            return list(pool.map(lambda text: self.synthesize(text, lang), texts))
+
+
+def get_tts_engine(name: str = TTS_ENGINE) -> TTSEngine:
+    """
+    Build the configured TTS engine
+
+    Args:
+        name (str): "gtts" or "espeak"
+
+    Returns:
+        TTSEngine: Engine instance
+    """
+    if name == "espeak":
+        return EspeakEngine()
+    if name == "gtts":
+        return GTTSEngine()
+    raise ValueError(f"Unknown TTS engine: {name}")
+
+
+def precompute_audio(texts: List[str], engine: TTSEngine, cache, lang: str = "en") -> int:
+    """
+    Batch-render texts into the audio cache, skipping ones already cached
+
+    Args:
+        texts (List[str]): Cleaned texts
+        engine (TTSEngine): Engine to synthesize with
+        cache (AudioCache): Destination cache
+        lang (str): Language code
+
+    Returns:
+        int: Number of newly synthesized clips
+    """
+    keys = {cache.make_key(text, lang, engine.voice_id): text for text in texts if text}
+    missing = [(key, text) for key, text in keys.items() if cache.get(key) is None]
+    if not missing:
+        return 0
+    clips = engine.synthesize_batch([text for _, text in missing], lang)
+    for (key, _), clip in zip(missing, clips):
+        cache.put(key, clip)
+    logger.info(f"Precomputed {len(missing)} clips with {engine.name}")
+    return len(missing)
+
+
+def split_sentences(text: str, max_chars: int = TTS_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into speakable chunks at sentence boundaries
+
+    Consecutive short sentences are merged up to max_chars; a sentence longer
+    than max_chars is split at the last space that fits.
+
+    Args:
+        text (str): Cleaned text
+        max_chars (int): Target maximum chunk length
+
+    Returns:
+        List[str]: Chunks in reading order
+    """
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def stream_speech(text: str, synthesize: Callable[[str], bytes], cache=None,
+                  lang: str = "en", voice: str = "com",
+                  max_chars: int = TTS_CHUNK_CHARS) -> Iterator[bytes]:
+    """
+    Synthesize text chunk by chunk in parallel and yield MP3 data in order
+
+    MP3 frames are self-delimiting, so the yielded pieces can be played or
+    written back to back. The first piece is yielded as soon as it is ready,
+    regardless of how long the rest of the text is.
+
+    Args:
+        text (str): Cleaned text
+        synthesize (Callable): Turns one chunk of text into MP3 bytes
+        cache (AudioCache): Optional cache for per-chunk audio
+        lang (str): Language code, part of the cache key
+        voice (str): Voice identifier, part of the cache key
+        max_chars (int): Target maximum chunk length
+
+    Yields:
+        bytes: MP3 data for each chunk
+    """
+    def synthesize_timed(chunk):
+        with timed("tts_synthesize"):
+            return synthesize(chunk)
+
+    def render(chunk):
+        if cache is None:
+            return synthesize_timed(chunk)
+        return cache.get_or_create(cache.make_key(chunk, lang, voice), lambda: synthesize_timed(chunk))
+
+    futures = [_executor.submit(render, chunk) for chunk in split_sentences(text, max_chars)]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        # Consumer stopped early (or a chunk failed): drop work that has not started
+        for future in futures:
+            future.cancel()
+
+
+def article_speech_text(article) -> str:
+    title = (article.get("title") or "").strip()
+    description = (article.get("description") or "").strip()
+    return " ".join(f"{title}. {description}".split()).strip(". ")
+
+
+if __name__ == "__main__":
+    # Overnight job: python -m backend.tts [YYYY-MM-DD] renders every stored article of the day
+    import sys
+    from datetime import date
+
+    from backend.article_store import ArticleStore
+    from backend.audio_cache import AudioCache
+    from backend.text_normalizer import normalize_many
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    day = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else date.today()
+    articles = ArticleStore().articles_for_date(day, limit=10000)
+    texts = normalize_many([article_speech_text(a) for a in articles])
+    added = precompute_audio(texts, get_tts_engine(), AudioCache())
+    logger.info(f"Rendered {added} new clips for {len(articles)} articles on {day}")
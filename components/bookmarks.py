@@ -0,0 +1,52 @@
+import uuid
+
+import streamlit as st
+
+from backend.bookmark_store import BookmarkStore, bookmark_key
+
+
+@st.cache_resource
+def get_bookmark_store():
+    return BookmarkStore()
+
+
+def get_user_id():
+    # Kept in the URL (?user=...) so reopening the same link brings bookmarks back
+    if 'user_id' not in st.session_state:
+        params = getattr(st, "query_params", None)
+        user_id = params.get("user") if params is not None else None
+        if not user_id:
+            user_id = uuid.uuid4().hex[:12]
+            if params is not None:
+                params["user"] = user_id
+        st.session_state.user_id = user_id
+    return st.session_state.user_id
+
+
+def bookmark_ids():
+    # Loaded once per session, then updated in place by add/remove; membership checks are set lookups
+    if 'bookmark_ids' not in st.session_state:
+        st.session_state.bookmark_ids = get_bookmark_store().ids(get_user_id())
+    return st.session_state.bookmark_ids
+
+
+def bookmark_count():
+    # A COUNT(*) on the user index, so bookmarks added from other tabs are counted too
+    return get_bookmark_store().count(get_user_id())
+
+
+def add_bookmark(article):
+    key = bookmark_key(article)
+    ids = bookmark_ids()
+    if key in ids:
+        return False
+    added = get_bookmark_store().add(get_user_id(), article)
+    # Stored either way now: by this call, or earlier from another tab of the same user
+    ids.add(key)
+    return added
+
+
+def remove_bookmark(key):
+    removed = get_bookmark_store().remove(get_user_id(), key)
+    bookmark_ids().discard(key)
+    return removed
@@ -1,43 +1,23 @@
-import streamlit as st
-import streamlit.components.v1 as components
 import logging
-from typing import Dict, Optional
-import base64
-import os
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-class NewsPlayer:
-    def __init__(self):
-        self.audio_dir = "data/news"
-        logger.info("NewsPlayer initialized")
-    
-    def create_audio_player(self, news_data: Dict, language: str = "en") -> str:
-        """
-        Create an HTML audio player for news
-        
-        Args:
-            news_data (Dict): News article data
-            language (str): Language code (en, ml)
-            
-        Returns:
-            str: HTML audio player
-        """
-        try:
-            title = news_data.get("title", "News Article")
-            summary = news_data.get("summary", "")
-            source = news_data.get("source", "Unknown")
-            date = news_data.get("date", "")
-            
-            # Create voice-friendly text
-            voice_text = f"Here's the latest news. {title}. {summary}. This news comes from {source}."
-            
-            # Generate audio file path (mock for now)
-            audio_filename = f"news_{news_data.get('id', '1')}_{language}.mp3"
-            audio_path = os.path.join(self.audio_dir, audio_filename)
-            
-            # Create HTML player
-            html_content = f"""
+# Renders of identical content (e.g. the same headlines on every rerun) are
+# served from an LRU cache keyed by the content itself
+RENDER_CACHE_SIZE = 256
+
+# Templates are module constants, so the static HTML, CSS and JS is built once
+# at import; a render only formats the dynamic fields and joins the pieces
+
+_ERROR = """
+            <div style="color: red; padding: 10px; border: 1px solid red; border-radius: 5px;">
+                ❌ Error creating {component}: {error}
+            </div>
+            """
+
+_AUDIO_PLAYER = """
             <div style="margin: 20px 0; padding: 20px; background: linear-gradient(145deg, #f8f9fa 0%, #e9ecef 100%); border-radius: 15px; border-left: 5px solid #007bff;">
                 <h4 style="color: #2c3e50; margin-bottom: 15px;">🎧 Audio News Player</h4>
                 
@@ -50,8 +30,8 @@ class NewsPlayer:
                 </div>
                 
                 <div style="margin: 20px 0;">
-                    <audio controls style="width: 100%; height: 40px;">
-                        <source src="data:audio/mp3;base64," type="audio/mp3">
+                    <audio controls preload="metadata" style="width: 100%; height: 40px;">
+                        <source src="{audio_url}" type="audio/mp3">
                         Your browser does not support the audio element.
                     </audio>
                 </div>
@@ -63,27 +43,8 @@ class NewsPlayer:
                 </div>
             </div>
             """
-            
-            logger.info(f"Created audio player for news: '{title[:30]}...'")
-            return html_content
-            
-        except Exception as e:
-            logger.error(f"Error creating audio player: {str(e)}")
-            return f"""
-            <div style="color: red; padding: 10px; border: 1px solid red; border-radius: 5px;">
-                ❌ Error creating audio player: {str(e)}
-            </div>
-            """
-    
-    def create_voice_interaction_ui(self) -> str:
-        """
-        Create voice interaction UI component
-        
-        Returns:
-            str: HTML for voice interaction
-        """
-        try:
-            html_content = """
+
+_VOICE_INTERACTION_UI = """
             <div style="margin: 20px 0; padding: 20px; background: linear-gradient(145deg, #ffffff 0%, #f8f9fa 100%); border-radius: 15px; border: 2px solid #e9ecef;">
                 <h4 style="color: #2c3e50; margin-bottom: 15px;">🎤 Voice Interaction</h4>
                 
@@ -260,34 +221,10 @@ class NewsPlayer:
                 });
             </script>
             """
-            
-            logger.info("Created voice interaction UI")
-            return html_content
-            
-        except Exception as e:
-            logger.error(f"Error creating voice interaction UI: {str(e)}")
-            return f"""
-            <div style="color: red; padding: 10px; border: 1px solid red; border-radius: 5px;">
-                ❌ Error creating voice interaction UI: {str(e)}
-            </div>
-            """
-    
-    def create_daily_podcast_player(self, podcast_data: Dict) -> str:
-        """
-        Create a daily podcast player
-        
-        Args:
-            podcast_data (Dict): Podcast data
-            
-        Returns:
-            str: HTML podcast player
-        """
-        try:
-            title = podcast_data.get("title", "Daily News Podcast")
-            duration = podcast_data.get("duration", "5:00")
-            summary = podcast_data.get("summary", "")
-            
-            html_content = f"""
+
+_PODCAST_CHAPTER = '<li><a href="#" onclick="seekPodcast({start}); return false;" style="color: white;">{minutes}:{seconds:02d}</a> {title}</li>'
+
+_PODCAST_PLAYER = """
             <div style="margin: 20px 0; padding: 20px; background: linear-gradient(145deg, #667eea 0%, #764ba2 100%); border-radius: 15px; color: white;">
                 <h4 style="margin-bottom: 15px;">📻 Daily News Podcast</h4>
                 
@@ -298,92 +235,62 @@ class NewsPlayer:
                 </div>
                 
                 <div style="margin: 20px 0;">
-                    <audio controls style="width: 100%; height: 40px;">
-                        <source src="data:audio/mp3;base64," type="audio/mp3">
+                    <audio id="podcast-audio" controls preload="metadata" style="width: 100%; height: 40px;">
+                        <source src="{audio_url}" type="audio/mp3">
                         Your browser does not support the audio element.
                     </audio>
                 </div>
                 
+                <ol style="opacity: 0.9; line-height: 1.6; padding-left: 20px;">{chapter_items}</ol>
+                
                 <div style="margin-top: 15px;">
-                    <button onclick="downloadPodcast()" style="
+                    <a href="{audio_url}" download style="
                         padding: 8px 16px; 
                         background: rgba(255, 255, 255, 0.2); 
                         color: white; 
                         border: 1px solid rgba(255, 255, 255, 0.3); 
                         border-radius: 5px; 
-                        cursor: pointer;
+                        text-decoration: none;
                         font-size: 14px;
-                    ">📥 Download Podcast</button>
+                    ">📥 Download Podcast</a>
                 </div>
             </div>
             
             <script>
-            function downloadPodcast() {{
-                // Mock download functionality
-                alert("Download feature coming soon!");
+            function seekPodcast(seconds) {{
+                const audio = document.getElementById('podcast-audio');
+                audio.currentTime = seconds;
+                audio.play();
             }}
             </script>
             """
-            
-            logger.info("Created daily podcast player")
-            return html_content
-            
-        except Exception as e:
-            logger.error(f"Error creating podcast player: {str(e)}")
-            return f"""
-            <div style="color: red; padding: 10px; border: 1px solid red; border-radius: 5px;">
-                ❌ Error creating podcast player: {str(e)}
-            </div>
-            """
-    
-    def create_quiz_player(self, quiz_data: Dict) -> str:
-        """
-        Create a quiz player for MCQs
-        
-        Args:
-            quiz_data (Dict): Quiz data
-            
-        Returns:
-            str: HTML quiz player
-        """
-        try:
-            questions = quiz_data.get("questions", [])
-            
-            if not questions:
-                return """
+
+_QUIZ_EMPTY = """
                 <div style="color: #856404; padding: 10px; border: 1px solid #ffeaa7; border-radius: 5px; background: #fff3cd;">
                     No quiz questions available.
                 </div>
                 """
-            
-            html_content = """
+
+_QUIZ_HEADER = """
             <div style="margin: 20px 0; padding: 20px; background: linear-gradient(145deg, #f8f9fa 0%, #e9ecef 100%); border-radius: 15px; border-left: 4px solid #28a745;">
                 <h4 style="color: #2c3e50; margin-bottom: 15px;">🧠 Smart Quiz</h4>
             """
-            
-            for i, question in enumerate(questions):
-                question_text = question.get("question", "")
-                options = question.get("options", [])
-                correct_answer = question.get("correct_answer", 0)
-                explanation = question.get("explanation", "")
-                
-                html_content += f"""
+
+_QUIZ_QUESTION_HEAD = """
                 <div style="margin-bottom: 20px; padding: 15px; background: white; border-radius: 8px; border: 1px solid #dee2e6;">
-                    <h5 style="color: #495057; margin-bottom: 10px;">{question_text}</h5>
+                    <h5 style="color: #495057; margin-bottom: 10px;">{question}</h5>
                     
                     <div style="margin-bottom: 10px;">
                 """
-                
-                for j, option in enumerate(options):
-                    option_letter = chr(65 + j)  # A, B, C, D
-                    html_content += f"""
+
+_QUIZ_OPTION = """
                         <div style="margin: 5px 0;">
                             <input type="radio" name="q{i}" id="q{i}opt{j}" value="{j}">
                             <label for="q{i}opt{j}" style="margin-left: 5px; color: #495057;">{option_letter}) {option}</label>
                         </div>
                     """
-                
-                html_content += f"""
+
+_QUIZ_QUESTION_TAIL = """
                     </div>
                     
                     <button onclick="checkAnswer({i}, {correct_answer})" style="
@@ -402,8 +309,8 @@ class NewsPlayer:
                     </div>
                 </div>
                 """
-            
-            html_content += """
+
+_QUIZ_FOOTER = """
             </div>
             
             <script>
@@ -449,14 +356,143 @@ class NewsPlayer:
             }
             </script>
             """
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _audio_player_html(title, summary, source, date, audio_url) -> str:
+    # Logged on real renders only; memo hits on reruns stay silent
+    logger.debug(f"Created audio player for news: '{title[:30]}...'")
+    return _AUDIO_PLAYER.format(title=title, summary=summary, source=source, date=date, audio_url=audio_url)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _podcast_player_html(title, duration, summary, audio_url, chapters: Tuple) -> str:
+    logger.debug("Created daily podcast player")
+    chapter_items = "".join([
+        _PODCAST_CHAPTER.format(start=start, minutes=int(start) // 60, seconds=int(start) % 60, title=chapter_title)
+        for start, chapter_title in chapters
+    ])
+    return _PODCAST_PLAYER.format(title=title, duration=duration, summary=summary, audio_url=audio_url,
+                                  chapter_items=chapter_items)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _quiz_player_html(questions: Tuple) -> str:
+    logger.debug(f"Created quiz player with {len(questions)} questions")
+    # One list of pieces joined once: linear in the number of questions and options
+    parts = [_QUIZ_HEADER]
+    for i, (question, options, correct_answer, explanation) in enumerate(questions):
+        parts.append(_QUIZ_QUESTION_HEAD.format(question=question))
+        parts.extend([
+            _QUIZ_OPTION.format(i=i, j=j, option_letter=chr(65 + j), option=option)  # A, B, C, D
+            for j, option in enumerate(options)
+        ])
+        parts.append(_QUIZ_QUESTION_TAIL.format(i=i, correct_answer=correct_answer, explanation=explanation))
+    parts.append(_QUIZ_FOOTER)
+    return "".join(parts)
+
+
+class NewsPlayer:
+    def __init__(self, audio_base_url: Optional[str] = None):
+        self.audio_dir = "data/news"
+        self.audio_base_url = audio_base_url
+        logger.info("NewsPlayer initialized")
+    
+    def clip_url(self, key: str) -> str:
+        """
+        URL of a cached clip on the audio server
+        
+        Args:
+            key (str): AudioCache key (content hash) of the clip
+            
+        Returns:
+            str: Clip URL
+        """
+        return f"{self.audio_base_url}/clips/{key}.mp3"
+    
+    def create_audio_player(self, news_data: Dict, language: str = "en") -> str:
+        """
+        Create an HTML audio player for news
+        
+        Args:
+            news_data (Dict): News article data
+            language (str): Language code (en, ml)
+            
+        Returns:
+            str: HTML audio player
+        """
+        try:
+            title = news_data.get("title", "News Article")
+            summary = news_data.get("summary", "")
+            source = news_data.get("source", "Unknown")
+            date = news_data.get("date", "")
+            
+            # Reference the clip by content hash so browsers and CDNs can cache it and seek by range
+            audio_url = news_data.get("audio_url", "")
+            if not audio_url and news_data.get("audio_key") and self.audio_base_url:
+                audio_url = self.clip_url(news_data["audio_key"])
             
-            logger.info(f"Created quiz player with {len(questions)} questions")
-            return html_content
+            return _audio_player_html(title, summary, source, date, audio_url)
+            
+        except Exception as e:
+            logger.error(f"Error creating audio player: {str(e)}")
+            return _ERROR.format(component="audio player", error=str(e))
+    
+    def create_voice_interaction_ui(self) -> str:
+        """
+        Create voice interaction UI component
+        
+        Returns:
+            str: HTML for voice interaction
+        """
+        logger.debug("Created voice interaction UI")
+        return _VOICE_INTERACTION_UI
+    
+    def create_daily_podcast_player(self, podcast_data: Dict) -> str:
+        """
+        Create a daily podcast player
+        
+        Args:
+            podcast_data (Dict): Podcast data
+            
+        Returns:
+            str: HTML podcast player
+        """
+        try:
+            title = podcast_data.get("title", "Daily News Podcast")
+            duration = podcast_data.get("duration", "5:00")
+            summary = podcast_data.get("summary", "")
+            audio_url = podcast_data.get("audio_url", "")
+            chapters = podcast_data.get("chapters", [])
+            
+            chapters = tuple((chapter['start'], chapter['title']) for chapter in chapters)
+            return _podcast_player_html(title, duration, summary, audio_url, chapters)
+            
+        except Exception as e:
+            logger.error(f"Error creating podcast player: {str(e)}")
+            return _ERROR.format(component="podcast player", error=str(e))
+    
+    def create_quiz_player(self, quiz_data: Dict) -> str:
+        """
+        Create a quiz player for MCQs
+        
+        Args:
+            quiz_data (Dict): Quiz data
+            
+        Returns:
+            str: HTML quiz player
+        """
+        try:
+            questions = quiz_data.get("questions", [])
+            
+            if not questions:
+                return _QUIZ_EMPTY
+            
+            return _quiz_player_html(tuple(
+                (q.get("question", ""), tuple(q.get("options", [])), q.get("correct_answer", 0), q.get("explanation", ""))
+                for q in questions
+            ))
             
         except Exception as e:
             logger.error(f"Error creating quiz player: {str(e)}")
-            return f"""
-            <div style="color: red; padding: 10px; border: 1px solid red; border-radius: 5px;">
-                ❌ Error creating quiz player: {str(e)}
-            </div>
-            """ 
\ No newline at end of file
+            return _ERROR.format(component="quiz player", error=str(e)) 
\ No newline at end of file
@@ -244,6 +244,1318 @@ def test_news_player():
         logger.error(f"❌ News player test failed: {e}")
         return False
 
+def test_audio_cache():
+    """Test two-tier TTS audio cache"""
+    logger.info("Testing audio cache...")
+    
+    try:
+        import tempfile
+        from backend.audio_cache import AudioCache
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = AudioCache(cache_dir=cache_dir, max_memory_bytes=10, max_disk_bytes=20)
+            key = cache.make_key("Hello world", "en", "com")
+            assert key == AudioCache.make_key("Hello world", "en", "com"), "Key is not stable"
+            assert key != cache.make_key("Hello world", "ml", "com"), "Language not part of key"
+            
+            calls = []
+            synthesize = lambda: calls.append(1) or b"12345678"
+            assert cache.get_or_create(key, synthesize) == b"12345678"
+            assert cache.get_or_create(key, synthesize) == b"12345678"
+            assert len(calls) == 1, "Cached audio was synthesized twice"
+            
+            # A fresh instance must be served from the disk tier
+            reloaded = AudioCache(cache_dir=cache_dir, max_memory_bytes=10, max_disk_bytes=20)
+            assert reloaded.get(key) == b"12345678"
+            assert reloaded.stats()["disk_hits"] == 1
+            
+            # Size-based eviction keeps the disk tier under its budget
+            for i in range(5):
+                reloaded.put(reloaded.make_key(f"headline {i}"), b"12345678")
+            assert reloaded.stats()["disk_bytes"] <= 20, "Disk tier exceeded its budget"
+            assert reloaded.stats()["memory_bytes"] <= 10, "Memory tier exceeded its budget"
+        
+        logger.info(f"✅ Audio cache stats: {cache.stats()}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Audio cache test failed: {e}")
+        return False
+
+def test_concurrent_fetch():
+    """Test parallel topic fetch with partial results and a deadline"""
+    logger.info("Testing concurrent fetch...")
+    
+    try:
+        import time
+        from backend.news_client import fetch_concurrently
+        
+        def fake_fetch(topic):
+            if topic == "Broken":
+                raise RuntimeError("HTTP 500")
+            if topic == "Slow":
+                time.sleep(1.0)
+            else:
+                time.sleep(0.2)
+            return [{"title": f"{topic} headline"}]
+        
+        start = time.perf_counter()
+        results = fetch_concurrently(fake_fetch, ["Technology", "Broken", "Business", "Slow", "Space"], deadline=0.5)
+        elapsed = time.perf_counter() - start
+        
+        assert [topic for topic, _ in results] == ["Technology", "Business", "Space"], "Unexpected partial results"
+        assert elapsed < 0.8, f"Deadline not enforced ({elapsed:.2f}s)"
+        logger.info(f"✅ Fetched {len(results)} topics in {elapsed:.2f}s")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Concurrent fetch test failed: {e}")
+        return False
+
+def test_response_cache():
+    """Test TTL response cache with request coalescing"""
+    logger.info("Testing response cache...")
+    
+    try:
+        import threading
+        import time
+        from backend.response_cache import ResponseCache
+        
+        cache = ResponseCache(ttl=0.2, stale_ttl=1.0)
+        key = cache.make_key("https://newsdata.io/api/1/latest", {"size": 5, "language": "en"})
+        assert key == cache.make_key("https://newsdata.io/api/1/latest", {"language": "en", "size": 5})
+        
+        calls = []
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"results": [len(calls)]}
+        
+        # Concurrent identical misses share one fetch
+        threads = [threading.Thread(target=cache.get_or_fetch, args=(key, slow_fetch)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1, f"Expected one coalesced fetch, got {len(calls)}"
+        assert cache.get_or_fetch(key, slow_fetch) == {"results": [1]}
+        
+        # Stale entries are served immediately and refreshed in the background
+        time.sleep(0.25)
+        assert cache.get_or_fetch(key, slow_fetch) == {"results": [1]}
+        time.sleep(0.2)
+        assert cache.get_or_fetch(key, slow_fetch) == {"results": [2]}
+        
+        stats = cache.stats()
+        assert stats["misses"] == 1 and stats["hit_ratio"] > 0.8, f"Unexpected stats {stats}"
+        logger.info(f"✅ Response cache stats: {stats}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Response cache test failed: {e}")
+        return False
+
+def test_article_store():
+    """Test persistent article store with incremental ingestion"""
+    logger.info("Testing article store...")
+    
+    try:
+        import tempfile
+        from datetime import date
+        from backend.article_store import ArticleStore
+        
+        articles = [
+            {"article_id": "a1", "link": "https://example.com/1", "title": "ISRO launches satellite",
+             "description": "Launch from Sriharikota", "pubDate": "2024-02-08 09:00:00",
+             "category": ["science"], "keywords": ["isro", "space"]},
+            {"article_id": "a2", "link": "https://example.com/2", "title": "RBI keeps repo rate",
+             "description": "Repo rate unchanged", "pubDate": "2024-02-08 11:00:00",
+             "category": ["business"], "keywords": ["rbi"]},
+            {"article_id": "a3", "link": "https://example.com/3", "title": "Monsoon update",
+             "description": "", "pubDate": "2024-02-07 18:00:00", "category": ["environment"]},
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(os.path.join(tmp, "articles.db"))
+            assert store.ingest(articles, cursor="latest") == 3
+            # Re-ingesting the same page adds nothing
+            assert store.ingest(articles, cursor="latest") == 0
+            assert store.get_cursor("latest") == "2024-02-08 11:00:00"
+            
+            # Older items than the cursor are skipped; duplicate links are ignored
+            older = {"article_id": "a4", "link": "https://example.com/4", "pubDate": "2024-02-01 00:00:00"}
+            duplicate_link = {"article_id": "a5", "link": "https://example.com/2", "pubDate": "2024-02-09 00:00:00"}
+            assert store.ingest([older, duplicate_link], cursor="latest") == 0
+            
+            day = store.articles_for_date(date(2024, 2, 8))
+            assert [a["article_id"] for a in day] == ["a2", "a1"], "Date query returned wrong articles"
+            assert [a["article_id"] for a in store.articles_for_date(date(2024, 2, 8), category="Science")] == ["a1"]
+            assert [a["article_id"] for a in store.articles_for_keyword("ISRO")] == ["a1"]
+            assert store.count() == 3
+            store.close()
+        
+        logger.info("✅ Article store deduplicated and indexed articles")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Article store test failed: {e}")
+        return False
+
+def test_prefetch_scheduler():
+    """Test background prefetch scheduler and rate budget"""
+    logger.info("Testing prefetch scheduler...")
+    
+    try:
+        from backend.prefetch import PrefetchScheduler, RateBudget
+        
+        calls = []
+        warmed = []
+        cached = set()
+        budget = RateBudget(3, period=3600)
+        
+        def fetch(topic):
+            # Only a real HTTP request is charged, like the app's on_fetch hook
+            calls.append(topic)
+            if topic not in cached:
+                cached.add(topic)
+                budget.charge()
+            return topic
+        
+        jobs = [(f"topic:{t}", lambda t=t: fetch(t)) for t in ["Technology", "Business", "Space"]]
+        jobs.append(("broken", lambda: 1 / 0))
+        scheduler = PrefetchScheduler(
+            jobs, interval=3600, budget=budget,
+            on_result=lambda name, result: warmed.append(name)
+        )
+        
+        assert scheduler.run_once() == 3, "Budget should allow exactly 3 fetching jobs"
+        assert calls == ["Technology", "Business", "Space"]
+        assert warmed == ["topic:Technology", "topic:Business", "topic:Space"]
+        
+        # Budget exhausted: nothing runs until tokens refill
+        assert scheduler.run_once() == 0
+        scheduler.budget = budget = RateBudget(1, period=3600)
+        assert scheduler.run_once() == 4, "Jobs answered from the cache should not spend the budget"
+        assert scheduler.failed == 1, "Failing job should be counted, not raised"
+        assert calls[3] == "Technology", "Next cycle should resume after the skipped job"
+        assert scheduler.run_once() == 4 and budget.available()
+        
+        # A full hourly bucket plus a day of refill stays within the key's daily quota
+        from backend.prefetch import NEWS_DAILY_QUOTA, NEWS_REPLICAS, REQUEST_BUDGET_PER_HOUR
+        assert REQUEST_BUDGET_PER_HOUR * 25 * NEWS_REPLICAS <= max(NEWS_DAILY_QUOTA, 25 * NEWS_REPLICAS)
+        
+        scheduler.start()
+        scheduler.stop(timeout=2)
+        logger.info(f"✅ Prefetch completed={scheduler.completed} failed={scheduler.failed}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Prefetch scheduler test failed: {e}")
+        return False
+
+class HashEmbedder:
+    """Deterministic stand-in for NewsEmbedder so tests don't download a model"""
+    model_name = "test-hash"
+    dim = 32
+    batch_size = 4
+    
+    def encode(self, texts):
+        import hashlib
+        import numpy as np
+        vectors = np.stack([
+            np.frombuffer(hashlib.sha256(text.encode("utf-8")).digest(), dtype=np.uint8).astype("float32")
+            for text in texts
+        ])
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def test_embedder():
+    """Test incremental FAISS index build and reload"""
+    logger.info("Testing embedder...")
+    
+    try:
+        import tempfile
+        from backend.article_store import ArticleStore
+        from backend.embedder import FaissStore
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(os.path.join(tmp, "articles.db"))
+            store.ingest([
+                {"article_id": f"a{i}", "link": f"https://example.com/{i}", "title": f"Headline {i}",
+                 "description": f"Story number {i}", "pubDate": "2024-02-08 10:00:00"}
+                for i in range(10)
+            ])
+            index_path = os.path.join(tmp, "index.faiss")
+            mapping_path = os.path.join(tmp, "faiss_store.pkl")
+            
+            faiss_store = FaissStore(HashEmbedder(), index_path, mapping_path)
+            assert faiss_store.sync_from_store(store) == 10
+            assert faiss_store.sync_from_store(store) == 0, "Already indexed articles were re-embedded"
+            
+            # Restart: the saved index is loaded instead of re-embedding
+            reloaded = FaissStore(HashEmbedder(), index_path, mapping_path)
+            assert reloaded.size == 10
+            _, ids = reloaded.index.search(HashEmbedder().encode(["Headline 3. Story number 3"]), 1)
+            assert reloaded.get_article(int(ids[0][0]))["article_id"] == "a3"
+            
+            store.ingest([{"article_id": "a10", "link": "https://example.com/10", "title": "Late story"}])
+            assert reloaded.sync_from_store(store) == 1
+            assert reloaded.size == 11
+            store.close()
+        
+        logger.info("✅ FAISS index built, saved and reloaded")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Embedder test failed: {e}")
+        return False
+
+def test_rag_engine_local():
+    """Test FAISS retrieval, MMR re-ranking and context budgeting with a local LLM stub"""
+    logger.info("Testing local RAG engine...")
+    
+    try:
+        import tempfile
+        import threading
+        import numpy as np
+        from backend.embedder import FaissStore
+        from backend.genai_helper import ask_local_stub
+        from backend.rag_engine import RAGEngine, mmr_select
+        
+        # MMR prefers a diverse second pick over a near-duplicate of the first
+        query = np.array([1.0, 0.0], dtype="float32")
+        candidates = np.array([[0.99, 0.14], [0.98, 0.2], [0.6, 0.8]], dtype="float32")
+        candidates /= np.linalg.norm(candidates, axis=1, keepdims=True)
+        assert mmr_select(query, candidates, 2, 0.3) == [0, 2], "MMR did not diversify"
+        assert mmr_select(query, candidates, 2, 1.0) == [0, 1], "Pure relevance order broken"
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            faiss_store = FaissStore(HashEmbedder(), os.path.join(tmp, "index.faiss"), os.path.join(tmp, "store.pkl"))
+            faiss_store.add_articles([
+                {"article_id": f"a{i}", "title": f"Headline {i}", "description": "x" * 300} for i in range(20)
+            ])
+            rag_engine = RAGEngine(faiss_store=faiss_store, llm=ask_local_stub, top_k=3, context_chars=500)
+            
+            retrieved = rag_engine.retrieve("Headline 7. " + "x" * 300)
+            assert len(retrieved) == 3 and retrieved[0]["article_id"] == "a7", "Top hit should be exact match"
+            assert len(rag_engine.build_context(retrieved)) <= 500, "Context budget exceeded"
+            
+            # Queries stay safe while the refresh thread grows the index
+            writer = threading.Thread(target=lambda: [
+                faiss_store.add_articles([{"article_id": f"b{batch}-{i}", "title": f"Update {batch} {i}", "description": "y"}
+                                          for i in range(20)]) for batch in range(10)
+            ])
+            writer.start()
+            while writer.is_alive():
+                assert rag_engine.retrieve("Headline 7. " + "x" * 300)[0]["article_id"] == "a7"
+            writer.join()
+            assert faiss_store.size == 220
+            
+            answer = rag_engine.answer_question("What happened?", {"title": "RBI keeps repo rate", "summary": "Unchanged at 6.5%"})
+            assert "RBI keeps repo rate" in answer, f"Current news not used as context: {answer}"
+            assert len(rag_engine.answer_general_question("Headline 3")) > 0
+        
+        logger.info("✅ Local RAG engine answered from the FAISS index")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Local RAG engine test failed: {e}")
+        return False
+
+def test_import_budget():
+    """Test that backend modules import quickly and without loading heavy dependencies"""
+    logger.info("Testing import-time budget...")
+    
+    try:
+        import json
+        import subprocess
+        
+        budget_seconds = 0.5
+        heavy_modules = ["torch", "faiss", "sentence_transformers", "google.generativeai", "langchain", "numpy"]
+        script = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import backend.article_store, backend.audio_cache, backend.genai_helper, backend.news_client\n"
+            "import backend.prefetch, backend.rag_engine, backend.response_cache, backend.tts\n"
+            "import backend.article, backend.audio_server, backend.backfill, backend.bookmark_store, backend.dedup, backend.podcast, backend.rerun_cost, backend.text_normalizer\n"
+            "import backend.benchmarks, backend.logging_setup, backend.metrics, backend.quiz, backend.quiz_bank, components.news_player\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {heavy_modules!r} if m in sys.modules]}}))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=60,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        
+        assert not report["loaded"], f"Heavy modules loaded at import time: {report['loaded']}"
+        assert report["elapsed"] < budget_seconds, f"Backend import took {report['elapsed']:.3f}s (budget {budget_seconds}s)"
+        logger.info(f"✅ Backend modules imported in {report['elapsed'] * 1000:.0f} ms")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Import budget test failed: {e}")
+        return False
+
+def test_streaming_tts():
+    """Test sentence chunking and ordered parallel synthesis"""
+    logger.info("Testing streaming TTS...")
+    
+    try:
+        import time
+        from backend.tts import split_sentences, stream_speech
+        
+        text = "First sentence here. Second one! A third? " + "word " * 60 + "End."
+        chunks = split_sentences(text, max_chars=60)
+        assert all(len(chunk) <= 60 for chunk in chunks), "Chunk exceeds limit"
+        assert " ".join(chunks).split() == text.split(), "Chunking lost or reordered words"
+        
+        def fake_synthesize(chunk):
+            # Later chunks finish first to check that output order is preserved
+            time.sleep(0.05 if chunk.startswith("First") else 0.01)
+            return chunk.encode("utf-8")
+        
+        start = time.perf_counter()
+        stream = stream_speech(text, fake_synthesize, max_chars=60)
+        first = next(stream)
+        time_to_first = time.perf_counter() - start
+        rest = list(stream)
+        assert first.decode("utf-8") == chunks[0]
+        assert [piece.decode("utf-8") for piece in rest] == chunks[1:], "Chunks yielded out of order"
+        assert time_to_first < 0.05 * len(chunks), "Chunks were not synthesized in parallel"
+        
+        logger.info(f"✅ First of {len(chunks)} chunks ready in {time_to_first * 1000:.0f} ms")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Streaming TTS test failed: {e}")
+        return False
+
+def test_tts_engines():
+    """Test pluggable TTS engine interface and batch precompute"""
+    logger.info("Testing TTS engines...")
+    
+    try:
+        import shutil
+        import tempfile
+        from backend.audio_cache import AudioCache
+        from backend.tts import EspeakEngine, TTSEngine, get_tts_engine, precompute_audio
+        
+        class RecordingEngine(TTSEngine):
+            name = "recording"
+            def __init__(self):
+                self.calls = []
+            def synthesize(self, text, lang="en"):
+                self.calls.append(text)
+                return f"{lang}:{text}".encode("utf-8")
+        
+        class UnfinishedEngine(TTSEngine):
+            name = "unfinished"
+        
+        try:
+            UnfinishedEngine()
+            assert False, "Engine without synthesize() was instantiated"
+        except TypeError:
+            pass
+        
+        engine = RecordingEngine()
+        headlines = ["ISRO launches satellite", "RBI keeps repo rate", "Monsoon arrives early"]
+        assert engine.synthesize_batch(headlines) == [f"en:{h}".encode("utf-8") for h in headlines]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = AudioCache(cache_dir=cache_dir)
+            assert precompute_audio(headlines, engine, cache) == 3
+            assert precompute_audio(headlines, engine, cache) == 0, "Cached clips were re-rendered"
+            assert cache.get(cache.make_key(headlines[0], "en", engine.voice_id)) == b"en:ISRO launches satellite"
+        
+        assert get_tts_engine("gtts").voice_id == "com"
+        if shutil.which("espeak-ng") and (shutil.which("lame") or shutil.which("ffmpeg")):
+            clip = EspeakEngine().synthesize("Offline speech works.")
+            assert len(clip) > 0, "espeak produced no audio"
+            logger.info("✅ Offline espeak engine produced audio")
+        else:
+            logger.info("espeak-ng/lame not installed; skipping offline engine synthesis")
+        
+        logger.info("✅ TTS engine interface and batch precompute working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ TTS engine test failed: {e}")
+        return False
+
+def test_podcast_renderer():
+    """Test daily podcast rendering with chapters and versioned output"""
+    logger.info("Testing podcast renderer...")
+    
+    try:
+        import tempfile
+        from datetime import date
+        from backend.article_store import ArticleStore
+        from backend.audio_cache import AudioCache
+        from backend.podcast import PodcastRenderer, mp3_duration, strip_id3
+        from backend.tts import TTSEngine
+        
+        # MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples
+        frame = b"\xff\xfb\x90\x00" + bytes(413)
+        id3 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + bytes(5)
+        
+        class FrameEngine(TTSEngine):
+            name = "frames"
+            def __init__(self):
+                self.calls = []
+            def synthesize(self, text, lang="en"):
+                self.calls.append(text)
+                return id3 + frame * (len(text) // 10 + 1)
+        
+        assert strip_id3(id3 + frame) == frame
+        assert abs(mp3_duration(frame * 10) - 10 * 1152 / 44100) < 1e-9
+        
+        descriptions = ["Parliament passes the budget", "Monsoon reaches Kerala early", "ISRO launches a lunar probe"]
+        articles = [
+            {"article_id": f"a{i}", "link": f"https://example.com/{i}", "title": f"Headline {i}",
+             "description": description, "pubDate": "2024-02-08 09:00:00"}
+            for i, description in enumerate(descriptions)
+        ]
+        day = date(2024, 2, 8)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(os.path.join(tmp, "articles.db"))
+            store.ingest(articles)
+            engine = FrameEngine()
+            renderer = PodcastRenderer(store, engine, AudioCache(cache_dir=os.path.join(tmp, "cache")),
+                                       output_dir=os.path.join(tmp, "podcasts"))
+            
+            manifest = renderer.ensure(day)
+            titles = [c["title"] for c in manifest["chapters"]]
+            assert titles[0] == "Intro" and titles[-1] == "Outro"
+            assert sorted(titles[1:-1]) == ["Headline 0", "Headline 1", "Headline 2"]
+            assert engine.calls.count("Next.") == 1, "Repeated transition was synthesized twice"
+            with open(renderer.audio_path(manifest), "rb") as f:
+                audio = f.read()
+            assert len(audio) == manifest["bytes"] and not audio.startswith(b"ID3")
+            assert abs(mp3_duration(audio) - manifest["duration"]) < 0.01
+            starts = [c["start"] for c in manifest["chapters"]]
+            assert starts == sorted(starts) and audio[manifest["chapters"][1]["offset"]:].startswith(frame[:4])
+            
+            calls = len(engine.calls)
+            assert renderer.ensure(day)["version"] == manifest["version"]
+            assert len(engine.calls) == calls, "Existing podcast was re-rendered"
+            renderer.render(day)
+            assert len(engine.calls) == calls, "Cached segments were re-synthesized"
+            assert renderer.ensure(date(2024, 2, 9)) is None
+            
+            # Malayalam gets its own connective script; languages without one reuse the English podcast
+            renderer.ensure(day, "ml")
+            assert "അടുത്തത്." in engine.calls and "Next." not in engine.calls[calls:]
+            calls = len(engine.calls)
+            assert renderer.ensure(day, "hi")["lang"] == "hi" and len(engine.calls) == calls
+            store.close()
+        
+        logger.info("✅ Podcast renderer working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Podcast renderer test failed: {e}")
+        return False
+
+def test_audio_server():
+    """Test static audio endpoint with Range and ETag support, and chunked speech streams"""
+    logger.info("Testing audio server...")
+    
+    try:
+        import tempfile
+        import threading
+        import urllib.error
+        import urllib.request
+        from backend.audio_server import AudioServer, parse_range
+        
+        assert parse_range(None, 100) is None
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-", 100) == (90, 99)
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=50-500", 100) == (50, 99)
+        try:
+            parse_range("bytes=100-", 100)
+            assert False, "Out of range request was accepted"
+        except ValueError:
+            pass
+        
+        def fetch(url, headers=None):
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {})) as response:
+                    return response.status, response.headers, response.read()
+            except urllib.error.HTTPError as e:
+                return e.code, e.headers, b""
+        
+        key = "ab" * 32
+        clip = bytes(range(256)) * 4
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, f"{key}.mp3"), "wb") as f:
+                f.write(clip)
+            server = AudioServer(roots={"clips": tmp}, host="127.0.0.1", port=0).start()
+            try:
+                url = server.clip_url(key)
+                status, headers, body = fetch(url)
+                assert status == 200 and body == clip
+                assert headers["ETag"] == f'"{key}"' and "immutable" in headers["Cache-Control"]
+                assert headers["Accept-Ranges"] == "bytes"
+                
+                status, headers, body = fetch(url, {"Range": "bytes=100-199"})
+                assert status == 206 and body == clip[100:200]
+                assert headers["Content-Range"] == f"bytes 100-199/{len(clip)}"
+                
+                assert fetch(url, {"If-None-Match": f'"{key}"'})[0] == 304
+                assert fetch(url, {"Range": "bytes=5000-"})[0] == 416
+                assert fetch(url, {"Range": "bytes=0-9", "If-Range": '"old"'})[0] == 200
+                assert fetch(server.url_for("clips", "missing.mp3"))[0] == 404
+                assert fetch(f"{server.base_url}/clips/..%2Fsecret.mp3")[0] == 404
+                
+                # Streams send each piece as it is produced: the first arrives before the last exists
+                first_read = threading.Event()
+                
+                def pieces():
+                    yield b"first-chunk"
+                    assert first_read.wait(5), "second piece was requested before the first was read"
+                    yield b"second-chunk"
+                stream_url = server.register_stream("cd" * 32, pieces)
+                with urllib.request.urlopen(stream_url) as response:
+                    assert response.headers["Transfer-Encoding"] == "chunked"
+                    assert response.read(len(b"first-chunk")) == b"first-chunk"
+                    first_read.set()
+                    assert response.read() == b"second-chunk"
+                assert fetch(stream_url)[2] == b"first-chunksecond-chunk"
+                assert fetch(stream_url, {"If-None-Match": f'"{"cd" * 32}"'})[0] == 304
+                assert fetch(server.url_for("streams", f"{'ef' * 32}.mp3"))[0] == 404
+            finally:
+                server.stop()
+        
+        logger.info("✅ Audio server working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Audio server test failed: {e}")
+        return False
+
+def test_text_normalizer():
+    """Test single-pass speech normalization and batch mode"""
+    logger.info("Testing text normalizer...")
+    
+    try:
+        from backend.text_normalizer import benchmark, normalize_for_speech, normalize_many, sample_corpus
+        
+        assert normalize_for_speech("  Breaking:\tnews   #today  ") == "Breaking: news today"
+        assert normalize_for_speech("Govt. clears ₹1,20,000 crore plan") == \
+            "Government clears one hundred twenty thousand crore rupees plan"
+        assert normalize_for_speech("Repo rate at 6.5% on 2024-02-08") == \
+            "Repo rate at six point five percent on February eighth, twenty twenty-four"
+        assert normalize_for_speech("Dr. Rao vs. Rs. 300 on 08/02/2024") == \
+            "Doctor Rao versus three hundred rupees on February eighth, twenty twenty-four"
+        assert normalize_for_speech("He said no. Then COVID19 hit") == "He said no. Then COVID19 hit"
+        # Other languages keep digits and combining vowel signs, only symbols go
+        assert normalize_for_speech("മലയാളം വാർത്ത 2024 — ₹5!", "ml") == "മലയാളം വാർത്ത 2024 5!"
+        
+        texts = ["Sensex up 1,245 points", "", "Next.", "Next.", "a \x1e b"]
+        assert normalize_many(texts) == [normalize_for_speech(text) for text in texts]
+        assert normalize_many([]) == []
+        
+        results = benchmark(sample_corpus(50), repeat=1)
+        assert all(throughput > 0 for throughput in results.values())
+        logger.info(f"✅ Text normalizer working ({results['single_pass']:.1f} MB/s uncached)")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Text normalizer test failed: {e}")
+        return False
+
+def test_rerun_cost():
+    """Test per-run work counters used to verify cheap reruns"""
+    logger.info("Testing rerun cost counter...")
+    
+    try:
+        import threading
+        from backend.rerun_cost import begin_run, current_run, record
+        
+        run = begin_run()
+        assert current_run() is run
+        assert run.summary().endswith("(no network or TTS work)")
+        record("http_requests")
+        # Background threads (e.g. prefetch) are not attributed to the run...
+        worker = threading.Thread(target=lambda: record("http_requests"))
+        worker.start()
+        worker.join()
+        assert run.get("http_requests") == 1
+        # ...unless they were handed the run captured on the script thread
+        worker = threading.Thread(target=lambda: run.add("tts_chunks", 3))
+        worker.start()
+        worker.join()
+        counts = run.finish().as_dict()
+        assert counts["http_requests"] == 1 and counts["tts_chunks"] == 3 and counts["elapsed_ms"] >= 0
+        assert begin_run().get("http_requests") == 0, "New run did not reset counters"
+        
+        logger.info("✅ Rerun cost counter working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Rerun cost test failed: {e}")
+        return False
+
+def test_news_client():
+    """Test news client retries, keep-alive and circuit breaker against a stub newsdata.io"""
+    logger.info("Testing news client...")
+    
+    try:
+        import json
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import requests
+        from backend.news_client import CircuitBreaker, CircuitOpenError, NewsClient
+        
+        # Each path replays its status script, then keeps returning the last status
+        scripts = {"/flaky": [503, 429, 200], "/down": [500], "/bad-key": [401], "/garbage": [200],
+                   "/not-implemented": [501], "/ok": [200]}
+        hits = {}
+        client_ports = set()
+        
+        class StubNewsData(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                count = hits.get(path, 0)
+                hits[path] = count + 1
+                client_ports.add(self.client_address[1])
+                script = scripts[path]
+                status = script[min(count, len(script) - 1)]
+                body = json.dumps({"status": "success", "results": [{"title": "Stub headline"}]}).encode()
+                if path == "/garbage":
+                    body = b"<html>upstream error page</html>"
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubNewsData)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        delays = []
+        try:
+            client = NewsClient(timeout=(1, 2), max_retries=2, sleep=delays.append,
+                                breaker=CircuitBreaker(threshold=2, reset_timeout=0.2))
+            data = client.get_json(f"{base}/flaky", {"apikey": "test"})
+            assert data["results"][0]["title"] == "Stub headline"
+            assert hits["/flaky"] == 3 and client.retries == 2
+            assert delays[-1] == 0, "Retry-After was not honoured"
+            assert len(client_ports) == 1, "Connections were not kept alive"
+            
+            try:
+                client.get_json(f"{base}/bad-key")
+                assert False, "401 did not raise"
+            except requests.HTTPError:
+                assert hits["/bad-key"] == 1, "Client error was retried"
+            assert client.breaker.state == "closed"
+            
+            # A 5xx outside the retry list is not retried, but still trips the breaker
+            for _ in range(2):
+                try:
+                    client.get_json(f"{base}/not-implemented")
+                    assert False, "501 did not raise"
+                except requests.HTTPError:
+                    pass
+            assert hits["/not-implemented"] == 2 and client.breaker.state == "open"
+            time.sleep(0.25)
+            client.get_json(f"{base}/ok")
+            assert client.breaker.state == "closed"
+            
+            for _ in range(2):
+                try:
+                    client.get_json(f"{base}/down")
+                except requests.HTTPError:
+                    pass
+            assert hits["/down"] == 6 and client.breaker.state == "open"
+            try:
+                client.get_json(f"{base}/flaky")
+                assert False, "Open circuit let a request through"
+            except CircuitOpenError:
+                assert hits["/flaky"] == 3
+            
+            # A half-open trial failing in an unexpected way re-opens the circuit instead of wedging it
+            time.sleep(0.25)
+            try:
+                client.get_json(f"{base}/garbage")
+                assert False, "Undecodable body did not raise"
+            except ValueError:
+                assert client.breaker.state == "open"
+            
+            time.sleep(0.25)
+            assert client.breaker.state == "half_open"
+            client.get_json(f"{base}/flaky")
+            assert client.breaker.state == "closed"
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        logger.info("✅ News client retries, keep-alive and circuit breaker working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ News client test failed: {e}")
+        return False
+
+def test_backfill():
+    """Test nextPage-following backfill with checkpoint/resume and bounds"""
+    logger.info("Testing backfill...")
+    
+    try:
+        import json
+        import tempfile
+        import threading
+        from datetime import date
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qs, urlparse
+        import requests
+        from backend.article_store import ArticleStore
+        from backend.backfill import backfill
+        from backend.news_client import CircuitBreaker, NewsClient
+        
+        # 5 pages of 4 articles, newest first: page n holds 2024-02-(10 - n)
+        requested = []
+        fail_on = set()
+        
+        class StubNewsData(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_GET(self):
+                page = int(parse_qs(urlparse(self.path).query).get("page", ["0"])[0])
+                requested.append(page)
+                if page in fail_on:
+                    body, status = b"{}", 500
+                else:
+                    results = [{"article_id": f"p{page}-{i}", "link": f"https://example.com/{page}/{i}",
+                                "title": f"Story {page}-{i}", "pubDate": f"2024-02-{10 - page:02d} 0{i}:00:00"}
+                               for i in range(4)]
+                    body = json.dumps({"results": results, "nextPage": str(page + 1) if page < 4 else None}).encode()
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubNewsData)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/latest"
+        try:
+            client = NewsClient(max_retries=0, breaker=CircuitBreaker(threshold=100))
+            
+            # Pages are fetched lazily
+            next(client.iter_pages(url, {"apikey": "test"}))
+            assert requested == [0], "iter_pages fetched ahead"
+            
+            with tempfile.TemporaryDirectory() as tmp:
+                store = ArticleStore(os.path.join(tmp, "articles.db"))
+                
+                requested.clear()
+                fail_on.add(2)
+                try:
+                    backfill(store, url, {"apikey": "test"}, "latest", client=client)
+                    assert False, "Interrupted backfill did not raise"
+                except requests.HTTPError:
+                    pass
+                assert store.count() == 8 and store.get_cursor("backfill:latest") == "2"
+                
+                requested.clear()
+                fail_on.clear()
+                assert backfill(store, url, {"apikey": "test"}, "latest", client=client) == 12
+                assert requested == [2, 3, 4], f"Did not resume from checkpoint: {requested}"
+                assert store.count() == 20 and store.get_cursor("backfill:latest") is None
+                store.close()
+            
+            with tempfile.TemporaryDirectory() as tmp:
+                store = ArticleStore(os.path.join(tmp, "articles.db"))
+                requested.clear()
+                assert backfill(store, url, {"apikey": "test"}, "latest", until=date(2024, 2, 9), client=client) == 8
+                assert requested == [0, 1, 2], "Date bound did not stop paging"
+                requested.clear()
+                assert backfill(store, url, {"apikey": "test"}, "topic", max_articles=6, client=client) == 0
+                assert requested == [0, 1] and store.get_cursor("backfill:topic") is None
+                store.close()
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        logger.info("✅ Backfill paging, checkpointing and bounds working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Backfill test failed: {e}")
+        return False
+
+def test_compact_article():
+    """Test compact Article type and its memory savings over raw API dicts"""
+    logger.info("Testing compact articles...")
+    
+    try:
+        import json
+        import pickle
+        import tracemalloc
+        from backend.article import Article, compact_articles
+        
+        def raw(i):
+            return {
+                "article_id": f"id{i}", "title": f"Headline {i}", "link": f"https://example.com/{i}",
+                "description": "Short description of the story.", "source_id": "thehindu",
+                "pubDate": "2024-02-08 09:00:00", "category": ["politics", "top"], "language": "english",
+                "keywords": ["election", "parliament", "india"], "creator": ["Staff Reporter"],
+                "image_url": f"https://example.com/{i}.jpg", "video_url": None, "country": ["india"],
+                "content": "Full article body. " * 100, "source_priority": 1234, "ai_tag": "ONLY AVAILABLE IN PAID PLANS",
+            }
+        
+        article = Article.from_dict(raw(1))
+        assert article.get("title") == "Headline 1" and article["pubDate"] == "2024-02-08 09:00:00"
+        assert article.get("content", "n/a") == "n/a" and article.get("description", "x") == "Short description of the story."
+        assert ", ".join(Article(title="t").get("category") or ["General"]) == "General"
+        other = Article.from_dict(raw(2))
+        assert article.category is other.category, "Category tuples are not shared"
+        copy = pickle.loads(pickle.dumps(article))
+        assert copy == article and copy.category is article.category
+        assert compact_articles([article, raw(3)])[0] is article
+        
+        payloads = [json.dumps(raw(i)) for i in range(500)]
+        tracemalloc.start()
+        dicts = [json.loads(p) for p in payloads]
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        compact = compact_articles(dicts)
+        del dicts
+        compact_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert compact_bytes * 5 < dict_bytes, f"{compact_bytes} vs {dict_bytes} bytes"
+        logger.info(f"✅ Compact articles use {compact_bytes / dict_bytes:.0%} of raw dict memory")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Compact article test failed: {e}")
+        return False
+
+def test_bookmark_store():
+    """Test persistent, paginated bookmark store"""
+    logger.info("Testing bookmark store...")
+    
+    try:
+        import json
+        import tempfile
+        from backend.article import Article
+        from backend.bookmark_store import BookmarkStore, bookmark_key, page_count
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "bookmarks.db")
+            store = BookmarkStore(db_path)
+            articles = [Article(title=f"Story {i}", article_id=f"id{i}") for i in range(12)]
+            assert all(store.add("alice", a) for a in articles)
+            assert not store.add("alice", articles[0]), "Duplicate bookmark was added"
+            assert store.add("bob", {"title": "Untracked story", "url": "https://example.com/x"})
+            assert bookmark_key(Article(title="No id")) == bookmark_key({"title": "No id"})
+            
+            first = store.page("alice", 0, page_size=5)
+            assert [b["title"] for b in first] == ["Story 11", "Story 10", "Story 9", "Story 8", "Story 7"]
+            assert len(store.page("alice", 2, page_size=5)) == 2 and page_count(12, 5) == 3
+            assert store.remove("alice", "id11") and not store.contains("alice", "id11")
+            store.close()
+            
+            # Bookmarks survive a restart
+            store = BookmarkStore(db_path)
+            assert store.ids("alice") == {f"id{i}" for i in range(11)}
+            assert store.count("bob") == 1 and store.contains("bob", "https://example.com/x")
+            exported = json.loads(store.export_json("alice"))
+            assert [b["bookmark_id"] for b in exported] == [f"id{i}" for i in range(11)]
+            store.close()
+        
+        logger.info("✅ Bookmark store working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Bookmark store test failed: {e}")
+        return False
+
+def test_near_duplicates():
+    """Test near-duplicate clustering of articles across topics"""
+    logger.info("Testing near-duplicate detection...")
+    
+    try:
+        import random
+        import time
+        from backend.dedup import NearDuplicateIndex, dedupe
+        
+        moon = {"article_id": "t1", "title": "ISRO launches Chandrayaan-4 mission to the Moon",
+                "description": "The Indian Space Research Organisation launched its lunar mission on Tuesday from Sriharikota."}
+        moon_wire = {"article_id": "b7", "title": "ISRO launches Chandrayaan-4 mission to Moon",
+                     "description": "Indian Space Research Organisation launched its lunar mission on Tuesday from Sriharikota, officials said."}
+        markets = {"article_id": "b1", "title": "Sensex rises 500 points as IT stocks rally",
+                   "description": "Markets closed higher on Friday."}
+        markets_wire = {"article_id": "s3", "title": "Sensex jumps 500 points as IT stocks rally",
+                        "description": "Markets closed higher on Friday led by Infosys."}
+        monsoon = {"article_id": "e2", "title": "Monsoon arrives in Kerala three days early",
+                   "description": "IMD says rains will cover the state by the weekend."}
+        
+        assert dedupe([moon, markets, moon_wire, monsoon, markets_wire]) == [moon, markets, monsoon]
+        # Across batches (topics) through a shared index
+        seen = NearDuplicateIndex()
+        assert dedupe([moon, markets], index=seen) == [moon, markets]
+        assert dedupe([markets_wire, monsoon], index=seen) == [monsoon]
+        assert seen.cluster_size("b1") == 2 and len(seen) == 3
+        assert dedupe([moon, markets, monsoon], limit=2) == [moon, markets]
+        
+        # One pass stays linear: distinct stories only meet candidates sharing an LSH band
+        rng = random.Random(7)
+        vocab = [f"word{i}" for i in range(5000)]
+        batch = [{"article_id": str(i), "title": " ".join(rng.sample(vocab, 8)),
+                  "description": " ".join(rng.sample(vocab, 20))} for i in range(2000)]
+        start = time.perf_counter()
+        assert len(dedupe(batch + batch[:200])) == 2000
+        elapsed = time.perf_counter() - start
+        assert elapsed < 10, f"Deduplicating 2200 articles took {elapsed:.1f}s"
+        logger.info(f"✅ Near-duplicate detection working ({elapsed * 1000:.0f} ms for 2200 articles)")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Near-duplicate test failed: {e}")
+        return False
+
+def test_benchmark_suite():
+    """Test pipeline benchmark harness, JSON report and regression check"""
+    logger.info("Testing benchmark suite...")
+    
+    try:
+        import json
+        import tempfile
+        from backend.benchmarks import STAGES, compare, percentile, run_benchmarks, save_report
+        
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0 and percentile([1.0, 2.0, 3.0, 4.0], 99) == 4.0
+        report = run_benchmarks(rounds=2)
+        assert report["articles"] == 30 and set(report["stages"]) == set(STAGES)
+        for name, stats in report["stages"].items():
+            if "skipped" in stats:
+                logger.info(f"Stage {name} skipped: {stats['skipped']}")
+                continue
+            assert 0 < stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"], f"{name}: {stats}"
+            assert stats["throughput_per_s"] > 0 and stats["samples"] > 0
+        assert report["stages"]["fetch"]["samples"] == 6, "Expected 3 pages per round"
+        # The html stage renders every sample; memo hits are only reported under html_cached
+        from components.news_player import _audio_player_html
+        hits = _audio_player_html.cache_info().hits
+        html_only = run_benchmarks(stages=["html"], rounds=2)
+        assert _audio_player_html.cache_info().hits == hits and html_only["stages"]["html"]["samples"] == 60
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = save_report(report, os.path.join(tmp, "bench.json"))
+            with open(path) as f:
+                saved = json.load(f)
+        assert saved["stages"] == report["stages"]
+        faster = {"stages": {name: dict(stats, p95_ms=stats["p95_ms"] / 10)
+                             for name, stats in report["stages"].items() if "p95_ms" in stats}}
+        assert not compare(report, report)
+        assert compare(faster, report), "A 10x slower p95 was not reported as a regression"
+        logger.info("✅ Benchmark suite working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Benchmark suite test failed: {e}")
+        return False
+
+def test_metrics():
+    """Test stage timing, Prometheus export and the /metrics endpoint"""
+    logger.info("Testing metrics...")
+    
+    try:
+        import tempfile
+        import time
+        import requests
+        from backend.audio_server import AudioServer
+        from backend.metrics import MetricsRegistry, MetricsServer, timed, STAGE_ERRORS, STAGE_LATENCY, stage_summary
+        
+        @timed("test_stage")
+        def work(fail=False):
+            if fail:
+                raise ValueError("boom")
+            return 42
+        
+        before = STAGE_LATENCY.count(stage="test_stage")
+        assert work() == 42 and work.__name__ == "work"
+        try:
+            work(fail=True)
+        except ValueError:
+            pass
+        with timed("test_stage"):
+            time.sleep(0.02)
+        assert STAGE_LATENCY.count(stage="test_stage") == before + 3
+        assert STAGE_ERRORS.get(stage="test_stage") >= 1
+        row = next(r for r in stage_summary() if r["stage"] == "test_stage")
+        assert row["calls"] >= 3 and row["p95_ms"] >= row["p50_ms"]
+        
+        registry = MetricsRegistry()
+        latency = registry.histogram("demo_latency_seconds", "Demo", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            latency.observe(value, stage='a "quoted" stage')
+        assert abs(latency.quantile(0.5, stage='a "quoted" stage') - 0.1) < 1e-9
+        registry.register_cache("audio", lambda: {"memory_hits": 3, "disk_hits": 1, "misses": 4, "hit_ratio": 0.5})
+        text = registry.render()
+        assert '# TYPE demo_latency_seconds histogram' in text
+        assert 'demo_latency_seconds_bucket{stage="a \\"quoted\\" stage",le="0.1"} 2' in text
+        assert 'demo_latency_seconds_bucket{stage="a \\"quoted\\" stage",le="+Inf"} 4' in text
+        assert 'echonews_cache_requests_total{cache="audio",result="misses"} 4' in text
+        assert 'echonews_cache_hit_ratio{cache="audio"} 0.500000' in text
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            # The metrics listener runs on its own, without the audio server
+            server = MetricsServer(registry, host="127.0.0.1", port=0).start()
+            try:
+                response = requests.get(server.url, timeout=5)
+                assert response.status_code == 200 and response.text == registry.render()
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert requests.get(f"http://127.0.0.1:{server.port}/other", timeout=5).status_code == 404
+            finally:
+                server.stop()
+            server = AudioServer(roots={"clips": tmp}, host="127.0.0.1", port=0, base_url=None).start()
+            try:
+                assert requests.get(f"{server.base_url}/metrics", timeout=5).status_code == 404
+            finally:
+                server.stop()
+        
+        logger.info("✅ Metrics working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Metrics test failed: {e}")
+        return False
+
+def test_logging_setup():
+    """Test queue-backed JSON logging with rotation and sampling"""
+    logger.info("Testing logging setup...")
+    
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    
+    def restore_test_logging():
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+    
+    try:
+        import json
+        import tempfile
+        import time
+        from backend.logging_setup import configure_logging, shutdown_logging
+        
+        chatty = logging.getLogger("echonews.test")
+        with tempfile.TemporaryDirectory() as tmp:
+            # Sampling, structured fields and tracebacks
+            log_path = os.path.join(tmp, "echonews.log")
+            listener = configure_logging(log_path, level="INFO", burst=3, window=0.2, console=False)
+            assert configure_logging(log_path) is listener, "Second call installed new handlers"
+            def create_player(i):
+                # One call site, like NewsPlayer logging once per article
+                chatty.info(f"Created audio player for news: 'Story {i}'")
+            
+            started = time.perf_counter()
+            for i in range(1000):
+                create_player(i)
+            per_call_us = (time.perf_counter() - started) / 1000 * 1e6
+            chatty.warning("Slow newsdata.io response", extra={"stage": "newsdata_http", "seconds": 4.2})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                chatty.exception("Fetch failed")
+            time.sleep(0.25)
+            create_player(1000)
+            shutdown_logging()
+            with open(log_path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+            players = [r for r in records if r["msg"].startswith("Created audio player")]
+            assert [r["msg"].split("'")[1] for r in players] == ["Story 0", "Story 1", "Story 2", "Story 1000"]
+            assert players[-1]["suppressed"] == 997 and "suppressed" not in players[0]
+            slow = next(r for r in records if r["msg"] == "Slow newsdata.io response")
+            assert slow["level"] == "WARNING" and slow["stage"] == "newsdata_http" and slow["seconds"] == 4.2
+            failed = next(r for r in records if r["msg"] == "Fetch failed")
+            assert "ValueError: boom" in failed["exc"] and failed["logger"] == "echonews.test"
+            
+            # Size-based rotation keeps the log bounded
+            rotating_path = os.path.join(tmp, "rotating.log")
+            configure_logging(rotating_path, max_bytes=4096, backups=2, burst=0, console=False)
+            for i in range(300):
+                chatty.warning("Padding %d %s", i, "x" * 40)
+            shutdown_logging()
+            kept = sorted(name for name in os.listdir(tmp) if name.startswith("rotating.log"))
+            assert kept == ["rotating.log", "rotating.log.1", "rotating.log.2"], kept
+            assert all(os.path.getsize(os.path.join(tmp, name)) <= 4096 for name in kept)
+            with open(rotating_path, encoding="utf-8") as f:
+                assert json.loads(f.readlines()[-1])["msg"] == "Padding 299 " + "x" * 40
+        
+        restore_test_logging()
+        logger.info(f"✅ Logging setup working ({per_call_us:.1f} µs per sampled INFO call)")
+        return True
+        
+    except Exception as e:
+        restore_test_logging()
+        logger.error(f"❌ Logging setup test failed: {e}")
+        return False
+
+def test_quiz_generation():
+    """Test seeded, corpus-size independent quiz generation"""
+    logger.info("Testing quiz generation...")
+    
+    try:
+        import time
+        from datetime import date
+        from backend.quiz import build_questions, daily_seed, extract_entity_simple, generate_quiz_from_articles
+        
+        assert extract_entity_simple("ISRO launches Chandrayaan on Monday") == "Chandrayaan"
+        assert extract_entity_simple("budget for 2025 passed") == "2025"
+        assert extract_entity_simple("no entity here") is None
+        
+        articles = [
+            {"article_id": "a1", "title": "Parliament passes the budget", "description": "Sitharaman presented it in Delhi."},
+            {"article_id": "a2", "title": "   ", "description": "no capitalized words here"},
+            {"article_id": "a3", "title": "Monsoon reaches Kerala early", "description": "Rains hit Kochi on Friday."},
+            {"article_id": "a4", "title": "Sensex closes higher", "description": "Mumbai markets gained."},
+        ]
+        quiz = build_questions(articles, num_questions=3, seed=daily_seed(date(2025, 6, 1)))
+        assert [q["article_id"] for q in quiz] == ["a1", "a2", "a3"]
+        assert quiz[1]["answer"] == "News"  # Blank titles no longer crash the topic question
+        for q in quiz:
+            assert q["answer"] in q["options"] and len(set(q["options"])) == len(q["options"])
+        assert build_questions(articles, 3, seed=daily_seed(date(2025, 6, 1))) == quiz
+        assert daily_seed(date(2025, 6, 1)) != daily_seed(date(2025, 6, 2)) != daily_seed(date(2025, 6, 2), "sports")
+        questions, options, answers = generate_quiz_from_articles(articles, seed=1)
+        assert len(questions) == len(options) == len(answers) == 3
+        
+        # Cost depends on the questions asked, not on the corpus size
+        corpus = [{"article_id": str(i), "title": f"Story{i} headline", "description": f"Story{i} happened in City{i % 97}."}
+                  for i in range(5000)]
+        start = time.perf_counter()
+        quiz = build_questions(corpus, num_questions=20, seed=42)
+        elapsed = time.perf_counter() - start
+        assert len(quiz) == 20 and all(len(q["options"]) == 4 for q in quiz)
+        assert elapsed < 0.05, f"20 questions from 5000 articles took {elapsed * 1000:.1f} ms"
+        logger.info(f"✅ Quiz generation working ({elapsed * 1000:.2f} ms for 20 questions over 5000 articles)")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Quiz generation test failed: {e}")
+        return False
+
+def test_quiz_bank():
+    """Test the per-day quiz bank built from the article store"""
+    logger.info("Testing quiz bank...")
+    
+    try:
+        import tempfile
+        from datetime import date
+        from backend.article_store import ArticleStore
+        from backend.quiz_bank import QuizBank, build_daily_bank
+        
+        day = date(2025, 6, 1)
+        stories = [
+            ("Parliament passes the budget", "Sitharaman presented it in Delhi.", "politics"),
+            ("Monsoon reaches Kerala early", "Rains hit Kochi on Friday.", "environment"),
+            ("Sensex closes higher", "Mumbai markets gained on bank stocks.", "business"),
+            ("ISRO tests reusable launcher", "The vehicle landed in Chitradurga.", "science"),
+            ("India wins the test series", "Bumrah took five wickets in Chennai.", "sports"),
+        ]
+        articles = [{"article_id": f"q{i}", "link": f"https://example.com/{i}", "title": title, "description": desc,
+                     "category": [category], "pubDate": f"2025-06-01 {10 + i:02d}:00:00"}
+                    for i, (title, desc, category) in enumerate(stories)]
+        # A wire copy of the first story must not become a second question
+        articles.append(dict(articles[0], article_id="q9", link="https://example.com/9", pubDate="2025-06-01 09:00:00"))
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(os.path.join(tmp, "articles.db"))
+            store.ingest(articles)
+            bank = QuizBank(os.path.join(tmp, "quiz_bank.db"))
+            assert bank.ensure(store, date(2025, 6, 2)) == [] and not bank.is_built(date(2025, 6, 2))
+            
+            assert build_daily_bank(store, bank, day, [None, "sports"]) == {"": 5, "sports": 1}
+            assert bank.topics(day) == ["", "sports"] and bank.count(day) == 5
+            quiz = bank.questions(day, page_size=10)
+            assert sorted(q["article_id"] for q in quiz) == ["q0", "q1", "q2", "q3", "q4"]
+            for q in quiz:
+                assert q["answer"] in q["options"] and q["question"]
+            assert bank.questions(day, page=1, page_size=3) == quiz[3:]
+            assert bank.questions(day, "Sports")[0]["article_id"] == "q4"
+            
+            # Rebuilding gives the same quiz; a reopened bank serves it without the store
+            build_daily_bank(store, bank, day)
+            assert bank.questions(day, page_size=10) == quiz
+            bank.close()
+            reopened = QuizBank(os.path.join(tmp, "quiz_bank.db"))
+            assert reopened.ensure(store, day) == quiz[:5] and reopened.built_from(day) == 6
+            
+            # Articles ingested later in the day leave the served quiz alone until the nightly rebuild
+            store.ingest([{"article_id": "q10", "title": "Chess Olympiad opens in Chennai",
+                           "description": "Gukesh leads the Indian team.", "category": ["sports"],
+                           "pubDate": "2025-06-01 20:00:00"}])
+            assert [q["article_id"] for q in reopened.ensure(store, day, "sports")] == ["q4"]
+            assert reopened.built_from(day, "sports") == 1
+            build_daily_bank(store, reopened, day, ["sports"])
+            refreshed = reopened.ensure(store, day, "sports")
+            assert [q["article_id"] for q in refreshed] == ["q10", "q4"] and reopened.built_from(day, "sports") == 2
+            reopened.close()
+            store.close()
+        
+        logger.info("✅ Quiz bank working")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Quiz bank test failed: {e}")
+        return False
+
+def test_player_templates():
+    """Test template-based NewsPlayer rendering and its memoization"""
+    logger.info("Testing player templates...")
+    
+    try:
+        import time
+        from components.news_player import NewsPlayer
+        
+        player = NewsPlayer(audio_base_url="http://localhost:8502")
+        quiz = {"questions": [{"question": f"Question {i}?", "options": [f"Option {i}.{j}" for j in range(4)],
+                               "correct_answer": i % 4, "explanation": f"Because {i}"} for i in range(50)]}
+        start = time.perf_counter()
+        html = player.create_quiz_player(quiz)
+        elapsed = time.perf_counter() - start
+        assert html.count('type="radio"') == 200 and html.count("<script>") == 1
+        assert 'onclick="checkAnswer(49, 1)"' in html and "D) Option 49.3" in html
+        # The same content is served from the render cache, not re-rendered
+        assert player.create_quiz_player({"questions": [dict(q) for q in quiz["questions"]]}) is html
+        assert elapsed < 0.05, f"Rendering a 50-question quiz took {elapsed * 1000:.1f} ms"
+        
+        cards = [player.create_audio_player({"title": f"Story {i}", "summary": "Summary", "source": "PTI",
+                                             "audio_key": f"{i:040x}"}) for i in range(100)]
+        assert len(set(cards)) == 100 and all("/clips/" in card for card in cards)
+        assert player.create_voice_interaction_ui() is player.create_voice_interaction_ui()
+        
+        podcast = player.create_daily_podcast_player({"audio_url": "p.mp3", "chapters": [{"start": 75.5, "title": "Two"}]})
+        assert "seekPodcast(75.5)" in podcast and ">1:15</a> Two" in podcast
+        assert "Error creating quiz player" in player.create_quiz_player({"questions": [None]})
+        logger.info(f"✅ Player templates working ({elapsed * 1000:.2f} ms for a 50-question quiz)")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Player templates test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     logger.info("🚀 Starting EchoNews application tests...")
@@ -255,7 +1567,32 @@ def main():
         ("Summarizer Test", test_summarizer),
         ("Fact Checker Test", test_fact_checker),
         ("Audio Manager Test", test_audio_manager),
-        ("News Player Test", test_news_player)
+        ("News Player Test", test_news_player),
+        ("Audio Cache Test", test_audio_cache),
+        ("Concurrent Fetch Test", test_concurrent_fetch),
+        ("Response Cache Test", test_response_cache),
+        ("Article Store Test", test_article_store),
+        ("Prefetch Scheduler Test", test_prefetch_scheduler),
+        ("Embedder Test", test_embedder),
+        ("Local RAG Engine Test", test_rag_engine_local),
+        ("Import Budget Test", test_import_budget),
+        ("Streaming TTS Test", test_streaming_tts),
+        ("TTS Engines Test", test_tts_engines),
+        ("Podcast Renderer Test", test_podcast_renderer),
+        ("Audio Server Test", test_audio_server),
+        ("Text Normalizer Test", test_text_normalizer),
+        ("Rerun Cost Test", test_rerun_cost),
+        ("News Client Test", test_news_client),
+        ("Backfill Test", test_backfill),
+        ("Compact Article Test", test_compact_article),
+        ("Bookmark Store Test", test_bookmark_store),
+        ("Near Duplicate Test", test_near_duplicates),
+        ("Benchmark Suite Test", test_benchmark_suite),
+        ("Metrics Test", test_metrics),
+        ("Logging Setup Test", test_logging_setup),
+        ("Quiz Generation Test", test_quiz_generation),
+        ("Quiz Bank Test", test_quiz_bank),
+        ("Player Templates Test", test_player_templates)
     ]
     
     passed = 0